@@ -0,0 +1,25 @@
+!     -*- f90 -*-
+!     This file is autogenerated with f2py (version:1.23.5)
+!     It contains Fortran 90 wrappers to fortran functions.
+
+      
+      subroutine f2pyinitconf_cpwt(f2pysetupfunc)
+      use conf_cpwt, only : pi
+      use conf_cpwt, only : na
+      use conf_cpwt, only : k0
+      external f2pysetupfunc
+      call f2pysetupfunc(pi,na,k0)
+      end subroutine f2pyinitconf_cpwt
+
+      
+      subroutine f2pyinitcpwt(f2pysetupfunc)
+      use cpwt, only : wlet_transform
+      use cpwt, only : wlet_scalogram
+      use cpwt, only : wlet_xscalogram
+      use cpwt, only : wlet_admit_coh
+      external f2pysetupfunc
+      call f2pysetupfunc(wlet_transform,wlet_scalogram,wlet_xscalogram,w&
+     &let_admit_coh)
+      end subroutine f2pyinitcpwt
+
+
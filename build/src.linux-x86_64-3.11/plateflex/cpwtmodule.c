@@ -0,0 +1,3018 @@
+/* File: cpwtmodule.c
+ * This file is auto-generated with f2py (version:1.23.5).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Thu Oct 15 22:08:37 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+
+/* Unconditionally included */
+#include <Python.h>
+#include <numpy/npy_os.h>
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *cpwt_error;
+static PyObject *cpwt_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+typedef struct {float r,i;} complex_float;
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(cpwt_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int
+double_from_pyobj(double* v, PyObject *obj, const char *errmess)
+{
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+        *v = PyFloat_AsDouble(obj);
+        return !(*v == -1.0 && PyErr_Occurred());
+    }
+
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+        *v = PyFloat_AsDouble(tmp);
+        Py_DECREF(tmp);
+        return !(*v == -1.0 && PyErr_Occurred());
+    }
+
+    if (PyComplex_Check(obj)) {
+        PyErr_Clear();
+        tmp = PyObject_GetAttrString(obj,"real");
+    }
+    else if (PyBytes_Check(obj) || PyUnicode_Check(obj)) {
+        /*pass*/;
+    }
+    else if (PySequence_Check(obj)) {
+        PyErr_Clear();
+        tmp = PySequence_GetItem(obj, 0);
+    }
+
+    if (tmp) {
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = cpwt_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int
+int_from_pyobj(int* v, PyObject *obj, const char *errmess)
+{
+    PyObject* tmp = NULL;
+
+    if (PyLong_Check(obj)) {
+        *v = Npy__PyLong_AsInt(obj);
+        return !(*v == -1 && PyErr_Occurred());
+    }
+
+    tmp = PyNumber_Long(obj);
+    if (tmp) {
+        *v = Npy__PyLong_AsInt(tmp);
+        Py_DECREF(tmp);
+        return !(*v == -1 && PyErr_Occurred());
+    }
+
+    if (PyComplex_Check(obj)) {
+        PyErr_Clear();
+        tmp = PyObject_GetAttrString(obj,"real");
+    }
+    else if (PyBytes_Check(obj) || PyUnicode_Check(obj)) {
+        /*pass*/;
+    }
+    else if (PySequence_Check(obj)) {
+        PyErr_Clear();
+        tmp = PySequence_GetItem(obj, 0);
+    }
+
+    if (tmp) {
+        if (int_from_pyobj(v, tmp, errmess)) {
+            Py_DECREF(tmp);
+            return 1;
+        }
+        Py_DECREF(tmp);
+    }
+
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err == NULL) {
+            err = cpwt_error;
+        }
+        PyErr_SetString(err, errmess);
+    }
+    return 0;
+}
+
+static int
+float_from_pyobj(float* v, PyObject *obj, const char *errmess)
+{
+    double d=0.0;
+    if (double_from_pyobj(&d,obj,errmess)) {
+        *v = (float)d;
+        return 1;
+    }
+    return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC(npow2,NPOW2)(int*,int*);
+extern void F_FUNC(defk,DEFK)(int*,int*,float*,float*,float*,float*);
+extern void F_FUNC_US(wave_function,WAVE_FUNCTION)(int*,int*,float*,float*,float*,float*,float*,complex_float*);
+extern void F_FUNC_US(jackknife_1d_sgram,JACKKNIFE_1D_SGRAM)(float*,int*,int*,int*,int*,float*);
+extern void F_FUNC_US(jackknife_1d_admit,JACKKNIFE_1D_ADMIT)(float*,float*,int*,int*,int*,int*,float*);
+extern void F_FUNC_US(jackknife_1d_corr,JACKKNIFE_1D_CORR)(float*,float*,float*,int*,int*,int*,int*,float*);
+extern void F_FUNC_US(jackknife_admit_coh,JACKKNIFE_ADMIT_COH)(complex_float*,float*,float*,int*,int*,int*,int*,float*,float*);
+extern void F_FUNC_US(mean_std,MEAN_STD)(float*,int*,float*,float*);
+extern void F_FUNC_US(taper_data,TAPER_DATA)(float*,int*,int*,int*);
+extern void F_FUNC_US(mirror_data,MIRROR_DATA)(float*,int*,int*,int*,int*);
+extern void F_FUNC(cfftswap,CFFTSWAP)(complex_float*,int*,int*);
+extern void F_FUNC(fftswap,FFTSWAP)(float*,int*,int*);
+extern void F_FUNC(cfftshift,CFFTSHIFT)(complex_float*,int*,int*);
+extern void F_FUNC(fourn,FOURN)(float*,int*,int*,int*);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/*********************************** npow2 ***********************************/
+static char doc_f2py_rout_cpwt_npow2[] = "\
+npow2(n,n2)\n\nWrapper for ``npow2``.\
+\n\nParameters\n----------\n"
+"n : input int\n"
+"n2 : input int";
+/* extern void F_FUNC(npow2,NPOW2)(int*,int*); */
+static PyObject *f2py_rout_cpwt_npow2(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int n = 0;
+    PyObject *n_capi = Py_None;
+    int n2 = 0;
+    PyObject *n2_capi = Py_None;
+    static char *capi_kwlist[] = {"n","n2",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OO|:cpwt.npow2",\
+        capi_kwlist,&n_capi,&n2_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable n */
+        f2py_success = int_from_pyobj(&n,n_capi,"cpwt.npow2() 1st argument (n) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable n2 */
+        f2py_success = int_from_pyobj(&n2,n2_capi,"cpwt.npow2() 2nd argument (n2) can't be converted to int");
+    if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&n,&n2);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    } /*if (f2py_success) of n2*/
+    /* End of cleaning variable n2 */
+    } /*if (f2py_success) of n*/
+    /* End of cleaning variable n */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************** end of npow2 ********************************/
+
+/************************************ defk ************************************/
+static char doc_f2py_rout_cpwt_defk[] = "\
+defk(dx,dy,kx,ky,[nx,ny])\n\nWrapper for ``defk``.\
+\n\nParameters\n----------\n"
+"dx : input float\n"
+"dy : input float\n"
+"kx : input rank-1 array('f') with bounds (nx)\n"
+"ky : input rank-1 array('f') with bounds (ny)\n"
+"\nOther Parameters\n----------------\n"
+"nx : input int, optional\n    Default: shape(kx, 0)\n"
+"ny : input int, optional\n    Default: shape(ky, 0)";
+/* extern void F_FUNC(defk,DEFK)(int*,int*,float*,float*,float*,float*); */
+static PyObject *f2py_rout_cpwt_defk(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,float*,float*,float*,float*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int nx = 0;
+    PyObject *nx_capi = Py_None;
+    int ny = 0;
+    PyObject *ny_capi = Py_None;
+    float dx = 0;
+    PyObject *dx_capi = Py_None;
+    float dy = 0;
+    PyObject *dy_capi = Py_None;
+    float *kx = NULL;
+    npy_intp kx_Dims[1] = {-1};
+    const int kx_Rank = 1;
+    PyArrayObject *capi_kx_tmp = NULL;
+    int capi_kx_intent = 0;
+    PyObject *kx_capi = Py_None;
+    float *ky = NULL;
+    npy_intp ky_Dims[1] = {-1};
+    const int ky_Rank = 1;
+    PyArrayObject *capi_ky_tmp = NULL;
+    int capi_ky_intent = 0;
+    PyObject *ky_capi = Py_None;
+    static char *capi_kwlist[] = {"dx","dy","kx","ky","nx","ny",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOO|OO:cpwt.defk",\
+        capi_kwlist,&dx_capi,&dy_capi,&kx_capi,&ky_capi,&nx_capi,&ny_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable kx */
+    ;
+    capi_kx_intent |= F2PY_INTENT_IN;
+    capi_kx_tmp = array_from_pyobj(NPY_FLOAT,kx_Dims,kx_Rank,capi_kx_intent,kx_capi);
+    if (capi_kx_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 3rd argument `kx' of cpwt.defk to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        kx = (float *)(PyArray_DATA(capi_kx_tmp));
+
+    /* Processing variable ky */
+    ;
+    capi_ky_intent |= F2PY_INTENT_IN;
+    capi_ky_tmp = array_from_pyobj(NPY_FLOAT,ky_Dims,ky_Rank,capi_ky_intent,ky_capi);
+    if (capi_ky_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 4th argument `ky' of cpwt.defk to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        ky = (float *)(PyArray_DATA(capi_ky_tmp));
+
+    /* Processing variable dx */
+        f2py_success = float_from_pyobj(&dx,dx_capi,"cpwt.defk() 1st argument (dx) can't be converted to float");
+    if (f2py_success) {
+    /* Processing variable dy */
+        f2py_success = float_from_pyobj(&dy,dy_capi,"cpwt.defk() 2nd argument (dy) can't be converted to float");
+    if (f2py_success) {
+    /* Processing variable nx */
+    if (nx_capi == Py_None) nx = shape(kx, 0); else
+        f2py_success = int_from_pyobj(&nx,nx_capi,"cpwt.defk() 1st keyword (nx) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(kx, 0) == nx,"shape(kx, 0) == nx","1st keyword nx","defk:nx=%d",nx) {
+    /* Processing variable ny */
+    if (ny_capi == Py_None) ny = shape(ky, 0); else
+        f2py_success = int_from_pyobj(&ny,ny_capi,"cpwt.defk() 2nd keyword (ny) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(ky, 0) == ny,"shape(ky, 0) == ny","2nd keyword ny","defk:ny=%d",ny) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&nx,&ny,&dx,&dy,kx,ky);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    } /*CHECKSCALAR(shape(ky, 0) == ny)*/
+    } /*if (f2py_success) of ny*/
+    /* End of cleaning variable ny */
+    } /*CHECKSCALAR(shape(kx, 0) == nx)*/
+    } /*if (f2py_success) of nx*/
+    /* End of cleaning variable nx */
+    } /*if (f2py_success) of dy*/
+    /* End of cleaning variable dy */
+    } /*if (f2py_success) of dx*/
+    /* End of cleaning variable dx */
+    if((PyObject *)capi_ky_tmp!=ky_capi) {
+        Py_XDECREF(capi_ky_tmp); }
+    }  /*if (capi_ky_tmp == NULL) ... else of ky*/
+    /* End of cleaning variable ky */
+    if((PyObject *)capi_kx_tmp!=kx_capi) {
+        Py_XDECREF(capi_kx_tmp); }
+    }  /*if (capi_kx_tmp == NULL) ... else of kx*/
+    /* End of cleaning variable kx */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************** end of defk ********************************/
+
+/******************************* wave_function *******************************/
+static char doc_f2py_rout_cpwt_wave_function[] = "\
+wave_function(kx,ky,k0,s,a,daughter,[nx,ny])\n\nWrapper for ``wave_function``.\
+\n\nParameters\n----------\n"
+"kx : input rank-1 array('f') with bounds (nx)\n"
+"ky : input rank-1 array('f') with bounds (ny)\n"
+"k0 : input float\n"
+"s : input float\n"
+"a : input float\n"
+"daughter : input rank-2 array('F') with bounds (nx,ny)\n"
+"\nOther Parameters\n----------------\n"
+"nx : input int, optional\n    Default: shape(kx, 0)\n"
+"ny : input int, optional\n    Default: shape(ky, 0)";
+/* extern void F_FUNC_US(wave_function,WAVE_FUNCTION)(int*,int*,float*,float*,float*,float*,float*,complex_float*); */
+static PyObject *f2py_rout_cpwt_wave_function(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,float*,float*,float*,float*,float*,complex_float*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int nx = 0;
+    PyObject *nx_capi = Py_None;
+    int ny = 0;
+    PyObject *ny_capi = Py_None;
+    float *kx = NULL;
+    npy_intp kx_Dims[1] = {-1};
+    const int kx_Rank = 1;
+    PyArrayObject *capi_kx_tmp = NULL;
+    int capi_kx_intent = 0;
+    PyObject *kx_capi = Py_None;
+    float *ky = NULL;
+    npy_intp ky_Dims[1] = {-1};
+    const int ky_Rank = 1;
+    PyArrayObject *capi_ky_tmp = NULL;
+    int capi_ky_intent = 0;
+    PyObject *ky_capi = Py_None;
+    float k0 = 0;
+    PyObject *k0_capi = Py_None;
+    float s = 0;
+    PyObject *s_capi = Py_None;
+    float a = 0;
+    PyObject *a_capi = Py_None;
+    complex_float *daughter = NULL;
+    npy_intp daughter_Dims[2] = {-1, -1};
+    const int daughter_Rank = 2;
+    PyArrayObject *capi_daughter_tmp = NULL;
+    int capi_daughter_intent = 0;
+    PyObject *daughter_capi = Py_None;
+    static char *capi_kwlist[] = {"kx","ky","k0","s","a","daughter","nx","ny",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOO|OO:cpwt.wave_function",\
+        capi_kwlist,&kx_capi,&ky_capi,&k0_capi,&s_capi,&a_capi,&daughter_capi,&nx_capi,&ny_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable k0 */
+        f2py_success = float_from_pyobj(&k0,k0_capi,"cpwt.wave_function() 3rd argument (k0) can't be converted to float");
+    if (f2py_success) {
+    /* Processing variable s */
+        f2py_success = float_from_pyobj(&s,s_capi,"cpwt.wave_function() 4th argument (s) can't be converted to float");
+    if (f2py_success) {
+    /* Processing variable a */
+        f2py_success = float_from_pyobj(&a,a_capi,"cpwt.wave_function() 5th argument (a) can't be converted to float");
+    if (f2py_success) {
+    /* Processing variable kx */
+    ;
+    capi_kx_intent |= F2PY_INTENT_IN;
+    capi_kx_tmp = array_from_pyobj(NPY_FLOAT,kx_Dims,kx_Rank,capi_kx_intent,kx_capi);
+    if (capi_kx_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `kx' of cpwt.wave_function to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        kx = (float *)(PyArray_DATA(capi_kx_tmp));
+
+    /* Processing variable ky */
+    ;
+    capi_ky_intent |= F2PY_INTENT_IN;
+    capi_ky_tmp = array_from_pyobj(NPY_FLOAT,ky_Dims,ky_Rank,capi_ky_intent,ky_capi);
+    if (capi_ky_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 2nd argument `ky' of cpwt.wave_function to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        ky = (float *)(PyArray_DATA(capi_ky_tmp));
+
+    /* Processing variable nx */
+    if (nx_capi == Py_None) nx = shape(kx, 0); else
+        f2py_success = int_from_pyobj(&nx,nx_capi,"cpwt.wave_function() 1st keyword (nx) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(kx, 0) == nx,"shape(kx, 0) == nx","1st keyword nx","wave_function:nx=%d",nx) {
+    /* Processing variable ny */
+    if (ny_capi == Py_None) ny = shape(ky, 0); else
+        f2py_success = int_from_pyobj(&ny,ny_capi,"cpwt.wave_function() 2nd keyword (ny) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(ky, 0) == ny,"shape(ky, 0) == ny","2nd keyword ny","wave_function:ny=%d",ny) {
+    /* Processing variable daughter */
+    daughter_Dims[0]=nx,daughter_Dims[1]=ny;
+    capi_daughter_intent |= F2PY_INTENT_IN;
+    capi_daughter_tmp = array_from_pyobj(NPY_CFLOAT,daughter_Dims,daughter_Rank,capi_daughter_intent,daughter_capi);
+    if (capi_daughter_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 6th argument `daughter' of cpwt.wave_function to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        daughter = (complex_float *)(PyArray_DATA(capi_daughter_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&nx,&ny,kx,ky,&k0,&s,&a,daughter);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_daughter_tmp!=daughter_capi) {
+        Py_XDECREF(capi_daughter_tmp); }
+    }  /*if (capi_daughter_tmp == NULL) ... else of daughter*/
+    /* End of cleaning variable daughter */
+    } /*CHECKSCALAR(shape(ky, 0) == ny)*/
+    } /*if (f2py_success) of ny*/
+    /* End of cleaning variable ny */
+    } /*CHECKSCALAR(shape(kx, 0) == nx)*/
+    } /*if (f2py_success) of nx*/
+    /* End of cleaning variable nx */
+    if((PyObject *)capi_ky_tmp!=ky_capi) {
+        Py_XDECREF(capi_ky_tmp); }
+    }  /*if (capi_ky_tmp == NULL) ... else of ky*/
+    /* End of cleaning variable ky */
+    if((PyObject *)capi_kx_tmp!=kx_capi) {
+        Py_XDECREF(capi_kx_tmp); }
+    }  /*if (capi_kx_tmp == NULL) ... else of kx*/
+    /* End of cleaning variable kx */
+    } /*if (f2py_success) of a*/
+    /* End of cleaning variable a */
+    } /*if (f2py_success) of s*/
+    /* End of cleaning variable s */
+    } /*if (f2py_success) of k0*/
+    /* End of cleaning variable k0 */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/**************************** end of wave_function ****************************/
+
+/***************************** jackknife_1d_sgram *****************************/
+static char doc_f2py_rout_cpwt_jackknife_1d_sgram[] = "\
+jackknife_1d_sgram(ss,ess,[nx,ny,na,ns])\n\nWrapper for ``jackknife_1d_sgram``.\
+\n\nParameters\n----------\n"
+"ss : input rank-4 array('f') with bounds (nx,ny,na,ns)\n"
+"ess : input rank-3 array('f') with bounds (nx,ny,ns)\n"
+"\nOther Parameters\n----------------\n"
+"nx : input int, optional\n    Default: shape(ss, 0)\n"
+"ny : input int, optional\n    Default: shape(ss, 1)\n"
+"na : input int, optional\n    Default: shape(ss, 2)\n"
+"ns : input int, optional\n    Default: shape(ss, 3)";
+/* extern void F_FUNC_US(jackknife_1d_sgram,JACKKNIFE_1D_SGRAM)(float*,int*,int*,int*,int*,float*); */
+static PyObject *f2py_rout_cpwt_jackknife_1d_sgram(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,int*,int*,int*,int*,float*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    float *ss = NULL;
+    npy_intp ss_Dims[4] = {-1, -1, -1, -1};
+    const int ss_Rank = 4;
+    PyArrayObject *capi_ss_tmp = NULL;
+    int capi_ss_intent = 0;
+    PyObject *ss_capi = Py_None;
+    int nx = 0;
+    PyObject *nx_capi = Py_None;
+    int ny = 0;
+    PyObject *ny_capi = Py_None;
+    int na = 0;
+    PyObject *na_capi = Py_None;
+    int ns = 0;
+    PyObject *ns_capi = Py_None;
+    float *ess = NULL;
+    npy_intp ess_Dims[3] = {-1, -1, -1};
+    const int ess_Rank = 3;
+    PyArrayObject *capi_ess_tmp = NULL;
+    int capi_ess_intent = 0;
+    PyObject *ess_capi = Py_None;
+    static char *capi_kwlist[] = {"ss","ess","nx","ny","na","ns",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OO|OOOO:cpwt.jackknife_1d_sgram",\
+        capi_kwlist,&ss_capi,&ess_capi,&nx_capi,&ny_capi,&na_capi,&ns_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable ss */
+    ;
+    capi_ss_intent |= F2PY_INTENT_IN;
+    capi_ss_tmp = array_from_pyobj(NPY_FLOAT,ss_Dims,ss_Rank,capi_ss_intent,ss_capi);
+    if (capi_ss_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `ss' of cpwt.jackknife_1d_sgram to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        ss = (float *)(PyArray_DATA(capi_ss_tmp));
+
+    /* Processing variable nx */
+    if (nx_capi == Py_None) nx = shape(ss, 0); else
+        f2py_success = int_from_pyobj(&nx,nx_capi,"cpwt.jackknife_1d_sgram() 1st keyword (nx) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(ss, 0) == nx,"shape(ss, 0) == nx","1st keyword nx","jackknife_1d_sgram:nx=%d",nx) {
+    /* Processing variable ny */
+    if (ny_capi == Py_None) ny = shape(ss, 1); else
+        f2py_success = int_from_pyobj(&ny,ny_capi,"cpwt.jackknife_1d_sgram() 2nd keyword (ny) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(ss, 1) == ny,"shape(ss, 1) == ny","2nd keyword ny","jackknife_1d_sgram:ny=%d",ny) {
+    /* Processing variable na */
+    if (na_capi == Py_None) na = shape(ss, 2); else
+        f2py_success = int_from_pyobj(&na,na_capi,"cpwt.jackknife_1d_sgram() 3rd keyword (na) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(ss, 2) == na,"shape(ss, 2) == na","3rd keyword na","jackknife_1d_sgram:na=%d",na) {
+    /* Processing variable ns */
+    if (ns_capi == Py_None) ns = shape(ss, 3); else
+        f2py_success = int_from_pyobj(&ns,ns_capi,"cpwt.jackknife_1d_sgram() 4th keyword (ns) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(ss, 3) == ns,"shape(ss, 3) == ns","4th keyword ns","jackknife_1d_sgram:ns=%d",ns) {
+    /* Processing variable ess */
+    ess_Dims[0]=nx,ess_Dims[1]=ny,ess_Dims[2]=ns;
+    capi_ess_intent |= F2PY_INTENT_IN;
+    capi_ess_tmp = array_from_pyobj(NPY_FLOAT,ess_Dims,ess_Rank,capi_ess_intent,ess_capi);
+    if (capi_ess_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 2nd argument `ess' of cpwt.jackknife_1d_sgram to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        ess = (float *)(PyArray_DATA(capi_ess_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(ss,&nx,&ny,&na,&ns,ess);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_ess_tmp!=ess_capi) {
+        Py_XDECREF(capi_ess_tmp); }
+    }  /*if (capi_ess_tmp == NULL) ... else of ess*/
+    /* End of cleaning variable ess */
+    } /*CHECKSCALAR(shape(ss, 3) == ns)*/
+    } /*if (f2py_success) of ns*/
+    /* End of cleaning variable ns */
+    } /*CHECKSCALAR(shape(ss, 2) == na)*/
+    } /*if (f2py_success) of na*/
+    /* End of cleaning variable na */
+    } /*CHECKSCALAR(shape(ss, 1) == ny)*/
+    } /*if (f2py_success) of ny*/
+    /* End of cleaning variable ny */
+    } /*CHECKSCALAR(shape(ss, 0) == nx)*/
+    } /*if (f2py_success) of nx*/
+    /* End of cleaning variable nx */
+    if((PyObject *)capi_ss_tmp!=ss_capi) {
+        Py_XDECREF(capi_ss_tmp); }
+    }  /*if (capi_ss_tmp == NULL) ... else of ss*/
+    /* End of cleaning variable ss */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/************************* end of jackknife_1d_sgram *************************/
+
+/***************************** jackknife_1d_admit *****************************/
+static char doc_f2py_rout_cpwt_jackknife_1d_admit[] = "\
+jackknife_1d_admit(sxp,ss1,sad,[nx,ny,na,ns])\n\nWrapper for ``jackknife_1d_admit``.\
+\n\nParameters\n----------\n"
+"sxp : input rank-4 array('f') with bounds (nx,ny,na,ns)\n"
+"ss1 : input rank-4 array('f') with bounds (nx,ny,na,ns)\n"
+"sad : input rank-3 array('f') with bounds (nx,ny,ns)\n"
+"\nOther Parameters\n----------------\n"
+"nx : input int, optional\n    Default: shape(sxp, 0)\n"
+"ny : input int, optional\n    Default: shape(sxp, 1)\n"
+"na : input int, optional\n    Default: shape(sxp, 2)\n"
+"ns : input int, optional\n    Default: shape(sxp, 3)";
+/* extern void F_FUNC_US(jackknife_1d_admit,JACKKNIFE_1D_ADMIT)(float*,float*,int*,int*,int*,int*,float*); */
+static PyObject *f2py_rout_cpwt_jackknife_1d_admit(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,float*,int*,int*,int*,int*,float*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    float *sxp = NULL;
+    npy_intp sxp_Dims[4] = {-1, -1, -1, -1};
+    const int sxp_Rank = 4;
+    PyArrayObject *capi_sxp_tmp = NULL;
+    int capi_sxp_intent = 0;
+    PyObject *sxp_capi = Py_None;
+    float *ss1 = NULL;
+    npy_intp ss1_Dims[4] = {-1, -1, -1, -1};
+    const int ss1_Rank = 4;
+    PyArrayObject *capi_ss1_tmp = NULL;
+    int capi_ss1_intent = 0;
+    PyObject *ss1_capi = Py_None;
+    int nx = 0;
+    PyObject *nx_capi = Py_None;
+    int ny = 0;
+    PyObject *ny_capi = Py_None;
+    int na = 0;
+    PyObject *na_capi = Py_None;
+    int ns = 0;
+    PyObject *ns_capi = Py_None;
+    float *sad = NULL;
+    npy_intp sad_Dims[3] = {-1, -1, -1};
+    const int sad_Rank = 3;
+    PyArrayObject *capi_sad_tmp = NULL;
+    int capi_sad_intent = 0;
+    PyObject *sad_capi = Py_None;
+    static char *capi_kwlist[] = {"sxp","ss1","sad","nx","ny","na","ns",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOO|OOOO:cpwt.jackknife_1d_admit",\
+        capi_kwlist,&sxp_capi,&ss1_capi,&sad_capi,&nx_capi,&ny_capi,&na_capi,&ns_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable sxp */
+    ;
+    capi_sxp_intent |= F2PY_INTENT_IN;
+    capi_sxp_tmp = array_from_pyobj(NPY_FLOAT,sxp_Dims,sxp_Rank,capi_sxp_intent,sxp_capi);
+    if (capi_sxp_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `sxp' of cpwt.jackknife_1d_admit to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        sxp = (float *)(PyArray_DATA(capi_sxp_tmp));
+
+    /* Processing variable nx */
+    if (nx_capi == Py_None) nx = shape(sxp, 0); else
+        f2py_success = int_from_pyobj(&nx,nx_capi,"cpwt.jackknife_1d_admit() 1st keyword (nx) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(sxp, 0) == nx,"shape(sxp, 0) == nx","1st keyword nx","jackknife_1d_admit:nx=%d",nx) {
+    /* Processing variable ny */
+    if (ny_capi == Py_None) ny = shape(sxp, 1); else
+        f2py_success = int_from_pyobj(&ny,ny_capi,"cpwt.jackknife_1d_admit() 2nd keyword (ny) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(sxp, 1) == ny,"shape(sxp, 1) == ny","2nd keyword ny","jackknife_1d_admit:ny=%d",ny) {
+    /* Processing variable na */
+    if (na_capi == Py_None) na = shape(sxp, 2); else
+        f2py_success = int_from_pyobj(&na,na_capi,"cpwt.jackknife_1d_admit() 3rd keyword (na) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(sxp, 2) == na,"shape(sxp, 2) == na","3rd keyword na","jackknife_1d_admit:na=%d",na) {
+    /* Processing variable ns */
+    if (ns_capi == Py_None) ns = shape(sxp, 3); else
+        f2py_success = int_from_pyobj(&ns,ns_capi,"cpwt.jackknife_1d_admit() 4th keyword (ns) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(sxp, 3) == ns,"shape(sxp, 3) == ns","4th keyword ns","jackknife_1d_admit:ns=%d",ns) {
+    /* Processing variable ss1 */
+    ss1_Dims[0]=nx,ss1_Dims[1]=ny,ss1_Dims[2]=na,ss1_Dims[3]=ns;
+    capi_ss1_intent |= F2PY_INTENT_IN;
+    capi_ss1_tmp = array_from_pyobj(NPY_FLOAT,ss1_Dims,ss1_Rank,capi_ss1_intent,ss1_capi);
+    if (capi_ss1_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 2nd argument `ss1' of cpwt.jackknife_1d_admit to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        ss1 = (float *)(PyArray_DATA(capi_ss1_tmp));
+
+    /* Processing variable sad */
+    sad_Dims[0]=nx,sad_Dims[1]=ny,sad_Dims[2]=ns;
+    capi_sad_intent |= F2PY_INTENT_IN;
+    capi_sad_tmp = array_from_pyobj(NPY_FLOAT,sad_Dims,sad_Rank,capi_sad_intent,sad_capi);
+    if (capi_sad_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 3rd argument `sad' of cpwt.jackknife_1d_admit to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        sad = (float *)(PyArray_DATA(capi_sad_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(sxp,ss1,&nx,&ny,&na,&ns,sad);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_sad_tmp!=sad_capi) {
+        Py_XDECREF(capi_sad_tmp); }
+    }  /*if (capi_sad_tmp == NULL) ... else of sad*/
+    /* End of cleaning variable sad */
+    if((PyObject *)capi_ss1_tmp!=ss1_capi) {
+        Py_XDECREF(capi_ss1_tmp); }
+    }  /*if (capi_ss1_tmp == NULL) ... else of ss1*/
+    /* End of cleaning variable ss1 */
+    } /*CHECKSCALAR(shape(sxp, 3) == ns)*/
+    } /*if (f2py_success) of ns*/
+    /* End of cleaning variable ns */
+    } /*CHECKSCALAR(shape(sxp, 2) == na)*/
+    } /*if (f2py_success) of na*/
+    /* End of cleaning variable na */
+    } /*CHECKSCALAR(shape(sxp, 1) == ny)*/
+    } /*if (f2py_success) of ny*/
+    /* End of cleaning variable ny */
+    } /*CHECKSCALAR(shape(sxp, 0) == nx)*/
+    } /*if (f2py_success) of nx*/
+    /* End of cleaning variable nx */
+    if((PyObject *)capi_sxp_tmp!=sxp_capi) {
+        Py_XDECREF(capi_sxp_tmp); }
+    }  /*if (capi_sxp_tmp == NULL) ... else of sxp*/
+    /* End of cleaning variable sxp */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/************************* end of jackknife_1d_admit *************************/
+
+/***************************** jackknife_1d_corr *****************************/
+static char doc_f2py_rout_cpwt_jackknife_1d_corr[] = "\
+jackknife_1d_corr(sxp,ss1,ss2,sco,[nx,ny,na,ns])\n\nWrapper for ``jackknife_1d_corr``.\
+\n\nParameters\n----------\n"
+"sxp : input rank-4 array('f') with bounds (nx,ny,na,ns)\n"
+"ss1 : input rank-4 array('f') with bounds (nx,ny,na,ns)\n"
+"ss2 : input rank-4 array('f') with bounds (nx,ny,na,ns)\n"
+"sco : input rank-3 array('f') with bounds (nx,ny,ns)\n"
+"\nOther Parameters\n----------------\n"
+"nx : input int, optional\n    Default: shape(sxp, 0)\n"
+"ny : input int, optional\n    Default: shape(sxp, 1)\n"
+"na : input int, optional\n    Default: shape(sxp, 2)\n"
+"ns : input int, optional\n    Default: shape(sxp, 3)";
+/* extern void F_FUNC_US(jackknife_1d_corr,JACKKNIFE_1D_CORR)(float*,float*,float*,int*,int*,int*,int*,float*); */
+static PyObject *f2py_rout_cpwt_jackknife_1d_corr(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,float*,float*,int*,int*,int*,int*,float*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    float *sxp = NULL;
+    npy_intp sxp_Dims[4] = {-1, -1, -1, -1};
+    const int sxp_Rank = 4;
+    PyArrayObject *capi_sxp_tmp = NULL;
+    int capi_sxp_intent = 0;
+    PyObject *sxp_capi = Py_None;
+    float *ss1 = NULL;
+    npy_intp ss1_Dims[4] = {-1, -1, -1, -1};
+    const int ss1_Rank = 4;
+    PyArrayObject *capi_ss1_tmp = NULL;
+    int capi_ss1_intent = 0;
+    PyObject *ss1_capi = Py_None;
+    float *ss2 = NULL;
+    npy_intp ss2_Dims[4] = {-1, -1, -1, -1};
+    const int ss2_Rank = 4;
+    PyArrayObject *capi_ss2_tmp = NULL;
+    int capi_ss2_intent = 0;
+    PyObject *ss2_capi = Py_None;
+    int nx = 0;
+    PyObject *nx_capi = Py_None;
+    int ny = 0;
+    PyObject *ny_capi = Py_None;
+    int na = 0;
+    PyObject *na_capi = Py_None;
+    int ns = 0;
+    PyObject *ns_capi = Py_None;
+    float *sco = NULL;
+    npy_intp sco_Dims[3] = {-1, -1, -1};
+    const int sco_Rank = 3;
+    PyArrayObject *capi_sco_tmp = NULL;
+    int capi_sco_intent = 0;
+    PyObject *sco_capi = Py_None;
+    static char *capi_kwlist[] = {"sxp","ss1","ss2","sco","nx","ny","na","ns",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOO|OOOO:cpwt.jackknife_1d_corr",\
+        capi_kwlist,&sxp_capi,&ss1_capi,&ss2_capi,&sco_capi,&nx_capi,&ny_capi,&na_capi,&ns_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable sxp */
+    ;
+    capi_sxp_intent |= F2PY_INTENT_IN;
+    capi_sxp_tmp = array_from_pyobj(NPY_FLOAT,sxp_Dims,sxp_Rank,capi_sxp_intent,sxp_capi);
+    if (capi_sxp_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `sxp' of cpwt.jackknife_1d_corr to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        sxp = (float *)(PyArray_DATA(capi_sxp_tmp));
+
+    /* Processing variable nx */
+    if (nx_capi == Py_None) nx = shape(sxp, 0); else
+        f2py_success = int_from_pyobj(&nx,nx_capi,"cpwt.jackknife_1d_corr() 1st keyword (nx) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(sxp, 0) == nx,"shape(sxp, 0) == nx","1st keyword nx","jackknife_1d_corr:nx=%d",nx) {
+    /* Processing variable ny */
+    if (ny_capi == Py_None) ny = shape(sxp, 1); else
+        f2py_success = int_from_pyobj(&ny,ny_capi,"cpwt.jackknife_1d_corr() 2nd keyword (ny) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(sxp, 1) == ny,"shape(sxp, 1) == ny","2nd keyword ny","jackknife_1d_corr:ny=%d",ny) {
+    /* Processing variable na */
+    if (na_capi == Py_None) na = shape(sxp, 2); else
+        f2py_success = int_from_pyobj(&na,na_capi,"cpwt.jackknife_1d_corr() 3rd keyword (na) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(sxp, 2) == na,"shape(sxp, 2) == na","3rd keyword na","jackknife_1d_corr:na=%d",na) {
+    /* Processing variable ns */
+    if (ns_capi == Py_None) ns = shape(sxp, 3); else
+        f2py_success = int_from_pyobj(&ns,ns_capi,"cpwt.jackknife_1d_corr() 4th keyword (ns) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(sxp, 3) == ns,"shape(sxp, 3) == ns","4th keyword ns","jackknife_1d_corr:ns=%d",ns) {
+    /* Processing variable ss1 */
+    ss1_Dims[0]=nx,ss1_Dims[1]=ny,ss1_Dims[2]=na,ss1_Dims[3]=ns;
+    capi_ss1_intent |= F2PY_INTENT_IN;
+    capi_ss1_tmp = array_from_pyobj(NPY_FLOAT,ss1_Dims,ss1_Rank,capi_ss1_intent,ss1_capi);
+    if (capi_ss1_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 2nd argument `ss1' of cpwt.jackknife_1d_corr to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        ss1 = (float *)(PyArray_DATA(capi_ss1_tmp));
+
+    /* Processing variable ss2 */
+    ss2_Dims[0]=nx,ss2_Dims[1]=ny,ss2_Dims[2]=na,ss2_Dims[3]=ns;
+    capi_ss2_intent |= F2PY_INTENT_IN;
+    capi_ss2_tmp = array_from_pyobj(NPY_FLOAT,ss2_Dims,ss2_Rank,capi_ss2_intent,ss2_capi);
+    if (capi_ss2_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 3rd argument `ss2' of cpwt.jackknife_1d_corr to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        ss2 = (float *)(PyArray_DATA(capi_ss2_tmp));
+
+    /* Processing variable sco */
+    sco_Dims[0]=nx,sco_Dims[1]=ny,sco_Dims[2]=ns;
+    capi_sco_intent |= F2PY_INTENT_IN;
+    capi_sco_tmp = array_from_pyobj(NPY_FLOAT,sco_Dims,sco_Rank,capi_sco_intent,sco_capi);
+    if (capi_sco_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 4th argument `sco' of cpwt.jackknife_1d_corr to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        sco = (float *)(PyArray_DATA(capi_sco_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(sxp,ss1,ss2,&nx,&ny,&na,&ns,sco);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_sco_tmp!=sco_capi) {
+        Py_XDECREF(capi_sco_tmp); }
+    }  /*if (capi_sco_tmp == NULL) ... else of sco*/
+    /* End of cleaning variable sco */
+    if((PyObject *)capi_ss2_tmp!=ss2_capi) {
+        Py_XDECREF(capi_ss2_tmp); }
+    }  /*if (capi_ss2_tmp == NULL) ... else of ss2*/
+    /* End of cleaning variable ss2 */
+    if((PyObject *)capi_ss1_tmp!=ss1_capi) {
+        Py_XDECREF(capi_ss1_tmp); }
+    }  /*if (capi_ss1_tmp == NULL) ... else of ss1*/
+    /* End of cleaning variable ss1 */
+    } /*CHECKSCALAR(shape(sxp, 3) == ns)*/
+    } /*if (f2py_success) of ns*/
+    /* End of cleaning variable ns */
+    } /*CHECKSCALAR(shape(sxp, 2) == na)*/
+    } /*if (f2py_success) of na*/
+    /* End of cleaning variable na */
+    } /*CHECKSCALAR(shape(sxp, 1) == ny)*/
+    } /*if (f2py_success) of ny*/
+    /* End of cleaning variable ny */
+    } /*CHECKSCALAR(shape(sxp, 0) == nx)*/
+    } /*if (f2py_success) of nx*/
+    /* End of cleaning variable nx */
+    if((PyObject *)capi_sxp_tmp!=sxp_capi) {
+        Py_XDECREF(capi_sxp_tmp); }
+    }  /*if (capi_sxp_tmp == NULL) ... else of sxp*/
+    /* End of cleaning variable sxp */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/************************** end of jackknife_1d_corr **************************/
+
+/**************************** jackknife_admit_coh ****************************/
+static char doc_f2py_rout_cpwt_jackknife_admit_coh[] = "\
+jackknife_admit_coh(sxp,ss1,ss2,sad,sco,[nx,ny,na,ns])\n\nWrapper for ``jackknife_admit_coh``.\
+\n\nParameters\n----------\n"
+"sxp : input rank-4 array('F') with bounds (nx,ny,na,ns)\n"
+"ss1 : input rank-4 array('f') with bounds (nx,ny,na,ns)\n"
+"ss2 : input rank-4 array('f') with bounds (nx,ny,na,ns)\n"
+"sad : input rank-3 array('f') with bounds (nx,ny,ns)\n"
+"sco : input rank-3 array('f') with bounds (nx,ny,ns)\n"
+"\nOther Parameters\n----------------\n"
+"nx : input int, optional\n    Default: shape(sxp, 0)\n"
+"ny : input int, optional\n    Default: shape(sxp, 1)\n"
+"na : input int, optional\n    Default: shape(sxp, 2)\n"
+"ns : input int, optional\n    Default: shape(sxp, 3)";
+/* extern void F_FUNC_US(jackknife_admit_coh,JACKKNIFE_ADMIT_COH)(complex_float*,float*,float*,int*,int*,int*,int*,float*,float*); */
+static PyObject *f2py_rout_cpwt_jackknife_admit_coh(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_float*,float*,float*,int*,int*,int*,int*,float*,float*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    complex_float *sxp = NULL;
+    npy_intp sxp_Dims[4] = {-1, -1, -1, -1};
+    const int sxp_Rank = 4;
+    PyArrayObject *capi_sxp_tmp = NULL;
+    int capi_sxp_intent = 0;
+    PyObject *sxp_capi = Py_None;
+    float *ss1 = NULL;
+    npy_intp ss1_Dims[4] = {-1, -1, -1, -1};
+    const int ss1_Rank = 4;
+    PyArrayObject *capi_ss1_tmp = NULL;
+    int capi_ss1_intent = 0;
+    PyObject *ss1_capi = Py_None;
+    float *ss2 = NULL;
+    npy_intp ss2_Dims[4] = {-1, -1, -1, -1};
+    const int ss2_Rank = 4;
+    PyArrayObject *capi_ss2_tmp = NULL;
+    int capi_ss2_intent = 0;
+    PyObject *ss2_capi = Py_None;
+    int nx = 0;
+    PyObject *nx_capi = Py_None;
+    int ny = 0;
+    PyObject *ny_capi = Py_None;
+    int na = 0;
+    PyObject *na_capi = Py_None;
+    int ns = 0;
+    PyObject *ns_capi = Py_None;
+    float *sad = NULL;
+    npy_intp sad_Dims[3] = {-1, -1, -1};
+    const int sad_Rank = 3;
+    PyArrayObject *capi_sad_tmp = NULL;
+    int capi_sad_intent = 0;
+    PyObject *sad_capi = Py_None;
+    float *sco = NULL;
+    npy_intp sco_Dims[3] = {-1, -1, -1};
+    const int sco_Rank = 3;
+    PyArrayObject *capi_sco_tmp = NULL;
+    int capi_sco_intent = 0;
+    PyObject *sco_capi = Py_None;
+    static char *capi_kwlist[] = {"sxp","ss1","ss2","sad","sco","nx","ny","na","ns",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOO|OOOO:cpwt.jackknife_admit_coh",\
+        capi_kwlist,&sxp_capi,&ss1_capi,&ss2_capi,&sad_capi,&sco_capi,&nx_capi,&ny_capi,&na_capi,&ns_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable sxp */
+    ;
+    capi_sxp_intent |= F2PY_INTENT_IN;
+    capi_sxp_tmp = array_from_pyobj(NPY_CFLOAT,sxp_Dims,sxp_Rank,capi_sxp_intent,sxp_capi);
+    if (capi_sxp_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `sxp' of cpwt.jackknife_admit_coh to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        sxp = (complex_float *)(PyArray_DATA(capi_sxp_tmp));
+
+    /* Processing variable nx */
+    if (nx_capi == Py_None) nx = shape(sxp, 0); else
+        f2py_success = int_from_pyobj(&nx,nx_capi,"cpwt.jackknife_admit_coh() 1st keyword (nx) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(sxp, 0) == nx,"shape(sxp, 0) == nx","1st keyword nx","jackknife_admit_coh:nx=%d",nx) {
+    /* Processing variable ny */
+    if (ny_capi == Py_None) ny = shape(sxp, 1); else
+        f2py_success = int_from_pyobj(&ny,ny_capi,"cpwt.jackknife_admit_coh() 2nd keyword (ny) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(sxp, 1) == ny,"shape(sxp, 1) == ny","2nd keyword ny","jackknife_admit_coh:ny=%d",ny) {
+    /* Processing variable na */
+    if (na_capi == Py_None) na = shape(sxp, 2); else
+        f2py_success = int_from_pyobj(&na,na_capi,"cpwt.jackknife_admit_coh() 3rd keyword (na) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(sxp, 2) == na,"shape(sxp, 2) == na","3rd keyword na","jackknife_admit_coh:na=%d",na) {
+    /* Processing variable ns */
+    if (ns_capi == Py_None) ns = shape(sxp, 3); else
+        f2py_success = int_from_pyobj(&ns,ns_capi,"cpwt.jackknife_admit_coh() 4th keyword (ns) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(sxp, 3) == ns,"shape(sxp, 3) == ns","4th keyword ns","jackknife_admit_coh:ns=%d",ns) {
+    /* Processing variable ss1 */
+    ss1_Dims[0]=nx,ss1_Dims[1]=ny,ss1_Dims[2]=na,ss1_Dims[3]=ns;
+    capi_ss1_intent |= F2PY_INTENT_IN;
+    capi_ss1_tmp = array_from_pyobj(NPY_FLOAT,ss1_Dims,ss1_Rank,capi_ss1_intent,ss1_capi);
+    if (capi_ss1_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 2nd argument `ss1' of cpwt.jackknife_admit_coh to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        ss1 = (float *)(PyArray_DATA(capi_ss1_tmp));
+
+    /* Processing variable ss2 */
+    ss2_Dims[0]=nx,ss2_Dims[1]=ny,ss2_Dims[2]=na,ss2_Dims[3]=ns;
+    capi_ss2_intent |= F2PY_INTENT_IN;
+    capi_ss2_tmp = array_from_pyobj(NPY_FLOAT,ss2_Dims,ss2_Rank,capi_ss2_intent,ss2_capi);
+    if (capi_ss2_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 3rd argument `ss2' of cpwt.jackknife_admit_coh to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        ss2 = (float *)(PyArray_DATA(capi_ss2_tmp));
+
+    /* Processing variable sco */
+    sco_Dims[0]=nx,sco_Dims[1]=ny,sco_Dims[2]=ns;
+    capi_sco_intent |= F2PY_INTENT_IN;
+    capi_sco_tmp = array_from_pyobj(NPY_FLOAT,sco_Dims,sco_Rank,capi_sco_intent,sco_capi);
+    if (capi_sco_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 5th argument `sco' of cpwt.jackknife_admit_coh to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        sco = (float *)(PyArray_DATA(capi_sco_tmp));
+
+    /* Processing variable sad */
+    sad_Dims[0]=nx,sad_Dims[1]=ny,sad_Dims[2]=ns;
+    capi_sad_intent |= F2PY_INTENT_IN;
+    capi_sad_tmp = array_from_pyobj(NPY_FLOAT,sad_Dims,sad_Rank,capi_sad_intent,sad_capi);
+    if (capi_sad_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 4th argument `sad' of cpwt.jackknife_admit_coh to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        sad = (float *)(PyArray_DATA(capi_sad_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(sxp,ss1,ss2,&nx,&ny,&na,&ns,sad,sco);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_sad_tmp!=sad_capi) {
+        Py_XDECREF(capi_sad_tmp); }
+    }  /*if (capi_sad_tmp == NULL) ... else of sad*/
+    /* End of cleaning variable sad */
+    if((PyObject *)capi_sco_tmp!=sco_capi) {
+        Py_XDECREF(capi_sco_tmp); }
+    }  /*if (capi_sco_tmp == NULL) ... else of sco*/
+    /* End of cleaning variable sco */
+    if((PyObject *)capi_ss2_tmp!=ss2_capi) {
+        Py_XDECREF(capi_ss2_tmp); }
+    }  /*if (capi_ss2_tmp == NULL) ... else of ss2*/
+    /* End of cleaning variable ss2 */
+    if((PyObject *)capi_ss1_tmp!=ss1_capi) {
+        Py_XDECREF(capi_ss1_tmp); }
+    }  /*if (capi_ss1_tmp == NULL) ... else of ss1*/
+    /* End of cleaning variable ss1 */
+    } /*CHECKSCALAR(shape(sxp, 3) == ns)*/
+    } /*if (f2py_success) of ns*/
+    /* End of cleaning variable ns */
+    } /*CHECKSCALAR(shape(sxp, 2) == na)*/
+    } /*if (f2py_success) of na*/
+    /* End of cleaning variable na */
+    } /*CHECKSCALAR(shape(sxp, 1) == ny)*/
+    } /*if (f2py_success) of ny*/
+    /* End of cleaning variable ny */
+    } /*CHECKSCALAR(shape(sxp, 0) == nx)*/
+    } /*if (f2py_success) of nx*/
+    /* End of cleaning variable nx */
+    if((PyObject *)capi_sxp_tmp!=sxp_capi) {
+        Py_XDECREF(capi_sxp_tmp); }
+    }  /*if (capi_sxp_tmp == NULL) ... else of sxp*/
+    /* End of cleaning variable sxp */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/************************* end of jackknife_admit_coh *************************/
+
+/********************************** mean_std **********************************/
+static char doc_f2py_rout_cpwt_mean_std[] = "\
+mean_std(hwl,mhwl,shwl,[atot])\n\nWrapper for ``mean_std``.\
+\n\nParameters\n----------\n"
+"hwl : input rank-1 array('f') with bounds (atot)\n"
+"mhwl : input float\n"
+"shwl : input float\n"
+"\nOther Parameters\n----------------\n"
+"atot : input int, optional\n    Default: shape(hwl, 0)";
+/* extern void F_FUNC_US(mean_std,MEAN_STD)(float*,int*,float*,float*); */
+static PyObject *f2py_rout_cpwt_mean_std(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,int*,float*,float*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    float *hwl = NULL;
+    npy_intp hwl_Dims[1] = {-1};
+    const int hwl_Rank = 1;
+    PyArrayObject *capi_hwl_tmp = NULL;
+    int capi_hwl_intent = 0;
+    PyObject *hwl_capi = Py_None;
+    int atot = 0;
+    PyObject *atot_capi = Py_None;
+    float mhwl = 0;
+    PyObject *mhwl_capi = Py_None;
+    float shwl = 0;
+    PyObject *shwl_capi = Py_None;
+    static char *capi_kwlist[] = {"hwl","mhwl","shwl","atot",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOO|O:cpwt.mean_std",\
+        capi_kwlist,&hwl_capi,&mhwl_capi,&shwl_capi,&atot_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable hwl */
+    ;
+    capi_hwl_intent |= F2PY_INTENT_IN;
+    capi_hwl_tmp = array_from_pyobj(NPY_FLOAT,hwl_Dims,hwl_Rank,capi_hwl_intent,hwl_capi);
+    if (capi_hwl_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `hwl' of cpwt.mean_std to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        hwl = (float *)(PyArray_DATA(capi_hwl_tmp));
+
+    /* Processing variable mhwl */
+        f2py_success = float_from_pyobj(&mhwl,mhwl_capi,"cpwt.mean_std() 2nd argument (mhwl) can't be converted to float");
+    if (f2py_success) {
+    /* Processing variable shwl */
+        f2py_success = float_from_pyobj(&shwl,shwl_capi,"cpwt.mean_std() 3rd argument (shwl) can't be converted to float");
+    if (f2py_success) {
+    /* Processing variable atot */
+    if (atot_capi == Py_None) atot = shape(hwl, 0); else
+        f2py_success = int_from_pyobj(&atot,atot_capi,"cpwt.mean_std() 1st keyword (atot) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(hwl, 0) == atot,"shape(hwl, 0) == atot","1st keyword atot","mean_std:atot=%d",atot) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(hwl,&atot,&mhwl,&shwl);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    } /*CHECKSCALAR(shape(hwl, 0) == atot)*/
+    } /*if (f2py_success) of atot*/
+    /* End of cleaning variable atot */
+    } /*if (f2py_success) of shwl*/
+    /* End of cleaning variable shwl */
+    } /*if (f2py_success) of mhwl*/
+    /* End of cleaning variable mhwl */
+    if((PyObject *)capi_hwl_tmp!=hwl_capi) {
+        Py_XDECREF(capi_hwl_tmp); }
+    }  /*if (capi_hwl_tmp == NULL) ... else of hwl*/
+    /* End of cleaning variable hwl */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/****************************** end of mean_std ******************************/
+
+/********************************* taper_data *********************************/
+static char doc_f2py_rout_cpwt_taper_data[] = "\
+taper_data(dat,maxt,[maxx,maxy])\n\nWrapper for ``taper_data``.\
+\n\nParameters\n----------\n"
+"dat : input rank-2 array('f') with bounds (maxx,maxy)\n"
+"maxt : input int\n"
+"\nOther Parameters\n----------------\n"
+"maxx : input int, optional\n    Default: shape(dat, 0)\n"
+"maxy : input int, optional\n    Default: shape(dat, 1)";
+/* extern void F_FUNC_US(taper_data,TAPER_DATA)(float*,int*,int*,int*); */
+static PyObject *f2py_rout_cpwt_taper_data(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,int*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    float *dat = NULL;
+    npy_intp dat_Dims[2] = {-1, -1};
+    const int dat_Rank = 2;
+    PyArrayObject *capi_dat_tmp = NULL;
+    int capi_dat_intent = 0;
+    PyObject *dat_capi = Py_None;
+    int maxx = 0;
+    PyObject *maxx_capi = Py_None;
+    int maxy = 0;
+    PyObject *maxy_capi = Py_None;
+    int maxt = 0;
+    PyObject *maxt_capi = Py_None;
+    static char *capi_kwlist[] = {"dat","maxt","maxx","maxy",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OO|OO:cpwt.taper_data",\
+        capi_kwlist,&dat_capi,&maxt_capi,&maxx_capi,&maxy_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable maxt */
+        f2py_success = int_from_pyobj(&maxt,maxt_capi,"cpwt.taper_data() 2nd argument (maxt) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable dat */
+    ;
+    capi_dat_intent |= F2PY_INTENT_IN;
+    capi_dat_tmp = array_from_pyobj(NPY_FLOAT,dat_Dims,dat_Rank,capi_dat_intent,dat_capi);
+    if (capi_dat_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `dat' of cpwt.taper_data to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        dat = (float *)(PyArray_DATA(capi_dat_tmp));
+
+    /* Processing variable maxx */
+    if (maxx_capi == Py_None) maxx = shape(dat, 0); else
+        f2py_success = int_from_pyobj(&maxx,maxx_capi,"cpwt.taper_data() 1st keyword (maxx) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(dat, 0) == maxx,"shape(dat, 0) == maxx","1st keyword maxx","taper_data:maxx=%d",maxx) {
+    /* Processing variable maxy */
+    if (maxy_capi == Py_None) maxy = shape(dat, 1); else
+        f2py_success = int_from_pyobj(&maxy,maxy_capi,"cpwt.taper_data() 2nd keyword (maxy) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(dat, 1) == maxy,"shape(dat, 1) == maxy","2nd keyword maxy","taper_data:maxy=%d",maxy) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(dat,&maxx,&maxy,&maxt);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    } /*CHECKSCALAR(shape(dat, 1) == maxy)*/
+    } /*if (f2py_success) of maxy*/
+    /* End of cleaning variable maxy */
+    } /*CHECKSCALAR(shape(dat, 0) == maxx)*/
+    } /*if (f2py_success) of maxx*/
+    /* End of cleaning variable maxx */
+    if((PyObject *)capi_dat_tmp!=dat_capi) {
+        Py_XDECREF(capi_dat_tmp); }
+    }  /*if (capi_dat_tmp == NULL) ... else of dat*/
+    /* End of cleaning variable dat */
+    } /*if (f2py_success) of maxt*/
+    /* End of cleaning variable maxt */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/***************************** end of taper_data *****************************/
+
+/******************************** mirror_data ********************************/
+static char doc_f2py_rout_cpwt_mirror_data[] = "\
+mirror_data(dat,nx,ny,[nnx,nny])\n\nWrapper for ``mirror_data``.\
+\n\nParameters\n----------\n"
+"dat : input rank-2 array('f') with bounds (nnx,nny)\n"
+"nx : input int\n"
+"ny : input int\n"
+"\nOther Parameters\n----------------\n"
+"nnx : input int, optional\n    Default: shape(dat, 0)\n"
+"nny : input int, optional\n    Default: shape(dat, 1)";
+/* extern void F_FUNC_US(mirror_data,MIRROR_DATA)(float*,int*,int*,int*,int*); */
+static PyObject *f2py_rout_cpwt_mirror_data(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,int*,int*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    float *dat = NULL;
+    npy_intp dat_Dims[2] = {-1, -1};
+    const int dat_Rank = 2;
+    PyArrayObject *capi_dat_tmp = NULL;
+    int capi_dat_intent = 0;
+    PyObject *dat_capi = Py_None;
+    int nx = 0;
+    PyObject *nx_capi = Py_None;
+    int ny = 0;
+    PyObject *ny_capi = Py_None;
+    int nnx = 0;
+    PyObject *nnx_capi = Py_None;
+    int nny = 0;
+    PyObject *nny_capi = Py_None;
+    static char *capi_kwlist[] = {"dat","nx","ny","nnx","nny",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOO|OO:cpwt.mirror_data",\
+        capi_kwlist,&dat_capi,&nx_capi,&ny_capi,&nnx_capi,&nny_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable nx */
+        f2py_success = int_from_pyobj(&nx,nx_capi,"cpwt.mirror_data() 2nd argument (nx) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable ny */
+        f2py_success = int_from_pyobj(&ny,ny_capi,"cpwt.mirror_data() 3rd argument (ny) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable dat */
+    ;
+    capi_dat_intent |= F2PY_INTENT_IN;
+    capi_dat_tmp = array_from_pyobj(NPY_FLOAT,dat_Dims,dat_Rank,capi_dat_intent,dat_capi);
+    if (capi_dat_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `dat' of cpwt.mirror_data to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        dat = (float *)(PyArray_DATA(capi_dat_tmp));
+
+    /* Processing variable nnx */
+    if (nnx_capi == Py_None) nnx = shape(dat, 0); else
+        f2py_success = int_from_pyobj(&nnx,nnx_capi,"cpwt.mirror_data() 1st keyword (nnx) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(dat, 0) == nnx,"shape(dat, 0) == nnx","1st keyword nnx","mirror_data:nnx=%d",nnx) {
+    /* Processing variable nny */
+    if (nny_capi == Py_None) nny = shape(dat, 1); else
+        f2py_success = int_from_pyobj(&nny,nny_capi,"cpwt.mirror_data() 2nd keyword (nny) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(dat, 1) == nny,"shape(dat, 1) == nny","2nd keyword nny","mirror_data:nny=%d",nny) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(dat,&nx,&ny,&nnx,&nny);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    } /*CHECKSCALAR(shape(dat, 1) == nny)*/
+    } /*if (f2py_success) of nny*/
+    /* End of cleaning variable nny */
+    } /*CHECKSCALAR(shape(dat, 0) == nnx)*/
+    } /*if (f2py_success) of nnx*/
+    /* End of cleaning variable nnx */
+    if((PyObject *)capi_dat_tmp!=dat_capi) {
+        Py_XDECREF(capi_dat_tmp); }
+    }  /*if (capi_dat_tmp == NULL) ... else of dat*/
+    /* End of cleaning variable dat */
+    } /*if (f2py_success) of ny*/
+    /* End of cleaning variable ny */
+    } /*if (f2py_success) of nx*/
+    /* End of cleaning variable nx */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/***************************** end of mirror_data *****************************/
+
+/********************************** cfftswap **********************************/
+static char doc_f2py_rout_cpwt_cfftswap[] = "\
+cfftswap(spec,[nx,ny])\n\nWrapper for ``cfftswap``.\
+\n\nParameters\n----------\n"
+"spec : input rank-2 array('F') with bounds (nx,ny)\n"
+"\nOther Parameters\n----------------\n"
+"nx : input int, optional\n    Default: shape(spec, 0)\n"
+"ny : input int, optional\n    Default: shape(spec, 1)";
+/* extern void F_FUNC(cfftswap,CFFTSWAP)(complex_float*,int*,int*); */
+static PyObject *f2py_rout_cpwt_cfftswap(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_float*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    complex_float *spec = NULL;
+    npy_intp spec_Dims[2] = {-1, -1};
+    const int spec_Rank = 2;
+    PyArrayObject *capi_spec_tmp = NULL;
+    int capi_spec_intent = 0;
+    PyObject *spec_capi = Py_None;
+    int nx = 0;
+    PyObject *nx_capi = Py_None;
+    int ny = 0;
+    PyObject *ny_capi = Py_None;
+    static char *capi_kwlist[] = {"spec","nx","ny",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "O|OO:cpwt.cfftswap",\
+        capi_kwlist,&spec_capi,&nx_capi,&ny_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable spec */
+    ;
+    capi_spec_intent |= F2PY_INTENT_IN;
+    capi_spec_tmp = array_from_pyobj(NPY_CFLOAT,spec_Dims,spec_Rank,capi_spec_intent,spec_capi);
+    if (capi_spec_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `spec' of cpwt.cfftswap to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        spec = (complex_float *)(PyArray_DATA(capi_spec_tmp));
+
+    /* Processing variable nx */
+    if (nx_capi == Py_None) nx = shape(spec, 0); else
+        f2py_success = int_from_pyobj(&nx,nx_capi,"cpwt.cfftswap() 1st keyword (nx) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(spec, 0) == nx,"shape(spec, 0) == nx","1st keyword nx","cfftswap:nx=%d",nx) {
+    /* Processing variable ny */
+    if (ny_capi == Py_None) ny = shape(spec, 1); else
+        f2py_success = int_from_pyobj(&ny,ny_capi,"cpwt.cfftswap() 2nd keyword (ny) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(spec, 1) == ny,"shape(spec, 1) == ny","2nd keyword ny","cfftswap:ny=%d",ny) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(spec,&nx,&ny);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    } /*CHECKSCALAR(shape(spec, 1) == ny)*/
+    } /*if (f2py_success) of ny*/
+    /* End of cleaning variable ny */
+    } /*CHECKSCALAR(shape(spec, 0) == nx)*/
+    } /*if (f2py_success) of nx*/
+    /* End of cleaning variable nx */
+    if((PyObject *)capi_spec_tmp!=spec_capi) {
+        Py_XDECREF(capi_spec_tmp); }
+    }  /*if (capi_spec_tmp == NULL) ... else of spec*/
+    /* End of cleaning variable spec */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/****************************** end of cfftswap ******************************/
+
+/********************************** fftswap **********************************/
+static char doc_f2py_rout_cpwt_fftswap[] = "\
+fftswap(spec,[nx,ny])\n\nWrapper for ``fftswap``.\
+\n\nParameters\n----------\n"
+"spec : input rank-2 array('f') with bounds (nx,ny)\n"
+"\nOther Parameters\n----------------\n"
+"nx : input int, optional\n    Default: shape(spec, 0)\n"
+"ny : input int, optional\n    Default: shape(spec, 1)";
+/* extern void F_FUNC(fftswap,FFTSWAP)(float*,int*,int*); */
+static PyObject *f2py_rout_cpwt_fftswap(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    float *spec = NULL;
+    npy_intp spec_Dims[2] = {-1, -1};
+    const int spec_Rank = 2;
+    PyArrayObject *capi_spec_tmp = NULL;
+    int capi_spec_intent = 0;
+    PyObject *spec_capi = Py_None;
+    int nx = 0;
+    PyObject *nx_capi = Py_None;
+    int ny = 0;
+    PyObject *ny_capi = Py_None;
+    static char *capi_kwlist[] = {"spec","nx","ny",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "O|OO:cpwt.fftswap",\
+        capi_kwlist,&spec_capi,&nx_capi,&ny_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable spec */
+    ;
+    capi_spec_intent |= F2PY_INTENT_IN;
+    capi_spec_tmp = array_from_pyobj(NPY_FLOAT,spec_Dims,spec_Rank,capi_spec_intent,spec_capi);
+    if (capi_spec_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `spec' of cpwt.fftswap to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        spec = (float *)(PyArray_DATA(capi_spec_tmp));
+
+    /* Processing variable nx */
+    if (nx_capi == Py_None) nx = shape(spec, 0); else
+        f2py_success = int_from_pyobj(&nx,nx_capi,"cpwt.fftswap() 1st keyword (nx) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(spec, 0) == nx,"shape(spec, 0) == nx","1st keyword nx","fftswap:nx=%d",nx) {
+    /* Processing variable ny */
+    if (ny_capi == Py_None) ny = shape(spec, 1); else
+        f2py_success = int_from_pyobj(&ny,ny_capi,"cpwt.fftswap() 2nd keyword (ny) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(spec, 1) == ny,"shape(spec, 1) == ny","2nd keyword ny","fftswap:ny=%d",ny) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(spec,&nx,&ny);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    } /*CHECKSCALAR(shape(spec, 1) == ny)*/
+    } /*if (f2py_success) of ny*/
+    /* End of cleaning variable ny */
+    } /*CHECKSCALAR(shape(spec, 0) == nx)*/
+    } /*if (f2py_success) of nx*/
+    /* End of cleaning variable nx */
+    if((PyObject *)capi_spec_tmp!=spec_capi) {
+        Py_XDECREF(capi_spec_tmp); }
+    }  /*if (capi_spec_tmp == NULL) ... else of spec*/
+    /* End of cleaning variable spec */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************* end of fftswap *******************************/
+
+/********************************* cfftshift *********************************/
+static char doc_f2py_rout_cpwt_cfftshift[] = "\
+cfftshift(spec,[nx,ny])\n\nWrapper for ``cfftshift``.\
+\n\nParameters\n----------\n"
+"spec : input rank-2 array('F') with bounds (nx,ny)\n"
+"\nOther Parameters\n----------------\n"
+"nx : input int, optional\n    Default: shape(spec, 0)\n"
+"ny : input int, optional\n    Default: shape(spec, 1)";
+/* extern void F_FUNC(cfftshift,CFFTSHIFT)(complex_float*,int*,int*); */
+static PyObject *f2py_rout_cpwt_cfftshift(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_float*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    complex_float *spec = NULL;
+    npy_intp spec_Dims[2] = {-1, -1};
+    const int spec_Rank = 2;
+    PyArrayObject *capi_spec_tmp = NULL;
+    int capi_spec_intent = 0;
+    PyObject *spec_capi = Py_None;
+    int nx = 0;
+    PyObject *nx_capi = Py_None;
+    int ny = 0;
+    PyObject *ny_capi = Py_None;
+    static char *capi_kwlist[] = {"spec","nx","ny",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "O|OO:cpwt.cfftshift",\
+        capi_kwlist,&spec_capi,&nx_capi,&ny_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable spec */
+    ;
+    capi_spec_intent |= F2PY_INTENT_IN;
+    capi_spec_tmp = array_from_pyobj(NPY_CFLOAT,spec_Dims,spec_Rank,capi_spec_intent,spec_capi);
+    if (capi_spec_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `spec' of cpwt.cfftshift to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        spec = (complex_float *)(PyArray_DATA(capi_spec_tmp));
+
+    /* Processing variable nx */
+    if (nx_capi == Py_None) nx = shape(spec, 0); else
+        f2py_success = int_from_pyobj(&nx,nx_capi,"cpwt.cfftshift() 1st keyword (nx) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(spec, 0) == nx,"shape(spec, 0) == nx","1st keyword nx","cfftshift:nx=%d",nx) {
+    /* Processing variable ny */
+    if (ny_capi == Py_None) ny = shape(spec, 1); else
+        f2py_success = int_from_pyobj(&ny,ny_capi,"cpwt.cfftshift() 2nd keyword (ny) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(spec, 1) == ny,"shape(spec, 1) == ny","2nd keyword ny","cfftshift:ny=%d",ny) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(spec,&nx,&ny);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    } /*CHECKSCALAR(shape(spec, 1) == ny)*/
+    } /*if (f2py_success) of ny*/
+    /* End of cleaning variable ny */
+    } /*CHECKSCALAR(shape(spec, 0) == nx)*/
+    } /*if (f2py_success) of nx*/
+    /* End of cleaning variable nx */
+    if((PyObject *)capi_spec_tmp!=spec_capi) {
+        Py_XDECREF(capi_spec_tmp); }
+    }  /*if (capi_spec_tmp == NULL) ... else of spec*/
+    /* End of cleaning variable spec */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/****************************** end of cfftshift ******************************/
+
+/*********************************** fourn ***********************************/
+static char doc_f2py_rout_cpwt_fourn[] = "\
+fourn(data,nn,isign,[ndim])\n\nWrapper for ``fourn``.\
+\n\nParameters\n----------\n"
+"data : input rank-1 array('f') with bounds (*)\n"
+"nn : input rank-1 array('i') with bounds (ndim)\n"
+"isign : input int\n"
+"\nOther Parameters\n----------------\n"
+"ndim : input int, optional\n    Default: shape(nn, 0)";
+/* extern void F_FUNC(fourn,FOURN)(float*,int*,int*,int*); */
+static PyObject *f2py_rout_cpwt_fourn(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,int*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    float *data = NULL;
+    npy_intp data_Dims[1] = {-1};
+    const int data_Rank = 1;
+    PyArrayObject *capi_data_tmp = NULL;
+    int capi_data_intent = 0;
+    PyObject *data_capi = Py_None;
+    int *nn = NULL;
+    npy_intp nn_Dims[1] = {-1};
+    const int nn_Rank = 1;
+    PyArrayObject *capi_nn_tmp = NULL;
+    int capi_nn_intent = 0;
+    PyObject *nn_capi = Py_None;
+    int ndim = 0;
+    PyObject *ndim_capi = Py_None;
+    int isign = 0;
+    PyObject *isign_capi = Py_None;
+    static char *capi_kwlist[] = {"data","nn","isign","ndim",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOO|O:cpwt.fourn",\
+        capi_kwlist,&data_capi,&nn_capi,&isign_capi,&ndim_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable isign */
+        f2py_success = int_from_pyobj(&isign,isign_capi,"cpwt.fourn() 3rd argument (isign) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable nn */
+    ;
+    capi_nn_intent |= F2PY_INTENT_IN;
+    capi_nn_tmp = array_from_pyobj(NPY_INT,nn_Dims,nn_Rank,capi_nn_intent,nn_capi);
+    if (capi_nn_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 2nd argument `nn' of cpwt.fourn to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        nn = (int *)(PyArray_DATA(capi_nn_tmp));
+
+    /* Processing variable data */
+    ;
+    capi_data_intent |= F2PY_INTENT_IN;
+    capi_data_tmp = array_from_pyobj(NPY_FLOAT,data_Dims,data_Rank,capi_data_intent,data_capi);
+    if (capi_data_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `data' of cpwt.fourn to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        data = (float *)(PyArray_DATA(capi_data_tmp));
+
+    /* Processing variable ndim */
+    if (ndim_capi == Py_None) ndim = shape(nn, 0); else
+        f2py_success = int_from_pyobj(&ndim,ndim_capi,"cpwt.fourn() 1st keyword (ndim) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(nn, 0) == ndim,"shape(nn, 0) == ndim","1st keyword ndim","fourn:ndim=%d",ndim) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(data,nn,&ndim,&isign);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    } /*CHECKSCALAR(shape(nn, 0) == ndim)*/
+    } /*if (f2py_success) of ndim*/
+    /* End of cleaning variable ndim */
+    if((PyObject *)capi_data_tmp!=data_capi) {
+        Py_XDECREF(capi_data_tmp); }
+    }  /*if (capi_data_tmp == NULL) ... else of data*/
+    /* End of cleaning variable data */
+    if((PyObject *)capi_nn_tmp!=nn_capi) {
+        Py_XDECREF(capi_nn_tmp); }
+    }  /*if (capi_nn_tmp == NULL) ... else of nn*/
+    /* End of cleaning variable nn */
+    } /*if (f2py_success) of isign*/
+    /* End of cleaning variable isign */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************** end of fourn ********************************/
+
+/******************************* wlet_transform *******************************/
+static char doc_f2py_rout_cpwt_cpwt_wlet_transform[] = "\
+wt_grid = wlet_transform(grid,dx,dy,kf)\n\nWrapper for ``wlet_transform``.\
+\n\nParameters\n----------\n"
+"grid : input rank-2 array('f') with bounds (nx,ny)\n"
+"dx : input float\n"
+"dy : input float\n"
+"kf : input rank-1 array('f') with bounds (ns)\n"
+"\nReturns\n-------\n"
+"wt_grid : rank-4 array('F') with bounds (nx,ny,11,ns)";
+/*  */
+static PyObject *f2py_rout_cpwt_cpwt_wlet_transform(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(float*,int*,int*,float*,float*,float*,int*,complex_float*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    float *grid = NULL;
+    npy_intp grid_Dims[2] = {-1, -1};
+    const int grid_Rank = 2;
+    PyArrayObject *capi_grid_tmp = NULL;
+    int capi_grid_intent = 0;
+    PyObject *grid_capi = Py_None;
+    int nx = 0;
+    int ny = 0;
+    float dx = 0;
+    PyObject *dx_capi = Py_None;
+    float dy = 0;
+    PyObject *dy_capi = Py_None;
+    float *kf = NULL;
+    npy_intp kf_Dims[1] = {-1};
+    const int kf_Rank = 1;
+    PyArrayObject *capi_kf_tmp = NULL;
+    int capi_kf_intent = 0;
+    PyObject *kf_capi = Py_None;
+    int ns = 0;
+    complex_float *wt_grid = NULL;
+    npy_intp wt_grid_Dims[4] = {-1, -1, -1, -1};
+    const int wt_grid_Rank = 4;
+    PyArrayObject *capi_wt_grid_tmp = NULL;
+    int capi_wt_grid_intent = 0;
+    static char *capi_kwlist[] = {"grid","dx","dy","kf",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOO|:cpwt.cpwt.wlet_transform",\
+        capi_kwlist,&grid_capi,&dx_capi,&dy_capi,&kf_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable dx */
+        f2py_success = float_from_pyobj(&dx,dx_capi,"cpwt.cpwt.wlet_transform() 2nd argument (dx) can't be converted to float");
+    if (f2py_success) {
+    /* Processing variable dy */
+        f2py_success = float_from_pyobj(&dy,dy_capi,"cpwt.cpwt.wlet_transform() 3rd argument (dy) can't be converted to float");
+    if (f2py_success) {
+    /* Processing variable grid */
+    ;
+    capi_grid_intent |= F2PY_INTENT_IN;
+    capi_grid_tmp = array_from_pyobj(NPY_FLOAT,grid_Dims,grid_Rank,capi_grid_intent,grid_capi);
+    if (capi_grid_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `grid' of cpwt.cpwt.wlet_transform to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        grid = (float *)(PyArray_DATA(capi_grid_tmp));
+
+    /* Processing variable kf */
+    ;
+    capi_kf_intent |= F2PY_INTENT_IN;
+    capi_kf_tmp = array_from_pyobj(NPY_FLOAT,kf_Dims,kf_Rank,capi_kf_intent,kf_capi);
+    if (capi_kf_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 4th argument `kf' of cpwt.cpwt.wlet_transform to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        kf = (float *)(PyArray_DATA(capi_kf_tmp));
+
+    /* Processing variable nx */
+    nx = shape(grid,0);
+    /* Processing variable ny */
+    ny = shape(grid,1);
+    /* Processing variable ns */
+    ns = shape(kf,0);
+    /* Processing variable wt_grid */
+    wt_grid_Dims[0]=nx,wt_grid_Dims[1]=ny,wt_grid_Dims[2]=11,wt_grid_Dims[3]=ns;
+    capi_wt_grid_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    capi_wt_grid_tmp = array_from_pyobj(NPY_CFLOAT,wt_grid_Dims,wt_grid_Rank,capi_wt_grid_intent,Py_None);
+    if (capi_wt_grid_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting hidden `wt_grid' of cpwt.cpwt.wlet_transform to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        wt_grid = (complex_float *)(PyArray_DATA(capi_wt_grid_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(grid,&nx,&ny,&dx,&dy,kf,&ns,wt_grid);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("N",capi_wt_grid_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    }  /*if (capi_wt_grid_tmp == NULL) ... else of wt_grid*/
+    /* End of cleaning variable wt_grid */
+    /* End of cleaning variable ns */
+    /* End of cleaning variable ny */
+    /* End of cleaning variable nx */
+    if((PyObject *)capi_kf_tmp!=kf_capi) {
+        Py_XDECREF(capi_kf_tmp); }
+    }  /*if (capi_kf_tmp == NULL) ... else of kf*/
+    /* End of cleaning variable kf */
+    if((PyObject *)capi_grid_tmp!=grid_capi) {
+        Py_XDECREF(capi_grid_tmp); }
+    }  /*if (capi_grid_tmp == NULL) ... else of grid*/
+    /* End of cleaning variable grid */
+    } /*if (f2py_success) of dy*/
+    /* End of cleaning variable dy */
+    } /*if (f2py_success) of dx*/
+    /* End of cleaning variable dx */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/*************************** end of wlet_transform ***************************/
+
+/******************************* wlet_scalogram *******************************/
+static char doc_f2py_rout_cpwt_cpwt_wlet_scalogram[] = "\
+wl_sg,ewl_sg = wlet_scalogram(wl_trans)\n\nWrapper for ``wlet_scalogram``.\
+\n\nParameters\n----------\n"
+"wl_trans : input rank-4 array('F') with bounds (nx,ny,11,ns)\n"
+"\nReturns\n-------\n"
+"wl_sg : rank-3 array('f') with bounds (nx,ny,ns)\n"
+"ewl_sg : rank-3 array('f') with bounds (nx,ny,ns)";
+/*  */
+static PyObject *f2py_rout_cpwt_cpwt_wlet_scalogram(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_float*,int*,int*,int*,float*,float*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    complex_float *wl_trans = NULL;
+    npy_intp wl_trans_Dims[4] = {-1, -1, -1, -1};
+    const int wl_trans_Rank = 4;
+    PyArrayObject *capi_wl_trans_tmp = NULL;
+    int capi_wl_trans_intent = 0;
+    PyObject *wl_trans_capi = Py_None;
+    int nx = 0;
+    int ny = 0;
+    int ns = 0;
+    float *wl_sg = NULL;
+    npy_intp wl_sg_Dims[3] = {-1, -1, -1};
+    const int wl_sg_Rank = 3;
+    PyArrayObject *capi_wl_sg_tmp = NULL;
+    int capi_wl_sg_intent = 0;
+    float *ewl_sg = NULL;
+    npy_intp ewl_sg_Dims[3] = {-1, -1, -1};
+    const int ewl_sg_Rank = 3;
+    PyArrayObject *capi_ewl_sg_tmp = NULL;
+    int capi_ewl_sg_intent = 0;
+    static char *capi_kwlist[] = {"wl_trans",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "O|:cpwt.cpwt.wlet_scalogram",\
+        capi_kwlist,&wl_trans_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable wl_trans */
+    wl_trans_Dims[2]=11;
+    capi_wl_trans_intent |= F2PY_INTENT_IN;
+    capi_wl_trans_tmp = array_from_pyobj(NPY_CFLOAT,wl_trans_Dims,wl_trans_Rank,capi_wl_trans_intent,wl_trans_capi);
+    if (capi_wl_trans_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `wl_trans' of cpwt.cpwt.wlet_scalogram to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        wl_trans = (complex_float *)(PyArray_DATA(capi_wl_trans_tmp));
+
+    /* Processing variable nx */
+    nx = shape(wl_trans,0);
+    /* Processing variable ny */
+    ny = shape(wl_trans,1);
+    /* Processing variable ns */
+    ns = shape(wl_trans,3);
+    /* Processing variable wl_sg */
+    wl_sg_Dims[0]=nx,wl_sg_Dims[1]=ny,wl_sg_Dims[2]=ns;
+    capi_wl_sg_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    capi_wl_sg_tmp = array_from_pyobj(NPY_FLOAT,wl_sg_Dims,wl_sg_Rank,capi_wl_sg_intent,Py_None);
+    if (capi_wl_sg_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting hidden `wl_sg' of cpwt.cpwt.wlet_scalogram to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        wl_sg = (float *)(PyArray_DATA(capi_wl_sg_tmp));
+
+    /* Processing variable ewl_sg */
+    ewl_sg_Dims[0]=nx,ewl_sg_Dims[1]=ny,ewl_sg_Dims[2]=ns;
+    capi_ewl_sg_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    capi_ewl_sg_tmp = array_from_pyobj(NPY_FLOAT,ewl_sg_Dims,ewl_sg_Rank,capi_ewl_sg_intent,Py_None);
+    if (capi_ewl_sg_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting hidden `ewl_sg' of cpwt.cpwt.wlet_scalogram to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        ewl_sg = (float *)(PyArray_DATA(capi_ewl_sg_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(wl_trans,&nx,&ny,&ns,wl_sg,ewl_sg);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("NN",capi_wl_sg_tmp,capi_ewl_sg_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    }  /*if (capi_ewl_sg_tmp == NULL) ... else of ewl_sg*/
+    /* End of cleaning variable ewl_sg */
+    }  /*if (capi_wl_sg_tmp == NULL) ... else of wl_sg*/
+    /* End of cleaning variable wl_sg */
+    /* End of cleaning variable ns */
+    /* End of cleaning variable ny */
+    /* End of cleaning variable nx */
+    if((PyObject *)capi_wl_trans_tmp!=wl_trans_capi) {
+        Py_XDECREF(capi_wl_trans_tmp); }
+    }  /*if (capi_wl_trans_tmp == NULL) ... else of wl_trans*/
+    /* End of cleaning variable wl_trans */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/*************************** end of wlet_scalogram ***************************/
+
+/****************************** wlet_xscalogram ******************************/
+static char doc_f2py_rout_cpwt_cpwt_wlet_xscalogram[] = "\
+wl_xsg,ewl_xsg = wlet_xscalogram(wl_trans1,wl_trans2)\n\nWrapper for ``wlet_xscalogram``.\
+\n\nParameters\n----------\n"
+"wl_trans1 : input rank-4 array('F') with bounds (nx,ny,11,ns)\n"
+"wl_trans2 : input rank-4 array('F') with bounds (nx,ny,11,ns)\n"
+"\nReturns\n-------\n"
+"wl_xsg : rank-3 array('F') with bounds (nx,ny,ns)\n"
+"ewl_xsg : rank-3 array('f') with bounds (nx,ny,ns)";
+/*  */
+static PyObject *f2py_rout_cpwt_cpwt_wlet_xscalogram(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_float*,complex_float*,int*,int*,int*,complex_float*,float*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    complex_float *wl_trans1 = NULL;
+    npy_intp wl_trans1_Dims[4] = {-1, -1, -1, -1};
+    const int wl_trans1_Rank = 4;
+    PyArrayObject *capi_wl_trans1_tmp = NULL;
+    int capi_wl_trans1_intent = 0;
+    PyObject *wl_trans1_capi = Py_None;
+    complex_float *wl_trans2 = NULL;
+    npy_intp wl_trans2_Dims[4] = {-1, -1, -1, -1};
+    const int wl_trans2_Rank = 4;
+    PyArrayObject *capi_wl_trans2_tmp = NULL;
+    int capi_wl_trans2_intent = 0;
+    PyObject *wl_trans2_capi = Py_None;
+    int nx = 0;
+    int ny = 0;
+    int ns = 0;
+    complex_float *wl_xsg = NULL;
+    npy_intp wl_xsg_Dims[3] = {-1, -1, -1};
+    const int wl_xsg_Rank = 3;
+    PyArrayObject *capi_wl_xsg_tmp = NULL;
+    int capi_wl_xsg_intent = 0;
+    float *ewl_xsg = NULL;
+    npy_intp ewl_xsg_Dims[3] = {-1, -1, -1};
+    const int ewl_xsg_Rank = 3;
+    PyArrayObject *capi_ewl_xsg_tmp = NULL;
+    int capi_ewl_xsg_intent = 0;
+    static char *capi_kwlist[] = {"wl_trans1","wl_trans2",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OO|:cpwt.cpwt.wlet_xscalogram",\
+        capi_kwlist,&wl_trans1_capi,&wl_trans2_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable wl_trans1 */
+    wl_trans1_Dims[2]=11;
+    capi_wl_trans1_intent |= F2PY_INTENT_IN;
+    capi_wl_trans1_tmp = array_from_pyobj(NPY_CFLOAT,wl_trans1_Dims,wl_trans1_Rank,capi_wl_trans1_intent,wl_trans1_capi);
+    if (capi_wl_trans1_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `wl_trans1' of cpwt.cpwt.wlet_xscalogram to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        wl_trans1 = (complex_float *)(PyArray_DATA(capi_wl_trans1_tmp));
+
+    /* Processing variable nx */
+    nx = shape(wl_trans1,0);
+    /* Processing variable ny */
+    ny = shape(wl_trans1,1);
+    /* Processing variable ns */
+    ns = shape(wl_trans1,3);
+    /* Processing variable wl_trans2 */
+    wl_trans2_Dims[0]=nx,wl_trans2_Dims[1]=ny,wl_trans2_Dims[2]=11,wl_trans2_Dims[3]=ns;
+    capi_wl_trans2_intent |= F2PY_INTENT_IN;
+    capi_wl_trans2_tmp = array_from_pyobj(NPY_CFLOAT,wl_trans2_Dims,wl_trans2_Rank,capi_wl_trans2_intent,wl_trans2_capi);
+    if (capi_wl_trans2_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 2nd argument `wl_trans2' of cpwt.cpwt.wlet_xscalogram to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        wl_trans2 = (complex_float *)(PyArray_DATA(capi_wl_trans2_tmp));
+
+    /* Processing variable wl_xsg */
+    wl_xsg_Dims[0]=nx,wl_xsg_Dims[1]=ny,wl_xsg_Dims[2]=ns;
+    capi_wl_xsg_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    capi_wl_xsg_tmp = array_from_pyobj(NPY_CFLOAT,wl_xsg_Dims,wl_xsg_Rank,capi_wl_xsg_intent,Py_None);
+    if (capi_wl_xsg_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting hidden `wl_xsg' of cpwt.cpwt.wlet_xscalogram to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        wl_xsg = (complex_float *)(PyArray_DATA(capi_wl_xsg_tmp));
+
+    /* Processing variable ewl_xsg */
+    ewl_xsg_Dims[0]=nx,ewl_xsg_Dims[1]=ny,ewl_xsg_Dims[2]=ns;
+    capi_ewl_xsg_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    capi_ewl_xsg_tmp = array_from_pyobj(NPY_FLOAT,ewl_xsg_Dims,ewl_xsg_Rank,capi_ewl_xsg_intent,Py_None);
+    if (capi_ewl_xsg_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting hidden `ewl_xsg' of cpwt.cpwt.wlet_xscalogram to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        ewl_xsg = (float *)(PyArray_DATA(capi_ewl_xsg_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(wl_trans1,wl_trans2,&nx,&ny,&ns,wl_xsg,ewl_xsg);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("NN",capi_wl_xsg_tmp,capi_ewl_xsg_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    }  /*if (capi_ewl_xsg_tmp == NULL) ... else of ewl_xsg*/
+    /* End of cleaning variable ewl_xsg */
+    }  /*if (capi_wl_xsg_tmp == NULL) ... else of wl_xsg*/
+    /* End of cleaning variable wl_xsg */
+    if((PyObject *)capi_wl_trans2_tmp!=wl_trans2_capi) {
+        Py_XDECREF(capi_wl_trans2_tmp); }
+    }  /*if (capi_wl_trans2_tmp == NULL) ... else of wl_trans2*/
+    /* End of cleaning variable wl_trans2 */
+    /* End of cleaning variable ns */
+    /* End of cleaning variable ny */
+    /* End of cleaning variable nx */
+    if((PyObject *)capi_wl_trans1_tmp!=wl_trans1_capi) {
+        Py_XDECREF(capi_wl_trans1_tmp); }
+    }  /*if (capi_wl_trans1_tmp == NULL) ... else of wl_trans1*/
+    /* End of cleaning variable wl_trans1 */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/*************************** end of wlet_xscalogram ***************************/
+
+/******************************* wlet_admit_coh *******************************/
+static char doc_f2py_rout_cpwt_cpwt_wlet_admit_coh[] = "\
+wl_admit,ewl_admit,wl_coh,ewl_coh = wlet_admit_coh(wl_trans1,wl_trans2)\n\nWrapper for ``wlet_admit_coh``.\
+\n\nParameters\n----------\n"
+"wl_trans1 : input rank-4 array('F') with bounds (nx,ny,11,ns)\n"
+"wl_trans2 : input rank-4 array('F') with bounds (nx,ny,11,ns)\n"
+"\nReturns\n-------\n"
+"wl_admit : rank-3 array('f') with bounds (nx,ny,ns)\n"
+"ewl_admit : rank-3 array('f') with bounds (nx,ny,ns)\n"
+"wl_coh : rank-3 array('f') with bounds (nx,ny,ns)\n"
+"ewl_coh : rank-3 array('f') with bounds (nx,ny,ns)";
+/*  */
+static PyObject *f2py_rout_cpwt_cpwt_wlet_admit_coh(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(complex_float*,complex_float*,int*,int*,int*,float*,float*,float*,float*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    complex_float *wl_trans1 = NULL;
+    npy_intp wl_trans1_Dims[4] = {-1, -1, -1, -1};
+    const int wl_trans1_Rank = 4;
+    PyArrayObject *capi_wl_trans1_tmp = NULL;
+    int capi_wl_trans1_intent = 0;
+    PyObject *wl_trans1_capi = Py_None;
+    complex_float *wl_trans2 = NULL;
+    npy_intp wl_trans2_Dims[4] = {-1, -1, -1, -1};
+    const int wl_trans2_Rank = 4;
+    PyArrayObject *capi_wl_trans2_tmp = NULL;
+    int capi_wl_trans2_intent = 0;
+    PyObject *wl_trans2_capi = Py_None;
+    int nx = 0;
+    int ny = 0;
+    int ns = 0;
+    float *wl_admit = NULL;
+    npy_intp wl_admit_Dims[3] = {-1, -1, -1};
+    const int wl_admit_Rank = 3;
+    PyArrayObject *capi_wl_admit_tmp = NULL;
+    int capi_wl_admit_intent = 0;
+    float *ewl_admit = NULL;
+    npy_intp ewl_admit_Dims[3] = {-1, -1, -1};
+    const int ewl_admit_Rank = 3;
+    PyArrayObject *capi_ewl_admit_tmp = NULL;
+    int capi_ewl_admit_intent = 0;
+    float *wl_coh = NULL;
+    npy_intp wl_coh_Dims[3] = {-1, -1, -1};
+    const int wl_coh_Rank = 3;
+    PyArrayObject *capi_wl_coh_tmp = NULL;
+    int capi_wl_coh_intent = 0;
+    float *ewl_coh = NULL;
+    npy_intp ewl_coh_Dims[3] = {-1, -1, -1};
+    const int ewl_coh_Rank = 3;
+    PyArrayObject *capi_ewl_coh_tmp = NULL;
+    int capi_ewl_coh_intent = 0;
+    static char *capi_kwlist[] = {"wl_trans1","wl_trans2",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OO|:cpwt.cpwt.wlet_admit_coh",\
+        capi_kwlist,&wl_trans1_capi,&wl_trans2_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable wl_trans1 */
+    wl_trans1_Dims[2]=11;
+    capi_wl_trans1_intent |= F2PY_INTENT_IN;
+    capi_wl_trans1_tmp = array_from_pyobj(NPY_CFLOAT,wl_trans1_Dims,wl_trans1_Rank,capi_wl_trans1_intent,wl_trans1_capi);
+    if (capi_wl_trans1_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 1st argument `wl_trans1' of cpwt.cpwt.wlet_admit_coh to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        wl_trans1 = (complex_float *)(PyArray_DATA(capi_wl_trans1_tmp));
+
+    /* Processing variable nx */
+    nx = shape(wl_trans1,0);
+    /* Processing variable ny */
+    ny = shape(wl_trans1,1);
+    /* Processing variable ns */
+    ns = shape(wl_trans1,3);
+    /* Processing variable wl_trans2 */
+    wl_trans2_Dims[0]=nx,wl_trans2_Dims[1]=ny,wl_trans2_Dims[2]=11,wl_trans2_Dims[3]=ns;
+    capi_wl_trans2_intent |= F2PY_INTENT_IN;
+    capi_wl_trans2_tmp = array_from_pyobj(NPY_CFLOAT,wl_trans2_Dims,wl_trans2_Rank,capi_wl_trans2_intent,wl_trans2_capi);
+    if (capi_wl_trans2_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting 2nd argument `wl_trans2' of cpwt.cpwt.wlet_admit_coh to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        wl_trans2 = (complex_float *)(PyArray_DATA(capi_wl_trans2_tmp));
+
+    /* Processing variable wl_admit */
+    wl_admit_Dims[0]=nx,wl_admit_Dims[1]=ny,wl_admit_Dims[2]=ns;
+    capi_wl_admit_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    capi_wl_admit_tmp = array_from_pyobj(NPY_FLOAT,wl_admit_Dims,wl_admit_Rank,capi_wl_admit_intent,Py_None);
+    if (capi_wl_admit_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting hidden `wl_admit' of cpwt.cpwt.wlet_admit_coh to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        wl_admit = (float *)(PyArray_DATA(capi_wl_admit_tmp));
+
+    /* Processing variable wl_coh */
+    wl_coh_Dims[0]=nx,wl_coh_Dims[1]=ny,wl_coh_Dims[2]=ns;
+    capi_wl_coh_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    capi_wl_coh_tmp = array_from_pyobj(NPY_FLOAT,wl_coh_Dims,wl_coh_Rank,capi_wl_coh_intent,Py_None);
+    if (capi_wl_coh_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting hidden `wl_coh' of cpwt.cpwt.wlet_admit_coh to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        wl_coh = (float *)(PyArray_DATA(capi_wl_coh_tmp));
+
+    /* Processing variable ewl_admit */
+    ewl_admit_Dims[0]=nx,ewl_admit_Dims[1]=ny,ewl_admit_Dims[2]=ns;
+    capi_ewl_admit_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    capi_ewl_admit_tmp = array_from_pyobj(NPY_FLOAT,ewl_admit_Dims,ewl_admit_Rank,capi_ewl_admit_intent,Py_None);
+    if (capi_ewl_admit_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting hidden `ewl_admit' of cpwt.cpwt.wlet_admit_coh to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        ewl_admit = (float *)(PyArray_DATA(capi_ewl_admit_tmp));
+
+    /* Processing variable ewl_coh */
+    ewl_coh_Dims[0]=nx,ewl_coh_Dims[1]=ny,ewl_coh_Dims[2]=ns;
+    capi_ewl_coh_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    capi_ewl_coh_tmp = array_from_pyobj(NPY_FLOAT,ewl_coh_Dims,ewl_coh_Rank,capi_ewl_coh_intent,Py_None);
+    if (capi_ewl_coh_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : cpwt_error,"failed in converting hidden `ewl_coh' of cpwt.cpwt.wlet_admit_coh to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        ewl_coh = (float *)(PyArray_DATA(capi_ewl_coh_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(wl_trans1,wl_trans2,&nx,&ny,&ns,wl_admit,ewl_admit,wl_coh,ewl_coh);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("NNNN",capi_wl_admit_tmp,capi_ewl_admit_tmp,capi_wl_coh_tmp,capi_ewl_coh_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    }  /*if (capi_ewl_coh_tmp == NULL) ... else of ewl_coh*/
+    /* End of cleaning variable ewl_coh */
+    }  /*if (capi_ewl_admit_tmp == NULL) ... else of ewl_admit*/
+    /* End of cleaning variable ewl_admit */
+    }  /*if (capi_wl_coh_tmp == NULL) ... else of wl_coh*/
+    /* End of cleaning variable wl_coh */
+    }  /*if (capi_wl_admit_tmp == NULL) ... else of wl_admit*/
+    /* End of cleaning variable wl_admit */
+    if((PyObject *)capi_wl_trans2_tmp!=wl_trans2_capi) {
+        Py_XDECREF(capi_wl_trans2_tmp); }
+    }  /*if (capi_wl_trans2_tmp == NULL) ... else of wl_trans2*/
+    /* End of cleaning variable wl_trans2 */
+    /* End of cleaning variable ns */
+    /* End of cleaning variable ny */
+    /* End of cleaning variable nx */
+    if((PyObject *)capi_wl_trans1_tmp!=wl_trans1_capi) {
+        Py_XDECREF(capi_wl_trans1_tmp); }
+    }  /*if (capi_wl_trans1_tmp == NULL) ... else of wl_trans1*/
+    /* End of cleaning variable wl_trans1 */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/*************************** end of wlet_admit_coh ***************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+
+static FortranDataDef f2py_conf_cpwt_def[] = {
+  {"pi",0,{{-1}},NPY_FLOAT},
+  {"na",0,{{-1}},NPY_INT},
+  {"k0",0,{{-1}},NPY_FLOAT},
+  {NULL}
+};
+
+static void f2py_setup_conf_cpwt(char *pi,char *na,char *k0) {
+  int i_f2py=0;
+  f2py_conf_cpwt_def[i_f2py++].data = pi;
+  f2py_conf_cpwt_def[i_f2py++].data = na;
+  f2py_conf_cpwt_def[i_f2py++].data = k0;
+}
+extern void F_FUNC_US(f2pyinitconf_cpwt,F2PYINITCONF_CPWT)(void (*)(char*,char*,char*));
+static void f2py_init_conf_cpwt(void) {
+  F_FUNC_US(f2pyinitconf_cpwt,F2PYINITCONF_CPWT)(f2py_setup_conf_cpwt);
+}
+
+
+static FortranDataDef f2py_cpwt_def[] = {
+  {"wlet_transform",-1,{{-1}},0,NULL,(void *)f2py_rout_cpwt_cpwt_wlet_transform,doc_f2py_rout_cpwt_cpwt_wlet_transform},
+  {"wlet_scalogram",-1,{{-1}},0,NULL,(void *)f2py_rout_cpwt_cpwt_wlet_scalogram,doc_f2py_rout_cpwt_cpwt_wlet_scalogram},
+  {"wlet_xscalogram",-1,{{-1}},0,NULL,(void *)f2py_rout_cpwt_cpwt_wlet_xscalogram,doc_f2py_rout_cpwt_cpwt_wlet_xscalogram},
+  {"wlet_admit_coh",-1,{{-1}},0,NULL,(void *)f2py_rout_cpwt_cpwt_wlet_admit_coh,doc_f2py_rout_cpwt_cpwt_wlet_admit_coh},
+  {NULL}
+};
+
+static void f2py_setup_cpwt(char *wlet_transform,char *wlet_scalogram,char *wlet_xscalogram,char *wlet_admit_coh) {
+  int i_f2py=0;
+  f2py_cpwt_def[i_f2py++].data = wlet_transform;
+  f2py_cpwt_def[i_f2py++].data = wlet_scalogram;
+  f2py_cpwt_def[i_f2py++].data = wlet_xscalogram;
+  f2py_cpwt_def[i_f2py++].data = wlet_admit_coh;
+}
+extern void F_FUNC(f2pyinitcpwt,F2PYINITCPWT)(void (*)(char *,char *,char *,char *));
+static void f2py_init_cpwt(void) {
+  F_FUNC(f2pyinitcpwt,F2PYINITCPWT)(f2py_setup_cpwt);
+}
+
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+    {"npow2",-1,{{-1}},0,(char *)F_FUNC(npow2,NPOW2),(f2py_init_func)f2py_rout_cpwt_npow2,doc_f2py_rout_cpwt_npow2},
+    {"defk",-1,{{-1}},0,(char *)F_FUNC(defk,DEFK),(f2py_init_func)f2py_rout_cpwt_defk,doc_f2py_rout_cpwt_defk},
+    {"wave_function",-1,{{-1}},0,(char *)F_FUNC_US(wave_function,WAVE_FUNCTION),(f2py_init_func)f2py_rout_cpwt_wave_function,doc_f2py_rout_cpwt_wave_function},
+    {"jackknife_1d_sgram",-1,{{-1}},0,(char *)F_FUNC_US(jackknife_1d_sgram,JACKKNIFE_1D_SGRAM),(f2py_init_func)f2py_rout_cpwt_jackknife_1d_sgram,doc_f2py_rout_cpwt_jackknife_1d_sgram},
+    {"jackknife_1d_admit",-1,{{-1}},0,(char *)F_FUNC_US(jackknife_1d_admit,JACKKNIFE_1D_ADMIT),(f2py_init_func)f2py_rout_cpwt_jackknife_1d_admit,doc_f2py_rout_cpwt_jackknife_1d_admit},
+    {"jackknife_1d_corr",-1,{{-1}},0,(char *)F_FUNC_US(jackknife_1d_corr,JACKKNIFE_1D_CORR),(f2py_init_func)f2py_rout_cpwt_jackknife_1d_corr,doc_f2py_rout_cpwt_jackknife_1d_corr},
+    {"jackknife_admit_coh",-1,{{-1}},0,(char *)F_FUNC_US(jackknife_admit_coh,JACKKNIFE_ADMIT_COH),(f2py_init_func)f2py_rout_cpwt_jackknife_admit_coh,doc_f2py_rout_cpwt_jackknife_admit_coh},
+    {"mean_std",-1,{{-1}},0,(char *)F_FUNC_US(mean_std,MEAN_STD),(f2py_init_func)f2py_rout_cpwt_mean_std,doc_f2py_rout_cpwt_mean_std},
+    {"taper_data",-1,{{-1}},0,(char *)F_FUNC_US(taper_data,TAPER_DATA),(f2py_init_func)f2py_rout_cpwt_taper_data,doc_f2py_rout_cpwt_taper_data},
+    {"mirror_data",-1,{{-1}},0,(char *)F_FUNC_US(mirror_data,MIRROR_DATA),(f2py_init_func)f2py_rout_cpwt_mirror_data,doc_f2py_rout_cpwt_mirror_data},
+    {"cfftswap",-1,{{-1}},0,(char *)F_FUNC(cfftswap,CFFTSWAP),(f2py_init_func)f2py_rout_cpwt_cfftswap,doc_f2py_rout_cpwt_cfftswap},
+    {"fftswap",-1,{{-1}},0,(char *)F_FUNC(fftswap,FFTSWAP),(f2py_init_func)f2py_rout_cpwt_fftswap,doc_f2py_rout_cpwt_fftswap},
+    {"cfftshift",-1,{{-1}},0,(char *)F_FUNC(cfftshift,CFFTSHIFT),(f2py_init_func)f2py_rout_cpwt_cfftshift,doc_f2py_rout_cpwt_cfftshift},
+    {"fourn",-1,{{-1}},0,(char *)F_FUNC(fourn,FOURN),(f2py_init_func)f2py_rout_cpwt_fourn,doc_f2py_rout_cpwt_fourn},
+
+/*eof routine_defs*/
+    {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+    {NULL,NULL}
+};
+
+static struct PyModuleDef moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "cpwt",
+    NULL,
+    -1,
+    f2py_module_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC PyInit_cpwt(void) {
+    int i;
+    PyObject *m,*d, *s, *tmp;
+    m = cpwt_module = PyModule_Create(&moduledef);
+    Py_SET_TYPE(&PyFortran_Type, &PyType_Type);
+    import_array();
+    if (PyErr_Occurred())
+        {PyErr_SetString(PyExc_ImportError, "can't initialize module cpwt (failed to import numpy)"); return m;}
+    d = PyModule_GetDict(m);
+    s = PyUnicode_FromString("1.23.5");
+    PyDict_SetItemString(d, "__version__", s);
+    Py_DECREF(s);
+    s = PyUnicode_FromString(
+        "This module 'cpwt' is auto-generated with f2py (version:1.23.5).\nFunctions:\n"
+"    npow2(n,n2)\n"
+"    defk(dx,dy,kx,ky,nx=shape(kx, 0),ny=shape(ky, 0))\n"
+"    wave_function(kx,ky,k0,s,a,daughter,nx=shape(kx, 0),ny=shape(ky, 0))\n"
+"    jackknife_1d_sgram(ss,ess,nx=shape(ss, 0),ny=shape(ss, 1),na=shape(ss, 2),ns=shape(ss, 3))\n"
+"    jackknife_1d_admit(sxp,ss1,sad,nx=shape(sxp, 0),ny=shape(sxp, 1),na=shape(sxp, 2),ns=shape(sxp, 3))\n"
+"    jackknife_1d_corr(sxp,ss1,ss2,sco,nx=shape(sxp, 0),ny=shape(sxp, 1),na=shape(sxp, 2),ns=shape(sxp, 3))\n"
+"    jackknife_admit_coh(sxp,ss1,ss2,sad,sco,nx=shape(sxp, 0),ny=shape(sxp, 1),na=shape(sxp, 2),ns=shape(sxp, 3))\n"
+"    mean_std(hwl,mhwl,shwl,atot=shape(hwl, 0))\n"
+"    taper_data(dat,maxt,maxx=shape(dat, 0),maxy=shape(dat, 1))\n"
+"    mirror_data(dat,nx,ny,nnx=shape(dat, 0),nny=shape(dat, 1))\n"
+"    cfftswap(spec,nx=shape(spec, 0),ny=shape(spec, 1))\n"
+"    fftswap(spec,nx=shape(spec, 0),ny=shape(spec, 1))\n"
+"    cfftshift(spec,nx=shape(spec, 0),ny=shape(spec, 1))\n"
+"    fourn(data,nn,isign,ndim=shape(nn, 0))\n"
+"Fortran 90/95 modules:\n""  conf_cpwt --- pi,na,k0""  cpwt --- wlet_transform(),wlet_scalogram(),wlet_xscalogram(),wlet_admit_coh()"".");
+    PyDict_SetItemString(d, "__doc__", s);
+    Py_DECREF(s);
+    s = PyUnicode_FromString("1.23.5");
+    PyDict_SetItemString(d, "__f2py_numpy_version__", s);
+    Py_DECREF(s);
+    cpwt_error = PyErr_NewException ("cpwt.error", NULL, NULL);
+    /*
+     * Store the error object inside the dict, so that it could get deallocated.
+     * (in practice, this is a module, so it likely will not and cannot.)
+     */
+    PyDict_SetItemString(d, "_cpwt_error", cpwt_error);
+    Py_DECREF(cpwt_error);
+    for(i=0;f2py_routine_defs[i].name!=NULL;i++) {
+        tmp = PyFortranObject_NewAsAttr(&f2py_routine_defs[i]);
+        PyDict_SetItemString(d, f2py_routine_defs[i].name, tmp);
+        Py_DECREF(tmp);
+    }
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+/*eof initf2pywraphooks*/
+  PyDict_SetItemString(d, "cpwt", PyFortranObject_New(f2py_cpwt_def,f2py_init_cpwt));
+  PyDict_SetItemString(d, "conf_cpwt", PyFortranObject_New(f2py_conf_cpwt_def,f2py_init_conf_cpwt));
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+    if (! PyErr_Occurred())
+        on_exit(f2py_report_on_exit,(void*)"cpwt");
+#endif
+    return m;
+}
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,38 @@
+!     -*- f90 -*-
+!     This file is autogenerated with f2py (version:1.23.5)
+!     It contains Fortran 90 wrappers to fortran functions.
+
+      
+      subroutine f2pyinitconf_flex(f2pysetupfunc)
+      use conf_flex, only : pi
+      use conf_flex, only : g
+      use conf_flex, only : em
+      use conf_flex, only : nu
+      use conf_flex, only : gc
+      use conf_flex, only : rhoc
+      use conf_flex, only : rhom
+      use conf_flex, only : rhof
+      use conf_flex, only : rhow
+      use conf_flex, only : rhoa
+      use conf_flex, only : wd
+      use conf_flex, only : zc
+      use conf_flex, only : boug
+      external f2pysetupfunc
+      call f2pysetupfunc(pi,g,em,nu,gc,rhoc,rhom,rhof,rhow,rhoa,wd,zc,bo&
+     &ug)
+      end subroutine f2pyinitconf_flex
+
+      
+      subroutine f2pyinitflex(f2pysetupfunc)
+      use flex, only : flexfilter_top
+      use flex, only : flexfilter_bot
+      use flex, only : decon
+      use flex, only : tr_func
+      use flex, only : real_xspec_functions
+      use flex, only : real_xspec_functions_batch
+      external f2pysetupfunc
+      call f2pysetupfunc(flexfilter_top,flexfilter_bot,decon,tr_func,rea&
+     &l_xspec_functions,real_xspec_functions_batch)
+      end subroutine f2pyinitflex
+
+
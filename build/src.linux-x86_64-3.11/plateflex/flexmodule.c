@@ -0,0 +1,1454 @@
+/* File: flexmodule.c
+ * This file is auto-generated with f2py (version:1.23.5).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Thu Oct 15 22:08:37 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+
+/* Unconditionally included */
+#include <Python.h>
+#include <numpy/npy_os.h>
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *flex_error;
+static PyObject *flex_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+/*need_typedefs*/
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(flex_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int
+int_from_pyobj(int* v, PyObject *obj, const char *errmess)
+{
+    PyObject* tmp = NULL;
+
+    if (PyLong_Check(obj)) {
+        *v = Npy__PyLong_AsInt(obj);
+        return !(*v == -1 && PyErr_Occurred());
+    }
+
+    tmp = PyNumber_Long(obj);
+    if (tmp) {
+        *v = Npy__PyLong_AsInt(tmp);
+        Py_DECREF(tmp);
+        return !(*v == -1 && PyErr_Occurred());
+    }
+
+    if (PyComplex_Check(obj)) {
+        PyErr_Clear();
+        tmp = PyObject_GetAttrString(obj,"real");
+    }
+    else if (PyBytes_Check(obj) || PyUnicode_Check(obj)) {
+        /*pass*/;
+    }
+    else if (PySequence_Check(obj)) {
+        PyErr_Clear();
+        tmp = PySequence_GetItem(obj, 0);
+    }
+
+    if (tmp) {
+        if (int_from_pyobj(v, tmp, errmess)) {
+            Py_DECREF(tmp);
+            return 1;
+        }
+        Py_DECREF(tmp);
+    }
+
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err == NULL) {
+            err = flex_error;
+        }
+        PyErr_SetString(err, errmess);
+    }
+    return 0;
+}
+
+static int
+double_from_pyobj(double* v, PyObject *obj, const char *errmess)
+{
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+        *v = PyFloat_AsDouble(obj);
+        return !(*v == -1.0 && PyErr_Occurred());
+    }
+
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+        *v = PyFloat_AsDouble(tmp);
+        Py_DECREF(tmp);
+        return !(*v == -1.0 && PyErr_Occurred());
+    }
+
+    if (PyComplex_Check(obj)) {
+        PyErr_Clear();
+        tmp = PyObject_GetAttrString(obj,"real");
+    }
+    else if (PyBytes_Check(obj) || PyUnicode_Check(obj)) {
+        /*pass*/;
+    }
+    else if (PySequence_Check(obj)) {
+        PyErr_Clear();
+        tmp = PySequence_GetItem(obj, 0);
+    }
+
+    if (tmp) {
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = flex_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/******************************* flexfilter_top *******************************/
+static char doc_f2py_rout_flex_flex_flexfilter_top[] = "\
+flexfilter_top(psi,filt,[ns])\n\nWrapper for ``flexfilter_top``.\
+\n\nParameters\n----------\n"
+"psi : input rank-1 array('d') with bounds (ns)\n"
+"filt : input rank-1 array('d') with bounds (ns)\n"
+"\nOther Parameters\n----------------\n"
+"ns : input int, optional\n    Default: shape(psi, 0)";
+/*  */
+static PyObject *f2py_rout_flex_flex_flexfilter_top(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int ns = 0;
+    PyObject *ns_capi = Py_None;
+    double *psi = NULL;
+    npy_intp psi_Dims[1] = {-1};
+    const int psi_Rank = 1;
+    PyArrayObject *capi_psi_tmp = NULL;
+    int capi_psi_intent = 0;
+    PyObject *psi_capi = Py_None;
+    double *filt = NULL;
+    npy_intp filt_Dims[1] = {-1};
+    const int filt_Rank = 1;
+    PyArrayObject *capi_filt_tmp = NULL;
+    int capi_filt_intent = 0;
+    PyObject *filt_capi = Py_None;
+    static char *capi_kwlist[] = {"psi","filt","ns",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OO|O:flex.flex.flexfilter_top",\
+        capi_kwlist,&psi_capi,&filt_capi,&ns_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable psi */
+    ;
+    capi_psi_intent |= F2PY_INTENT_IN;
+    capi_psi_tmp = array_from_pyobj(NPY_DOUBLE,psi_Dims,psi_Rank,capi_psi_intent,psi_capi);
+    if (capi_psi_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 1st argument `psi' of flex.flex.flexfilter_top to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        psi = (double *)(PyArray_DATA(capi_psi_tmp));
+
+    /* Processing variable ns */
+    if (ns_capi == Py_None) ns = shape(psi, 0); else
+        f2py_success = int_from_pyobj(&ns,ns_capi,"flex.flex.flexfilter_top() 1st keyword (ns) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(psi, 0) == ns,"shape(psi, 0) == ns","1st keyword ns","flexfilter_top:ns=%d",ns) {
+    /* Processing variable filt */
+    filt_Dims[0]=ns;
+    capi_filt_intent |= F2PY_INTENT_IN;
+    capi_filt_tmp = array_from_pyobj(NPY_DOUBLE,filt_Dims,filt_Rank,capi_filt_intent,filt_capi);
+    if (capi_filt_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 2nd argument `filt' of flex.flex.flexfilter_top to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        filt = (double *)(PyArray_DATA(capi_filt_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&ns,psi,filt);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_filt_tmp!=filt_capi) {
+        Py_XDECREF(capi_filt_tmp); }
+    }  /*if (capi_filt_tmp == NULL) ... else of filt*/
+    /* End of cleaning variable filt */
+    } /*CHECKSCALAR(shape(psi, 0) == ns)*/
+    } /*if (f2py_success) of ns*/
+    /* End of cleaning variable ns */
+    if((PyObject *)capi_psi_tmp!=psi_capi) {
+        Py_XDECREF(capi_psi_tmp); }
+    }  /*if (capi_psi_tmp == NULL) ... else of psi*/
+    /* End of cleaning variable psi */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/*************************** end of flexfilter_top ***************************/
+
+/******************************* flexfilter_bot *******************************/
+static char doc_f2py_rout_flex_flex_flexfilter_bot[] = "\
+flexfilter_bot(psi,filt,[ns])\n\nWrapper for ``flexfilter_bot``.\
+\n\nParameters\n----------\n"
+"psi : input rank-1 array('d') with bounds (ns)\n"
+"filt : input rank-1 array('d') with bounds (ns)\n"
+"\nOther Parameters\n----------------\n"
+"ns : input int, optional\n    Default: shape(psi, 0)";
+/*  */
+static PyObject *f2py_rout_flex_flex_flexfilter_bot(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int ns = 0;
+    PyObject *ns_capi = Py_None;
+    double *psi = NULL;
+    npy_intp psi_Dims[1] = {-1};
+    const int psi_Rank = 1;
+    PyArrayObject *capi_psi_tmp = NULL;
+    int capi_psi_intent = 0;
+    PyObject *psi_capi = Py_None;
+    double *filt = NULL;
+    npy_intp filt_Dims[1] = {-1};
+    const int filt_Rank = 1;
+    PyArrayObject *capi_filt_tmp = NULL;
+    int capi_filt_intent = 0;
+    PyObject *filt_capi = Py_None;
+    static char *capi_kwlist[] = {"psi","filt","ns",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OO|O:flex.flex.flexfilter_bot",\
+        capi_kwlist,&psi_capi,&filt_capi,&ns_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable psi */
+    ;
+    capi_psi_intent |= F2PY_INTENT_IN;
+    capi_psi_tmp = array_from_pyobj(NPY_DOUBLE,psi_Dims,psi_Rank,capi_psi_intent,psi_capi);
+    if (capi_psi_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 1st argument `psi' of flex.flex.flexfilter_bot to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        psi = (double *)(PyArray_DATA(capi_psi_tmp));
+
+    /* Processing variable ns */
+    if (ns_capi == Py_None) ns = shape(psi, 0); else
+        f2py_success = int_from_pyobj(&ns,ns_capi,"flex.flex.flexfilter_bot() 1st keyword (ns) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(psi, 0) == ns,"shape(psi, 0) == ns","1st keyword ns","flexfilter_bot:ns=%d",ns) {
+    /* Processing variable filt */
+    filt_Dims[0]=ns;
+    capi_filt_intent |= F2PY_INTENT_IN;
+    capi_filt_tmp = array_from_pyobj(NPY_DOUBLE,filt_Dims,filt_Rank,capi_filt_intent,filt_capi);
+    if (capi_filt_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 2nd argument `filt' of flex.flex.flexfilter_bot to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        filt = (double *)(PyArray_DATA(capi_filt_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&ns,psi,filt);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_filt_tmp!=filt_capi) {
+        Py_XDECREF(capi_filt_tmp); }
+    }  /*if (capi_filt_tmp == NULL) ... else of filt*/
+    /* End of cleaning variable filt */
+    } /*CHECKSCALAR(shape(psi, 0) == ns)*/
+    } /*if (f2py_success) of ns*/
+    /* End of cleaning variable ns */
+    if((PyObject *)capi_psi_tmp!=psi_capi) {
+        Py_XDECREF(capi_psi_tmp); }
+    }  /*if (capi_psi_tmp == NULL) ... else of psi*/
+    /* End of cleaning variable psi */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/*************************** end of flexfilter_bot ***************************/
+
+/*********************************** decon ***********************************/
+static char doc_f2py_rout_flex_flex_decon[] = "\
+decon(theta,phi,k,a,mu_h,mu_w,nu_h,nu_w,[ns])\n\nWrapper for ``decon``.\
+\n\nParameters\n----------\n"
+"theta : input rank-1 array('d') with bounds (ns)\n"
+"phi : input rank-1 array('d') with bounds (ns)\n"
+"k : input rank-1 array('d') with bounds (ns)\n"
+"a : input float\n"
+"mu_h : input rank-1 array('d') with bounds (ns)\n"
+"mu_w : input rank-1 array('d') with bounds (ns)\n"
+"nu_h : input rank-1 array('d') with bounds (ns)\n"
+"nu_w : input rank-1 array('d') with bounds (ns)\n"
+"\nOther Parameters\n----------------\n"
+"ns : input int, optional\n    Default: shape(theta, 0)";
+/*  */
+static PyObject *f2py_rout_flex_flex_decon(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,double*,double*,double*,double*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int ns = 0;
+    PyObject *ns_capi = Py_None;
+    double *theta = NULL;
+    npy_intp theta_Dims[1] = {-1};
+    const int theta_Rank = 1;
+    PyArrayObject *capi_theta_tmp = NULL;
+    int capi_theta_intent = 0;
+    PyObject *theta_capi = Py_None;
+    double *phi = NULL;
+    npy_intp phi_Dims[1] = {-1};
+    const int phi_Rank = 1;
+    PyArrayObject *capi_phi_tmp = NULL;
+    int capi_phi_intent = 0;
+    PyObject *phi_capi = Py_None;
+    double *k = NULL;
+    npy_intp k_Dims[1] = {-1};
+    const int k_Rank = 1;
+    PyArrayObject *capi_k_tmp = NULL;
+    int capi_k_intent = 0;
+    PyObject *k_capi = Py_None;
+    double a = 0;
+    PyObject *a_capi = Py_None;
+    double *mu_h = NULL;
+    npy_intp mu_h_Dims[1] = {-1};
+    const int mu_h_Rank = 1;
+    PyArrayObject *capi_mu_h_tmp = NULL;
+    int capi_mu_h_intent = 0;
+    PyObject *mu_h_capi = Py_None;
+    double *mu_w = NULL;
+    npy_intp mu_w_Dims[1] = {-1};
+    const int mu_w_Rank = 1;
+    PyArrayObject *capi_mu_w_tmp = NULL;
+    int capi_mu_w_intent = 0;
+    PyObject *mu_w_capi = Py_None;
+    double *nu_h = NULL;
+    npy_intp nu_h_Dims[1] = {-1};
+    const int nu_h_Rank = 1;
+    PyArrayObject *capi_nu_h_tmp = NULL;
+    int capi_nu_h_intent = 0;
+    PyObject *nu_h_capi = Py_None;
+    double *nu_w = NULL;
+    npy_intp nu_w_Dims[1] = {-1};
+    const int nu_w_Rank = 1;
+    PyArrayObject *capi_nu_w_tmp = NULL;
+    int capi_nu_w_intent = 0;
+    PyObject *nu_w_capi = Py_None;
+    static char *capi_kwlist[] = {"theta","phi","k","a","mu_h","mu_w","nu_h","nu_w","ns",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOO|O:flex.flex.decon",\
+        capi_kwlist,&theta_capi,&phi_capi,&k_capi,&a_capi,&mu_h_capi,&mu_w_capi,&nu_h_capi,&nu_w_capi,&ns_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable theta */
+    ;
+    capi_theta_intent |= F2PY_INTENT_IN;
+    capi_theta_tmp = array_from_pyobj(NPY_DOUBLE,theta_Dims,theta_Rank,capi_theta_intent,theta_capi);
+    if (capi_theta_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 1st argument `theta' of flex.flex.decon to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        theta = (double *)(PyArray_DATA(capi_theta_tmp));
+
+    /* Processing variable a */
+        f2py_success = double_from_pyobj(&a,a_capi,"flex.flex.decon() 4th argument (a) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable ns */
+    if (ns_capi == Py_None) ns = shape(theta, 0); else
+        f2py_success = int_from_pyobj(&ns,ns_capi,"flex.flex.decon() 1st keyword (ns) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(theta, 0) == ns,"shape(theta, 0) == ns","1st keyword ns","decon:ns=%d",ns) {
+    /* Processing variable phi */
+    phi_Dims[0]=ns;
+    capi_phi_intent |= F2PY_INTENT_IN;
+    capi_phi_tmp = array_from_pyobj(NPY_DOUBLE,phi_Dims,phi_Rank,capi_phi_intent,phi_capi);
+    if (capi_phi_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 2nd argument `phi' of flex.flex.decon to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        phi = (double *)(PyArray_DATA(capi_phi_tmp));
+
+    /* Processing variable k */
+    k_Dims[0]=ns;
+    capi_k_intent |= F2PY_INTENT_IN;
+    capi_k_tmp = array_from_pyobj(NPY_DOUBLE,k_Dims,k_Rank,capi_k_intent,k_capi);
+    if (capi_k_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 3rd argument `k' of flex.flex.decon to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        k = (double *)(PyArray_DATA(capi_k_tmp));
+
+    /* Processing variable mu_h */
+    mu_h_Dims[0]=ns;
+    capi_mu_h_intent |= F2PY_INTENT_IN;
+    capi_mu_h_tmp = array_from_pyobj(NPY_DOUBLE,mu_h_Dims,mu_h_Rank,capi_mu_h_intent,mu_h_capi);
+    if (capi_mu_h_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 5th argument `mu_h' of flex.flex.decon to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        mu_h = (double *)(PyArray_DATA(capi_mu_h_tmp));
+
+    /* Processing variable mu_w */
+    mu_w_Dims[0]=ns;
+    capi_mu_w_intent |= F2PY_INTENT_IN;
+    capi_mu_w_tmp = array_from_pyobj(NPY_DOUBLE,mu_w_Dims,mu_w_Rank,capi_mu_w_intent,mu_w_capi);
+    if (capi_mu_w_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 6th argument `mu_w' of flex.flex.decon to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        mu_w = (double *)(PyArray_DATA(capi_mu_w_tmp));
+
+    /* Processing variable nu_h */
+    nu_h_Dims[0]=ns;
+    capi_nu_h_intent |= F2PY_INTENT_IN;
+    capi_nu_h_tmp = array_from_pyobj(NPY_DOUBLE,nu_h_Dims,nu_h_Rank,capi_nu_h_intent,nu_h_capi);
+    if (capi_nu_h_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 7th argument `nu_h' of flex.flex.decon to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        nu_h = (double *)(PyArray_DATA(capi_nu_h_tmp));
+
+    /* Processing variable nu_w */
+    nu_w_Dims[0]=ns;
+    capi_nu_w_intent |= F2PY_INTENT_IN;
+    capi_nu_w_tmp = array_from_pyobj(NPY_DOUBLE,nu_w_Dims,nu_w_Rank,capi_nu_w_intent,nu_w_capi);
+    if (capi_nu_w_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 8th argument `nu_w' of flex.flex.decon to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        nu_w = (double *)(PyArray_DATA(capi_nu_w_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&ns,theta,phi,k,&a,mu_h,mu_w,nu_h,nu_w);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_nu_w_tmp!=nu_w_capi) {
+        Py_XDECREF(capi_nu_w_tmp); }
+    }  /*if (capi_nu_w_tmp == NULL) ... else of nu_w*/
+    /* End of cleaning variable nu_w */
+    if((PyObject *)capi_nu_h_tmp!=nu_h_capi) {
+        Py_XDECREF(capi_nu_h_tmp); }
+    }  /*if (capi_nu_h_tmp == NULL) ... else of nu_h*/
+    /* End of cleaning variable nu_h */
+    if((PyObject *)capi_mu_w_tmp!=mu_w_capi) {
+        Py_XDECREF(capi_mu_w_tmp); }
+    }  /*if (capi_mu_w_tmp == NULL) ... else of mu_w*/
+    /* End of cleaning variable mu_w */
+    if((PyObject *)capi_mu_h_tmp!=mu_h_capi) {
+        Py_XDECREF(capi_mu_h_tmp); }
+    }  /*if (capi_mu_h_tmp == NULL) ... else of mu_h*/
+    /* End of cleaning variable mu_h */
+    if((PyObject *)capi_k_tmp!=k_capi) {
+        Py_XDECREF(capi_k_tmp); }
+    }  /*if (capi_k_tmp == NULL) ... else of k*/
+    /* End of cleaning variable k */
+    if((PyObject *)capi_phi_tmp!=phi_capi) {
+        Py_XDECREF(capi_phi_tmp); }
+    }  /*if (capi_phi_tmp == NULL) ... else of phi*/
+    /* End of cleaning variable phi */
+    } /*CHECKSCALAR(shape(theta, 0) == ns)*/
+    } /*if (f2py_success) of ns*/
+    /* End of cleaning variable ns */
+    } /*if (f2py_success) of a*/
+    /* End of cleaning variable a */
+    if((PyObject *)capi_theta_tmp!=theta_capi) {
+        Py_XDECREF(capi_theta_tmp); }
+    }  /*if (capi_theta_tmp == NULL) ... else of theta*/
+    /* End of cleaning variable theta */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************** end of decon ********************************/
+
+/********************************** tr_func **********************************/
+static char doc_f2py_rout_flex_flex_tr_func[] = "\
+tr_func(mu_h,mu_w,nu_h,nu_w,f,alpha,admit,coh,[ns])\n\nWrapper for ``tr_func``.\
+\n\nParameters\n----------\n"
+"mu_h : input rank-1 array('d') with bounds (ns)\n"
+"mu_w : input rank-1 array('d') with bounds (ns)\n"
+"nu_h : input rank-1 array('d') with bounds (ns)\n"
+"nu_w : input rank-1 array('d') with bounds (ns)\n"
+"f : input float\n"
+"alpha : input float\n"
+"admit : input rank-1 array('d') with bounds (ns)\n"
+"coh : input rank-1 array('d') with bounds (ns)\n"
+"\nOther Parameters\n----------------\n"
+"ns : input int, optional\n    Default: shape(mu_h, 0)";
+/*  */
+static PyObject *f2py_rout_flex_flex_tr_func(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,double*,double*,double*,double*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int ns = 0;
+    PyObject *ns_capi = Py_None;
+    double *mu_h = NULL;
+    npy_intp mu_h_Dims[1] = {-1};
+    const int mu_h_Rank = 1;
+    PyArrayObject *capi_mu_h_tmp = NULL;
+    int capi_mu_h_intent = 0;
+    PyObject *mu_h_capi = Py_None;
+    double *mu_w = NULL;
+    npy_intp mu_w_Dims[1] = {-1};
+    const int mu_w_Rank = 1;
+    PyArrayObject *capi_mu_w_tmp = NULL;
+    int capi_mu_w_intent = 0;
+    PyObject *mu_w_capi = Py_None;
+    double *nu_h = NULL;
+    npy_intp nu_h_Dims[1] = {-1};
+    const int nu_h_Rank = 1;
+    PyArrayObject *capi_nu_h_tmp = NULL;
+    int capi_nu_h_intent = 0;
+    PyObject *nu_h_capi = Py_None;
+    double *nu_w = NULL;
+    npy_intp nu_w_Dims[1] = {-1};
+    const int nu_w_Rank = 1;
+    PyArrayObject *capi_nu_w_tmp = NULL;
+    int capi_nu_w_intent = 0;
+    PyObject *nu_w_capi = Py_None;
+    double f = 0;
+    PyObject *f_capi = Py_None;
+    double alpha = 0;
+    PyObject *alpha_capi = Py_None;
+    double *admit = NULL;
+    npy_intp admit_Dims[1] = {-1};
+    const int admit_Rank = 1;
+    PyArrayObject *capi_admit_tmp = NULL;
+    int capi_admit_intent = 0;
+    PyObject *admit_capi = Py_None;
+    double *coh = NULL;
+    npy_intp coh_Dims[1] = {-1};
+    const int coh_Rank = 1;
+    PyArrayObject *capi_coh_tmp = NULL;
+    int capi_coh_intent = 0;
+    PyObject *coh_capi = Py_None;
+    static char *capi_kwlist[] = {"mu_h","mu_w","nu_h","nu_w","f","alpha","admit","coh","ns",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOO|O:flex.flex.tr_func",\
+        capi_kwlist,&mu_h_capi,&mu_w_capi,&nu_h_capi,&nu_w_capi,&f_capi,&alpha_capi,&admit_capi,&coh_capi,&ns_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable mu_h */
+    ;
+    capi_mu_h_intent |= F2PY_INTENT_IN;
+    capi_mu_h_tmp = array_from_pyobj(NPY_DOUBLE,mu_h_Dims,mu_h_Rank,capi_mu_h_intent,mu_h_capi);
+    if (capi_mu_h_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 1st argument `mu_h' of flex.flex.tr_func to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        mu_h = (double *)(PyArray_DATA(capi_mu_h_tmp));
+
+    /* Processing variable f */
+        f2py_success = double_from_pyobj(&f,f_capi,"flex.flex.tr_func() 5th argument (f) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable alpha */
+        f2py_success = double_from_pyobj(&alpha,alpha_capi,"flex.flex.tr_func() 6th argument (alpha) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable ns */
+    if (ns_capi == Py_None) ns = shape(mu_h, 0); else
+        f2py_success = int_from_pyobj(&ns,ns_capi,"flex.flex.tr_func() 1st keyword (ns) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(mu_h, 0) == ns,"shape(mu_h, 0) == ns","1st keyword ns","tr_func:ns=%d",ns) {
+    /* Processing variable mu_w */
+    mu_w_Dims[0]=ns;
+    capi_mu_w_intent |= F2PY_INTENT_IN;
+    capi_mu_w_tmp = array_from_pyobj(NPY_DOUBLE,mu_w_Dims,mu_w_Rank,capi_mu_w_intent,mu_w_capi);
+    if (capi_mu_w_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 2nd argument `mu_w' of flex.flex.tr_func to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        mu_w = (double *)(PyArray_DATA(capi_mu_w_tmp));
+
+    /* Processing variable nu_h */
+    nu_h_Dims[0]=ns;
+    capi_nu_h_intent |= F2PY_INTENT_IN;
+    capi_nu_h_tmp = array_from_pyobj(NPY_DOUBLE,nu_h_Dims,nu_h_Rank,capi_nu_h_intent,nu_h_capi);
+    if (capi_nu_h_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 3rd argument `nu_h' of flex.flex.tr_func to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        nu_h = (double *)(PyArray_DATA(capi_nu_h_tmp));
+
+    /* Processing variable nu_w */
+    nu_w_Dims[0]=ns;
+    capi_nu_w_intent |= F2PY_INTENT_IN;
+    capi_nu_w_tmp = array_from_pyobj(NPY_DOUBLE,nu_w_Dims,nu_w_Rank,capi_nu_w_intent,nu_w_capi);
+    if (capi_nu_w_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 4th argument `nu_w' of flex.flex.tr_func to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        nu_w = (double *)(PyArray_DATA(capi_nu_w_tmp));
+
+    /* Processing variable admit */
+    admit_Dims[0]=ns;
+    capi_admit_intent |= F2PY_INTENT_IN;
+    capi_admit_tmp = array_from_pyobj(NPY_DOUBLE,admit_Dims,admit_Rank,capi_admit_intent,admit_capi);
+    if (capi_admit_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 7th argument `admit' of flex.flex.tr_func to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        admit = (double *)(PyArray_DATA(capi_admit_tmp));
+
+    /* Processing variable coh */
+    coh_Dims[0]=ns;
+    capi_coh_intent |= F2PY_INTENT_IN;
+    capi_coh_tmp = array_from_pyobj(NPY_DOUBLE,coh_Dims,coh_Rank,capi_coh_intent,coh_capi);
+    if (capi_coh_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 8th argument `coh' of flex.flex.tr_func to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        coh = (double *)(PyArray_DATA(capi_coh_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&ns,mu_h,mu_w,nu_h,nu_w,&f,&alpha,admit,coh);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_coh_tmp!=coh_capi) {
+        Py_XDECREF(capi_coh_tmp); }
+    }  /*if (capi_coh_tmp == NULL) ... else of coh*/
+    /* End of cleaning variable coh */
+    if((PyObject *)capi_admit_tmp!=admit_capi) {
+        Py_XDECREF(capi_admit_tmp); }
+    }  /*if (capi_admit_tmp == NULL) ... else of admit*/
+    /* End of cleaning variable admit */
+    if((PyObject *)capi_nu_w_tmp!=nu_w_capi) {
+        Py_XDECREF(capi_nu_w_tmp); }
+    }  /*if (capi_nu_w_tmp == NULL) ... else of nu_w*/
+    /* End of cleaning variable nu_w */
+    if((PyObject *)capi_nu_h_tmp!=nu_h_capi) {
+        Py_XDECREF(capi_nu_h_tmp); }
+    }  /*if (capi_nu_h_tmp == NULL) ... else of nu_h*/
+    /* End of cleaning variable nu_h */
+    if((PyObject *)capi_mu_w_tmp!=mu_w_capi) {
+        Py_XDECREF(capi_mu_w_tmp); }
+    }  /*if (capi_mu_w_tmp == NULL) ... else of mu_w*/
+    /* End of cleaning variable mu_w */
+    } /*CHECKSCALAR(shape(mu_h, 0) == ns)*/
+    } /*if (f2py_success) of ns*/
+    /* End of cleaning variable ns */
+    } /*if (f2py_success) of alpha*/
+    /* End of cleaning variable alpha */
+    } /*if (f2py_success) of f*/
+    /* End of cleaning variable f */
+    if((PyObject *)capi_mu_h_tmp!=mu_h_capi) {
+        Py_XDECREF(capi_mu_h_tmp); }
+    }  /*if (capi_mu_h_tmp == NULL) ... else of mu_h*/
+    /* End of cleaning variable mu_h */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************* end of tr_func *******************************/
+
+/**************************** real_xspec_functions ****************************/
+static char doc_f2py_rout_flex_flex_real_xspec_functions[] = "\
+admit,coh = real_xspec_functions(k,te,f,alpha)\n\nWrapper for ``real_xspec_functions``.\
+\n\nParameters\n----------\n"
+"k : input rank-1 array('d') with bounds (ns)\n"
+"te : input float\n"
+"f : input float\n"
+"alpha : input float\n"
+"\nReturns\n-------\n"
+"admit : rank-1 array('d') with bounds (ns)\n"
+"coh : rank-1 array('d') with bounds (ns)";
+/*  */
+static PyObject *f2py_rout_flex_flex_real_xspec_functions(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,double*,double*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int ns = 0;
+    double *k = NULL;
+    npy_intp k_Dims[1] = {-1};
+    const int k_Rank = 1;
+    PyArrayObject *capi_k_tmp = NULL;
+    int capi_k_intent = 0;
+    PyObject *k_capi = Py_None;
+    double te = 0;
+    PyObject *te_capi = Py_None;
+    double f = 0;
+    PyObject *f_capi = Py_None;
+    double alpha = 0;
+    PyObject *alpha_capi = Py_None;
+    double *admit = NULL;
+    npy_intp admit_Dims[1] = {-1};
+    const int admit_Rank = 1;
+    PyArrayObject *capi_admit_tmp = NULL;
+    int capi_admit_intent = 0;
+    double *coh = NULL;
+    npy_intp coh_Dims[1] = {-1};
+    const int coh_Rank = 1;
+    PyArrayObject *capi_coh_tmp = NULL;
+    int capi_coh_intent = 0;
+    static char *capi_kwlist[] = {"k","te","f","alpha",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOO|:flex.flex.real_xspec_functions",\
+        capi_kwlist,&k_capi,&te_capi,&f_capi,&alpha_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable k */
+    ;
+    capi_k_intent |= F2PY_INTENT_IN;
+    capi_k_tmp = array_from_pyobj(NPY_DOUBLE,k_Dims,k_Rank,capi_k_intent,k_capi);
+    if (capi_k_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 1st argument `k' of flex.flex.real_xspec_functions to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        k = (double *)(PyArray_DATA(capi_k_tmp));
+
+    /* Processing variable te */
+        f2py_success = double_from_pyobj(&te,te_capi,"flex.flex.real_xspec_functions() 2nd argument (te) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable f */
+        f2py_success = double_from_pyobj(&f,f_capi,"flex.flex.real_xspec_functions() 3rd argument (f) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable alpha */
+        f2py_success = double_from_pyobj(&alpha,alpha_capi,"flex.flex.real_xspec_functions() 4th argument (alpha) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable ns */
+    ns = shape(k,0);
+    /* Processing variable admit */
+    admit_Dims[0]=ns;
+    capi_admit_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    capi_admit_tmp = array_from_pyobj(NPY_DOUBLE,admit_Dims,admit_Rank,capi_admit_intent,Py_None);
+    if (capi_admit_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting hidden `admit' of flex.flex.real_xspec_functions to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        admit = (double *)(PyArray_DATA(capi_admit_tmp));
+
+    /* Processing variable coh */
+    coh_Dims[0]=ns;
+    capi_coh_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    capi_coh_tmp = array_from_pyobj(NPY_DOUBLE,coh_Dims,coh_Rank,capi_coh_intent,Py_None);
+    if (capi_coh_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting hidden `coh' of flex.flex.real_xspec_functions to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        coh = (double *)(PyArray_DATA(capi_coh_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&ns,k,&te,&f,&alpha,admit,coh);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("NN",capi_admit_tmp,capi_coh_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    }  /*if (capi_coh_tmp == NULL) ... else of coh*/
+    /* End of cleaning variable coh */
+    }  /*if (capi_admit_tmp == NULL) ... else of admit*/
+    /* End of cleaning variable admit */
+    /* End of cleaning variable ns */
+    } /*if (f2py_success) of alpha*/
+    /* End of cleaning variable alpha */
+    } /*if (f2py_success) of f*/
+    /* End of cleaning variable f */
+    } /*if (f2py_success) of te*/
+    /* End of cleaning variable te */
+    if((PyObject *)capi_k_tmp!=k_capi) {
+        Py_XDECREF(capi_k_tmp); }
+    }  /*if (capi_k_tmp == NULL) ... else of k*/
+    /* End of cleaning variable k */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/************************ end of real_xspec_functions ************************/
+
+/************************* real_xspec_functions_batch *************************/
+static char doc_f2py_rout_flex_flex_real_xspec_functions_batch[] = "\
+admit,coh = real_xspec_functions_batch(k,te,f,alpha)\n\nWrapper for ``real_xspec_functions_batch``.\
+\n\nParameters\n----------\n"
+"k : input rank-1 array('d') with bounds (ns)\n"
+"te : input rank-1 array('d') with bounds (nt)\n"
+"f : input rank-1 array('d') with bounds (nt)\n"
+"alpha : input rank-1 array('d') with bounds (nt)\n"
+"\nReturns\n-------\n"
+"admit : rank-2 array('d') with bounds (nt,ns)\n"
+"coh : rank-2 array('d') with bounds (nt,ns)";
+/*  */
+static PyObject *f2py_rout_flex_flex_real_xspec_functions_batch(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,double*,double*,double*,double*,double*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int ns = 0;
+    int nt = 0;
+    double *k = NULL;
+    npy_intp k_Dims[1] = {-1};
+    const int k_Rank = 1;
+    PyArrayObject *capi_k_tmp = NULL;
+    int capi_k_intent = 0;
+    PyObject *k_capi = Py_None;
+    double *te = NULL;
+    npy_intp te_Dims[1] = {-1};
+    const int te_Rank = 1;
+    PyArrayObject *capi_te_tmp = NULL;
+    int capi_te_intent = 0;
+    PyObject *te_capi = Py_None;
+    double *f = NULL;
+    npy_intp f_Dims[1] = {-1};
+    const int f_Rank = 1;
+    PyArrayObject *capi_f_tmp = NULL;
+    int capi_f_intent = 0;
+    PyObject *f_capi = Py_None;
+    double *alpha = NULL;
+    npy_intp alpha_Dims[1] = {-1};
+    const int alpha_Rank = 1;
+    PyArrayObject *capi_alpha_tmp = NULL;
+    int capi_alpha_intent = 0;
+    PyObject *alpha_capi = Py_None;
+    double *admit = NULL;
+    npy_intp admit_Dims[2] = {-1, -1};
+    const int admit_Rank = 2;
+    PyArrayObject *capi_admit_tmp = NULL;
+    int capi_admit_intent = 0;
+    double *coh = NULL;
+    npy_intp coh_Dims[2] = {-1, -1};
+    const int coh_Rank = 2;
+    PyArrayObject *capi_coh_tmp = NULL;
+    int capi_coh_intent = 0;
+    static char *capi_kwlist[] = {"k","te","f","alpha",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOO|:flex.flex.real_xspec_functions_batch",\
+        capi_kwlist,&k_capi,&te_capi,&f_capi,&alpha_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable k */
+    ;
+    capi_k_intent |= F2PY_INTENT_IN;
+    capi_k_tmp = array_from_pyobj(NPY_DOUBLE,k_Dims,k_Rank,capi_k_intent,k_capi);
+    if (capi_k_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 1st argument `k' of flex.flex.real_xspec_functions_batch to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        k = (double *)(PyArray_DATA(capi_k_tmp));
+
+    /* Processing variable te */
+    ;
+    capi_te_intent |= F2PY_INTENT_IN;
+    capi_te_tmp = array_from_pyobj(NPY_DOUBLE,te_Dims,te_Rank,capi_te_intent,te_capi);
+    if (capi_te_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 2nd argument `te' of flex.flex.real_xspec_functions_batch to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        te = (double *)(PyArray_DATA(capi_te_tmp));
+
+    /* Processing variable ns */
+    ns = shape(k,0);
+    /* Processing variable nt */
+    nt = shape(te,0);
+    /* Processing variable f */
+    f_Dims[0]=nt;
+    capi_f_intent |= F2PY_INTENT_IN;
+    capi_f_tmp = array_from_pyobj(NPY_DOUBLE,f_Dims,f_Rank,capi_f_intent,f_capi);
+    if (capi_f_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 3rd argument `f' of flex.flex.real_xspec_functions_batch to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        f = (double *)(PyArray_DATA(capi_f_tmp));
+
+    /* Processing variable alpha */
+    alpha_Dims[0]=nt;
+    capi_alpha_intent |= F2PY_INTENT_IN;
+    capi_alpha_tmp = array_from_pyobj(NPY_DOUBLE,alpha_Dims,alpha_Rank,capi_alpha_intent,alpha_capi);
+    if (capi_alpha_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting 4th argument `alpha' of flex.flex.real_xspec_functions_batch to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        alpha = (double *)(PyArray_DATA(capi_alpha_tmp));
+
+    /* Processing variable admit */
+    admit_Dims[0]=nt,admit_Dims[1]=ns;
+    capi_admit_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    capi_admit_tmp = array_from_pyobj(NPY_DOUBLE,admit_Dims,admit_Rank,capi_admit_intent,Py_None);
+    if (capi_admit_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting hidden `admit' of flex.flex.real_xspec_functions_batch to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        admit = (double *)(PyArray_DATA(capi_admit_tmp));
+
+    /* Processing variable coh */
+    coh_Dims[0]=nt,coh_Dims[1]=ns;
+    capi_coh_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    capi_coh_tmp = array_from_pyobj(NPY_DOUBLE,coh_Dims,coh_Rank,capi_coh_intent,Py_None);
+    if (capi_coh_tmp == NULL) {
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        PyErr_SetString(exc ? exc : flex_error,"failed in converting hidden `coh' of flex.flex.real_xspec_functions_batch to C/Fortran array" );
+        npy_PyErr_ChainExceptionsCause(exc, val, tb);
+    } else {
+        coh = (double *)(PyArray_DATA(capi_coh_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&ns,&nt,k,te,f,alpha,admit,coh);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("NN",capi_admit_tmp,capi_coh_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    }  /*if (capi_coh_tmp == NULL) ... else of coh*/
+    /* End of cleaning variable coh */
+    }  /*if (capi_admit_tmp == NULL) ... else of admit*/
+    /* End of cleaning variable admit */
+    if((PyObject *)capi_alpha_tmp!=alpha_capi) {
+        Py_XDECREF(capi_alpha_tmp); }
+    }  /*if (capi_alpha_tmp == NULL) ... else of alpha*/
+    /* End of cleaning variable alpha */
+    if((PyObject *)capi_f_tmp!=f_capi) {
+        Py_XDECREF(capi_f_tmp); }
+    }  /*if (capi_f_tmp == NULL) ... else of f*/
+    /* End of cleaning variable f */
+    /* End of cleaning variable nt */
+    /* End of cleaning variable ns */
+    if((PyObject *)capi_te_tmp!=te_capi) {
+        Py_XDECREF(capi_te_tmp); }
+    }  /*if (capi_te_tmp == NULL) ... else of te*/
+    /* End of cleaning variable te */
+    if((PyObject *)capi_k_tmp!=k_capi) {
+        Py_XDECREF(capi_k_tmp); }
+    }  /*if (capi_k_tmp == NULL) ... else of k*/
+    /* End of cleaning variable k */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/********************* end of real_xspec_functions_batch *********************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+
+static FortranDataDef f2py_conf_flex_def[] = {
+  {"pi",0,{{-1}},NPY_DOUBLE},
+  {"g",0,{{-1}},NPY_DOUBLE},
+  {"em",0,{{-1}},NPY_DOUBLE},
+  {"nu",0,{{-1}},NPY_DOUBLE},
+  {"gc",0,{{-1}},NPY_DOUBLE},
+  {"rhoc",0,{{-1}},NPY_DOUBLE},
+  {"rhom",0,{{-1}},NPY_DOUBLE},
+  {"rhof",0,{{-1}},NPY_DOUBLE},
+  {"rhow",0,{{-1}},NPY_DOUBLE},
+  {"rhoa",0,{{-1}},NPY_DOUBLE},
+  {"wd",0,{{-1}},NPY_DOUBLE},
+  {"zc",0,{{-1}},NPY_DOUBLE},
+  {"boug",0,{{-1}},NPY_INT},
+  {NULL}
+};
+
+static void f2py_setup_conf_flex(char *pi,char *g,char *em,char *nu,char *gc,char *rhoc,char *rhom,char *rhof,char *rhow,char *rhoa,char *wd,char *zc,char *boug) {
+  int i_f2py=0;
+  f2py_conf_flex_def[i_f2py++].data = pi;
+  f2py_conf_flex_def[i_f2py++].data = g;
+  f2py_conf_flex_def[i_f2py++].data = em;
+  f2py_conf_flex_def[i_f2py++].data = nu;
+  f2py_conf_flex_def[i_f2py++].data = gc;
+  f2py_conf_flex_def[i_f2py++].data = rhoc;
+  f2py_conf_flex_def[i_f2py++].data = rhom;
+  f2py_conf_flex_def[i_f2py++].data = rhof;
+  f2py_conf_flex_def[i_f2py++].data = rhow;
+  f2py_conf_flex_def[i_f2py++].data = rhoa;
+  f2py_conf_flex_def[i_f2py++].data = wd;
+  f2py_conf_flex_def[i_f2py++].data = zc;
+  f2py_conf_flex_def[i_f2py++].data = boug;
+}
+extern void F_FUNC_US(f2pyinitconf_flex,F2PYINITCONF_FLEX)(void (*)(char*,char*,char*,char*,char*,char*,char*,char*,char*,char*,char*,char*,char*));
+static void f2py_init_conf_flex(void) {
+  F_FUNC_US(f2pyinitconf_flex,F2PYINITCONF_FLEX)(f2py_setup_conf_flex);
+}
+
+
+static FortranDataDef f2py_flex_def[] = {
+  {"flexfilter_top",-1,{{-1}},0,NULL,(void *)f2py_rout_flex_flex_flexfilter_top,doc_f2py_rout_flex_flex_flexfilter_top},
+  {"flexfilter_bot",-1,{{-1}},0,NULL,(void *)f2py_rout_flex_flex_flexfilter_bot,doc_f2py_rout_flex_flex_flexfilter_bot},
+  {"decon",-1,{{-1}},0,NULL,(void *)f2py_rout_flex_flex_decon,doc_f2py_rout_flex_flex_decon},
+  {"tr_func",-1,{{-1}},0,NULL,(void *)f2py_rout_flex_flex_tr_func,doc_f2py_rout_flex_flex_tr_func},
+  {"real_xspec_functions",-1,{{-1}},0,NULL,(void *)f2py_rout_flex_flex_real_xspec_functions,doc_f2py_rout_flex_flex_real_xspec_functions},
+  {"real_xspec_functions_batch",-1,{{-1}},0,NULL,(void *)f2py_rout_flex_flex_real_xspec_functions_batch,doc_f2py_rout_flex_flex_real_xspec_functions_batch},
+  {NULL}
+};
+
+static void f2py_setup_flex(char *flexfilter_top,char *flexfilter_bot,char *decon,char *tr_func,char *real_xspec_functions,char *real_xspec_functions_batch) {
+  int i_f2py=0;
+  f2py_flex_def[i_f2py++].data = flexfilter_top;
+  f2py_flex_def[i_f2py++].data = flexfilter_bot;
+  f2py_flex_def[i_f2py++].data = decon;
+  f2py_flex_def[i_f2py++].data = tr_func;
+  f2py_flex_def[i_f2py++].data = real_xspec_functions;
+  f2py_flex_def[i_f2py++].data = real_xspec_functions_batch;
+}
+extern void F_FUNC(f2pyinitflex,F2PYINITFLEX)(void (*)(char *,char *,char *,char *,char *,char *));
+static void f2py_init_flex(void) {
+  F_FUNC(f2pyinitflex,F2PYINITFLEX)(f2py_setup_flex);
+}
+
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+
+/*eof routine_defs*/
+    {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+    {NULL,NULL}
+};
+
+static struct PyModuleDef moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "flex",
+    NULL,
+    -1,
+    f2py_module_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC PyInit_flex(void) {
+    int i;
+    PyObject *m,*d, *s, *tmp;
+    m = flex_module = PyModule_Create(&moduledef);
+    Py_SET_TYPE(&PyFortran_Type, &PyType_Type);
+    import_array();
+    if (PyErr_Occurred())
+        {PyErr_SetString(PyExc_ImportError, "can't initialize module flex (failed to import numpy)"); return m;}
+    d = PyModule_GetDict(m);
+    s = PyUnicode_FromString("1.23.5");
+    PyDict_SetItemString(d, "__version__", s);
+    Py_DECREF(s);
+    s = PyUnicode_FromString(
+        "This module 'flex' is auto-generated with f2py (version:1.23.5).\nFunctions:\n"
+"Fortran 90/95 modules:\n""  conf_flex --- pi,g,em,nu,gc,rhoc,rhom,rhof,rhow,rhoa,wd,zc,boug""  flex --- flexfilter_top(),flexfilter_bot(),decon(),tr_func(),real_xspec_functions(),real_xspec_functions_batch()"".");
+    PyDict_SetItemString(d, "__doc__", s);
+    Py_DECREF(s);
+    s = PyUnicode_FromString("1.23.5");
+    PyDict_SetItemString(d, "__f2py_numpy_version__", s);
+    Py_DECREF(s);
+    flex_error = PyErr_NewException ("flex.error", NULL, NULL);
+    /*
+     * Store the error object inside the dict, so that it could get deallocated.
+     * (in practice, this is a module, so it likely will not and cannot.)
+     */
+    PyDict_SetItemString(d, "_flex_error", flex_error);
+    Py_DECREF(flex_error);
+    for(i=0;f2py_routine_defs[i].name!=NULL;i++) {
+        tmp = PyFortranObject_NewAsAttr(&f2py_routine_defs[i]);
+        PyDict_SetItemString(d, f2py_routine_defs[i].name, tmp);
+        Py_DECREF(tmp);
+    }
+
+
+
+
+
+
+/*eof initf2pywraphooks*/
+  PyDict_SetItemString(d, "flex", PyFortranObject_New(f2py_flex_def,f2py_init_flex));
+  PyDict_SetItemString(d, "conf_flex", PyFortranObject_New(f2py_conf_flex_def,f2py_init_conf_flex));
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+    if (! PyErr_Occurred())
+        on_exit(f2py_report_on_exit,(void*)"flex");
+#endif
+    return m;
+}
+#ifdef __cplusplus
+}
+#endif
@@ -33,6 +33,9 @@ extensions = ['sphinx.ext.autodoc', 'sphinx.ext.napoleon']
 
 autodoc_member_order = 'bysource'
 
+# Optional packages of plateflex.estimate_numpyro, not installed to build the docs
+autodoc_mock_imports = ['jax', 'numpyro']
+
 html_logo = '../plateflex/examples/picture/logo_plateflex_small.png'
 
 # Add any paths that contain templates here, relative to this directory.
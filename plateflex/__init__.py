@@ -59,13 +59,20 @@ Also, the following packages are required:
 
 - ``gfortran`` (https://gcc.gnu.org/wiki/GFortran) (or any Fortran compiler)
 - ``numpy`` (https://numpy.org)
-- ``pymc3`` (https://docs.pymc.io)
+- ``pymc3`` (https://docs.pymc.io) (3.11 or later)
 - ``seaborn`` (https://seaborn.pydata.org)
+- ``threadpoolctl`` (https://github.com/joblib/threadpoolctl)
 
 The following package is useful to draw outline of land areas:
 
 - ``scikit-image`` (https://scikit-image.org)
 
+The following packages are needed to run the MCMC chains with ``numpyro``
+(see :mod:`~plateflex.estimate_numpyro`):
+
+- ``jax`` (https://github.com/google/jax)
+- ``numpyro`` (https://num.pyro.ai)
+
 See below for full installation details. 
 
 Conda environment
@@ -76,7 +83,7 @@ where ``plateflex`` can be installed along with its dependencies.
 
 .. sourcecode:: bash
 
-   conda create -n pflex python=3.7 numpy pymc3 matplotlib seaborn scikit-image -c conda-forge
+   conda create -n pflex python=3.7 numpy "pymc3>=3.11" matplotlib seaborn threadpoolctl scikit-image -c conda-forge
 
 Activate the newly created environment:
 
@@ -59,6 +59,7 @@ which itself is a container of :class:`~plateflex.classes.Grid` objects
 
 # -*- coding: utf-8 -*-
 import sys
+import gc
 import numpy as np
 import plateflex
 from plateflex.cpwt import cpwt
@@ -1029,7 +1030,7 @@ class Project(object):
             **kwargs)
 
     def estimate_cell(self, cell=(0, 0), alph=False,
-                      atype='joint', returned=False):
+                      atype='joint', returned=False, checks=True):
         """
         Method to estimate the parameters of the flexural model at a single cell location
         of the input grids. The type of estimation performed is set by the project attribute 
@@ -1046,6 +1047,10 @@ class Project(object):
         :param atype: Whether to use the admittance ('admit'), coherence ('coh') or both ('joint')
         :type returned: bool, optional
         :param returned: Whether or not to return the estimates
+        :type checks: bool, optional
+        :param checks: Whether or not to compute the convergence checks of the 
+            MCMC chains (i.e., ``rhat`` and effective sample size). Only used if
+            ``inverse='bayes'``
 
         .. rubric:: Additional Attributes
 
@@ -1107,10 +1112,13 @@ class Project(object):
 
         elif self.inverse == 'bayes':
             trace, summary, map_estimate = estimate.bayes_estimate_cell(
-                self.k, adm, eadm, coh, ecoh, alph, atype)
+                self.k, adm, eadm, coh, ecoh, alph, atype, checks=checks)
 
-            # Return estimates if requested
+            # Return estimates if requested - release the posterior
+            # samples right away when looping over cells
             if returned:
+                del trace
+                gc.collect()
                 return summary, map_estimate
 
             # Otherwise store as object attributes
@@ -1215,6 +1223,10 @@ class Project(object):
                     'Parallel implementation does not work - ' +
                     'check again later'))
         else:
+            bayes_cells = []
+            summaries = []
+            map_estimates = []
+
             for i in _progressbar(range(0, self.nx-nn, nn), 'Computing: ', 10):
                 for j in range(0, self.ny-nn, nn):
 
@@ -1233,40 +1245,21 @@ class Project(object):
                     if self.inverse == 'bayes':
 
                         # Carry out calculations by calling the
-                        # ``estimate_cell`` method
+                        # ``estimate_cell`` method, skipping the convergence
+                        # checks of the MCMC chains, which convert the whole
+                        # trace, as the trace is dropped right away
                         summary, map_estimate = self.estimate_cell(
                             cell=cell,
                             alph=alph,
                             atype=atype,
-                            returned=True)
-
-                        # Extract estimates from summary and map_estimate
-                        res = estimate.get_bayes_estimates(
-                            summary, map_estimate)
-
-                        # Distribute the parameters back to space
-                        mean_Te = res[0]
-                        std_Te = res[1]
-                        MAP_Te = res[4]
-                        mean_F = res[5]
-                        std_F = res[6]
-                        MAP_F = res[9]
-                        if self.alph:
-                            mean_a = res[10]
-                            std_a = res[11]
-                            MAP_a = res[14]
+                            returned=True,
+                            checks=False)
 
-                        # Store values in smaller arrays
-                        mean_Te_grid[int(i/nn), int(j/nn)] = mean_Te
-                        MAP_Te_grid[int(i/nn), int(j/nn)] = MAP_Te
-                        std_Te_grid[int(i/nn), int(j/nn)] = std_Te
-                        mean_F_grid[int(i/nn), int(j/nn)] = mean_F
-                        MAP_F_grid[int(i/nn), int(j/nn)] = MAP_F
-                        std_F_grid[int(i/nn), int(j/nn)] = std_F
-                        if self.alph:
-                            mean_a_grid[int(i/nn), int(j/nn)] = mean_a
-                            MAP_a_grid[int(i/nn), int(j/nn)] = MAP_a
-                            std_a_grid[int(i/nn), int(j/nn)] = std_a
+                        # Keep summary and map_estimate - estimates are
+                        # extracted for all cells at once after the loop
+                        bayes_cells.append((int(i/nn), int(j/nn)))
+                        summaries.append(summary)
+                        map_estimates.append(map_estimate)
 
                     elif self.inverse == 'L2':
 
@@ -1303,6 +1296,25 @@ class Project(object):
                             mean_a_grid[int(i/nn), int(j/nn)] = mean_a
                             std_a_grid[int(i/nn), int(j/nn)] = std_a
 
+            if self.inverse == 'bayes' and bayes_cells:
+
+                # Extract estimates from all summaries and map_estimates
+                res = estimate.get_bayes_estimates_batch(
+                    summaries, map_estimates)
+
+                # Distribute the parameters back to space
+                ind = tuple(np.array(bayes_cells).T)
+                mean_Te_grid[ind] = res[0]
+                std_Te_grid[ind] = res[1]
+                MAP_Te_grid[ind] = res[4]
+                mean_F_grid[ind] = res[5]
+                std_F_grid[ind] = res[6]
+                MAP_F_grid[ind] = res[9]
+                if self.alph:
+                    mean_a_grid[ind] = res[10]
+                    std_a_grid[ind] = res[11]
+                    MAP_a_grid[ind] = res[14]
+
         if self.mask is not None:
             self.new_mask_grid = new_mask_grid
 
@@ -1395,10 +1407,10 @@ class Project(object):
 
                 # Extract MAP from map_estimate object
                 elif est == 'MAP':
-                    mte = np.float(self.map_estimate['Te'])
-                    mF = np.float(self.map_estimate['F'])
+                    mte = self.map_estimate['Te'].item()
+                    mF = self.map_estimate['F'].item()
                     if 'alpha' in self.map_estimate:
-                        ma = np.float(self.map_estimate['alpha'])
+                        ma = self.map_estimate['alpha'].item()
                 else:
                     raise(
                         Exception(
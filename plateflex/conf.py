@@ -82,6 +82,13 @@ from MCMC chains using :class:`pymc3`. Default values in parentheses.
     Number of tuning (i.e., burn-in) samples (500)
 ``cores`` : int
     Number of cores (i.e., parallel MCMC chains) (4)
+``target_accept`` : float
+    Target acceptance rate of the NUTS sampler (0.9). Increase 
+    (e.g., 0.95-0.99) only if divergences appear
+``floatX`` : str
+    Floating-point precision of the ``theano`` graphs used for
+    sampling ('float32'). Set to 'float64' for double precision. 
+    The MAP estimate is always found in double precision
 
 """
 
@@ -90,3 +97,5 @@ global samples, tunes
 draws = 500
 tunes = 500
 cores = 4
+target_accept = 0.9
+floatX = 'float32'
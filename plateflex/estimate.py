@@ -27,6 +27,8 @@ This :mod:`~plateflex` module contains the following functions:
   of the elastic plate model using a probabilistic Bayesian inference method.  
 - :func:`~plateflex.estimate.get_bayes_estimates`: 
   Explore the output of sampling the :mod:`~pymc` model
+- :func:`~plateflex.estimate.get_bayes_estimates_batch`: 
+  Explore the output of sampling the :mod:`~pymc` model for several cells at once
 - :func:`~plateflex.estimate.L2_estimate_cell`: 
   Set up non-linear curve fitting to estimate the parameters
   of the elastic plate model using non-linear least-squares from the 
@@ -35,11 +37,15 @@ This :mod:`~plateflex` module contains the following functions:
   Explore the output the non-linear inversion
 - :func:`~plateflex.estimate.real_xspec_functions`: 
   Calculate the analytical admittance and coherence functions. 
+- :func:`~plateflex.estimate.tt_real_xspec_functions`: 
+  Build the analytical admittance and coherence functions as ``theano`` 
+  tensor expressions.
 
-Internal functions are also available to define predicted admittance and coherence data
-with ``theano`` decorators to be incorporated as ``pymc`` variables. These functions are
-used within :class:`~plateflex.classes.Project` methods as with :mod:`~plateflex.plotting`
-functions.
+The ``theano`` expressions define predicted admittance and coherence data that are
+incorporated as ``pymc`` variables, such that the whole model stays within the compiled
+``theano`` graph and gradient-based samplers (i.e., NUTS) can be used for all parameters.
+These functions are used within :class:`~plateflex.classes.Project` methods as with
+:mod:`~plateflex.plotting` functions.
 
 .. note::
 
@@ -52,17 +58,26 @@ functions.
 """
 
 # -*- coding: utf-8 -*-
+import sys
+import functools
+import multiprocessing as mp
 import numpy as np
 import pymc3 as pm
+import theano
 from plateflex.flex import flex
 from plateflex import conf as cf
-from theano.compile.ops import as_op
+from plateflex import flexure
 import theano.tensor as tt
-from scipy.optimize import curve_fit
+from pymc3.blocking import ArrayOrdering, DictToArrayBijection
+from pymc3.step_methods.hmc.quadpotential import QuadPotentialDiagAdapt
+from pymc3.step_methods.hmc.quadpotential import QuadPotentialFullAdapt
+from scipy.optimize import curve_fit, minimize
+from threadpoolctl import threadpool_limits
 import pandas as pd
 
 
-def bayes_estimate_cell(k, adm, eadm, coh, ecoh, alph=False, atype='joint'):
+def bayes_estimate_cell(k, adm, eadm, coh, ecoh, alph=False, atype='joint',
+                        checks=True):
     """
     Function to estimate the parameters of the flexural model at a single cell location
     of the input grids. 
@@ -81,6 +96,9 @@ def bayes_estimate_cell(k, adm, eadm, coh, ecoh, alph=False, atype='joint'):
     :param alph: Whether or not to estimate parameter ``alpha``
     :type atype: str, optional
     :param atype: Whether to use the admittance (`'admit'`), coherence (`'coh'`) or both (`'joint'`)
+    :type checks: bool, optional
+    :param checks: Whether or not to compute the convergence checks of the 
+        MCMC chains (i.e., ``rhat`` and effective sample size) after sampling
 
     :return:
         (tuple): Tuple containing:
@@ -93,74 +111,264 @@ def bayes_estimate_cell(k, adm, eadm, coh, ecoh, alph=False, atype='joint'):
 
     """
 
+    # Data for this cell
+    data = {'k': k}
+    data.update(flexure.flex_params())
+    if atype == 'admit':
+        data.update({'adm': adm, 'eadm': eadm})
+    elif atype == 'coh':
+        data.update({'coh': coh, 'ecoh': ecoh})
+    elif atype == 'joint':
+        data.update({'joint': np.concatenate([adm, coh]),
+                     'ejoint': np.concatenate([eadm, ecoh])})
+
+    # Build ``theano`` graphs with the precision set in ``conf``
+    with theano.config.change_flags(floatX=cf.floatX):
+
+        # Get Max a porteriori estimate in double precision, as the
+        # L-BFGS-B optimization stops early on the rounding noise of a
+        # single precision log-posterior
+        with theano.config.change_flags(floatX='float64'):
+            with _get_model(alph, atype, len(k), theano.config.floatX):
+                pm.set_data(data)
+            map_estimate = _find_MAP(alph, atype, len(k),
+                                     theano.config.floatX)
+
+        # Get cached model for this type of analysis and floating-point
+        # precision
+        model = _get_model(alph, atype, len(k), theano.config.floatX)
+
+        # Cast data and starting point to the precision of the graph
+        data = {key: pm.floatX(val) for key, val in data.items()}
+        start = {key: pm.floatX(val) for key, val in map_estimate.items()}
+
+        with model:
+
+            # Update data containers
+            pm.set_data(data)
+
+            # Get cached NUTS step for this model and reset its adaptation
+            # of the step size and mass matrix, which are tuned again for
+            # this cell
+            step = _get_step(alph, atype, len(k), theano.config.floatX,
+                             cf.target_accept)
+            step.reset_tuning()
+
+            # Use 'fork' context on macOS, where the default context
+            # re-imports theano in every worker process
+            if sys.platform == 'darwin':
+                mp_ctx = mp.get_context('fork')
+            else:
+                mp_ctx = None
+
+            # Sample the Posterior distribution, starting from the MAP
+            # estimate. BLAS is limited to a single thread per chain to
+            # avoid oversubscription, and the pointwise log-likelihood (one
+            # value per observation and sample) is not stored for the
+            # convergence checks
+            with threadpool_limits(limits=1):
+                trace = pm.sample(cf.draws, tune=cf.tunes, cores=cf.cores,
+                                  step=step, start=start, mp_ctx=mp_ctx,
+                                  return_inferencedata=False,
+                                  compute_convergence_checks=checks,
+                                  idata_kwargs={'log_likelihood': False})
+
+    # Get Summary
+    varnames = ['Te', 'F']
+    if alph:
+        varnames.append('alpha')
+    summary = flexure.bayes_summary(trace, varnames)
+
+    return trace, summary, map_estimate
+
+
+def _build_model(alph, atype, nk):
+    """
+    Build the ``pymc`` model for the type of analysis, with data containers
+    of length ``nk`` that are updated for each cell using :func:`~pymc3.set_data`.
+    """
+
+    model, xspec = _common_model(alph, nk)
+
+    # Select type of analysis to perform
+    if atype == 'admit':
+        _attach_admit(model, xspec, nk)
+    elif atype == 'coh':
+        _attach_coh(model, xspec, nk)
+    elif atype == 'joint':
+        _attach_joint(model, xspec, nk)
+
+    return model
+
+
+def _common_model(alph, nk):
+    """
+    Build the part of the ``pymc`` model common to all types of analysis:
+    data containers for the wavenumbers and flexural model parameters, and
+    prior distributions. Also returns a function that builds the expected
+    admittance and/or coherence from those variables.
+    """
+
     with pm.Model() as model:
 
-        # k is an array - needs to be passed as distribution
-        k_obs = pm.Normal('k', mu=k, sigma=1., observed=k)
+        # Data containers for wavenumbers and flexural model parameters
+        k = pm.Data('k', np.ones(nk))
+        params = {key: pm.Data(key, val)
+                  for key, val in flexure.flex_params().items()}
 
-        # Prior distributions
+        # Prior distributions - a weakly informative Beta distribution on F
+        # avoids a hard upper bound near F = 1
         Te = pm.Uniform('Te', lower=1., upper=250.)
-        F = pm.Uniform('F', lower=0., upper=0.9999)
+        F = pm.Beta('F', alpha=1.1, beta=1.1)
 
         if alph:
 
             # Prior distribution of `alpha`
             alpha = pm.Uniform('alpha', lower=0., upper=np.pi)
-            admit_exp, coh_exp = real_xspec_functions_alpha(
-                k_obs, Te, F, alpha)
 
         else:
-            admit_exp, coh_exp = real_xspec_functions_noalpha(k_obs, Te, F)
+            alpha = np.pi/2.
+
+    xspec = functools.partial(
+        tt_real_xspec_functions, k, Te, F, alpha, params=params)
+
+    return model, xspec
+
+
+def _attach_admit(model, xspec, nk):
+    """
+    Attach the likelihood of the admittance observations to ``model``.
+    """
 
-        # Select type of analysis to perform
-        if atype == 'admit':
+    with model:
 
-            # Uncertainty as observed distribution
-            sigma = pm.Normal('sigma', mu=eadm, sigma=1.,
-                              observed=eadm)
+        # Observations and uncertainties
+        adm = pm.Data('adm', np.ones(nk))
+        eadm = pm.Data('eadm', np.ones(nk))
 
-            # Likelihood of observations
-            admit_obs = pm.Normal('admit_obs', mu=admit_exp,
-                                  sigma=sigma, observed=adm)
+        # Expected values
+        admit_exp = xspec(output='admit')
 
-        elif atype == 'coh':
+        # Likelihood of observations
+        pm.Normal('admit_obs', mu=admit_exp, sigma=eadm, observed=adm)
 
-            # Uncertainty as observed distribution
-            sigma = pm.Normal('sigma', mu=ecoh, sigma=1.,
-                              observed=ecoh)
 
-            # Likelihood of observations
-            coh_obs = pm.Normal('coh_obs', mu=coh_exp,
-                                sigma=sigma, observed=coh)
+def _attach_coh(model, xspec, nk):
+    """
+    Attach the likelihood of the coherence observations to ``model``.
+    """
 
-        elif atype == 'joint':
+    with model:
 
-            # Define uncertainty as concatenated arrays
-            ejoint = np.array([eadm, ecoh]).flatten()
+        # Observations and uncertainties
+        coh = pm.Data('coh', np.ones(nk))
+        ecoh = pm.Data('ecoh', np.ones(nk))
 
-            # Define array of observations and expected values as
-            # concatenated arrays
-            joint = np.array([adm, coh]).flatten()
-            joint_exp = tt.flatten(tt.concatenate([admit_exp, coh_exp]))
+        # Expected values
+        coh_exp = xspec(output='coh')
 
-            # Uncertainty as observed distribution
-            sigma = pm.Normal('sigma', mu=ejoint, sigma=1.,
-                              observed=ejoint)
+        # Likelihood of observations
+        pm.Normal('coh_obs', mu=coh_exp, sigma=ecoh, observed=coh)
 
-            # Likelihood of observations
-            joint_obs = pm.Normal('admit_coh_obs', mu=joint_exp,
-                                  sigma=sigma, observed=joint)
 
-        # Sample the Posterior distribution
-        trace = pm.sample(cf.draws, tune=cf.tunes, cores=cf.cores)
+def _attach_joint(model, xspec, nk):
+    """
+    Attach the likelihood of the joint admittance and coherence
+    observations to ``model``.
+    """
 
-        # Get Max a porteriori estimate
-        map_estimate = pm.find_MAP()
+    with model:
 
-        # Get Summary
-        summary = pm.summary(trace)
+        # Concatenated arrays of observations and uncertainties
+        joint = pm.Data('joint', np.ones(2*nk))
+        ejoint = pm.Data('ejoint', np.ones(2*nk))
 
-    return trace, summary, map_estimate
+        # Expected values as concatenated arrays
+        admit_exp, coh_exp = xspec()
+        joint_exp = tt.concatenate([admit_exp, coh_exp])
+
+        # Likelihood of observations
+        pm.Normal('admit_coh_obs', mu=joint_exp, sigma=ejoint,
+                  observed=joint)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_model(alph, atype, nk, floatX):
+    """
+    Return the ``pymc`` model built by :func:`~plateflex.estimate._build_model`,
+    cached such that the model is reused when looping over cells. ``floatX``
+    is only part of the cache key, such that a model is built for each 
+    precision of ``theano.config.floatX``. The compiled ``theano`` 
+    functions are cached separately by :func:`~plateflex.estimate._get_map_functions`
+    and :func:`~plateflex.estimate._get_step`.
+    """
+
+    return _build_model(alph, atype, nk)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_map_functions(alph, atype, nk, floatX):
+    """
+    Return the compiled ``theano`` functions of the cached model needed to find
+    the MAP estimate, as done by :func:`~pymc3.find_MAP`: the mapping between
+    points and arrays of free variables, the log-posterior and its gradient 
+    (both without the Jacobian of the transforms) as functions of that array, 
+    and the function returning all unobserved variables.
+    """
+
+    model = _get_model(alph, atype, nk, floatX)
+
+    bij = DictToArrayBijection(ArrayOrdering(model.cont_vars), model.test_point)
+    logp = bij.mapf(model.fastlogp_nojac)
+    dlogp = bij.mapf(model.fastdlogp_nojac(model.cont_vars))
+    point = model.fastfn(model.unobserved_RVs)
+
+    return bij, logp, dlogp, point
+
+
+def _find_MAP(alph, atype, nk, floatX):
+    """
+    Return the Maximum a Posteriori (MAP) estimate of the cached model for 
+    its current data, equivalent to :func:`~pymc3.find_MAP` with the default
+    L-BFGS-B method but without compiling the model functions at each call.
+    """
+
+    model = _get_model(alph, atype, nk, floatX)
+    bij, logp, dlogp, point = _get_map_functions(alph, atype, nk, floatX)
+
+    def cost(x):
+        return np.float64(-logp(x)), -dlogp(x).astype(np.float64)
+
+    res = minimize(cost, bij.map(model.test_point), jac=True,
+                   method='L-BFGS-B', options={'maxfun': 5000})
+
+    return {var.name: value for var, value in
+            zip(model.unobserved_RVs, point(bij.rmap(res.x)))}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_step(alph, atype, nk, floatX, target_accept):
+    """
+    Return the NUTS step method of the cached model, cached such that its 
+    compiled ``theano`` functions are reused when looping over cells. The
+    mass matrix is adapted as with the `'jitter+adapt_diag'` initialization 
+    of :func:`~pymc3.sample`, or `'jitter+adapt_full'` to account for the 
+    correlation between Te, F and alpha. The adaptation must be reset with
+    ``reset_tuning()`` before sampling each cell.
+    """
+
+    model = _get_model(alph, atype, nk, floatX)
+
+    n = model.ndim
+    if alph:
+        potential = QuadPotentialFullAdapt(
+            n, pm.floatX(np.zeros(n)), pm.floatX(np.eye(n)), 10)
+    else:
+        potential = QuadPotentialDiagAdapt(
+            n, pm.floatX(np.zeros(n)), pm.floatX(np.ones(n)), 10)
+
+    return pm.NUTS(model=model, potential=potential,
+                   target_accept=target_accept)
 
 
 def get_bayes_estimates(summary, map_estimate):
@@ -192,30 +400,27 @@ def get_bayes_estimates(summary, map_estimate):
 
     """
 
-    mean_a = None
+    stats = summary.to_dict('index')
 
-    # Go through all estimates
-    for index, row in summary.iterrows():
-        if index == 'Te':
-            mean_te = row['mean']
-            std_te = row['sd']
-            C2_5_te = row['hpd_2.5']
-            C97_5_te = row['hpd_97.5']
-            MAP_te = np.float(map_estimate['Te'])
-        elif index == 'F':
-            mean_F = row['mean']
-            std_F = row['sd']
-            C2_5_F = row['hpd_2.5']
-            C97_5_F = row['hpd_97.5']
-            MAP_F = np.float(map_estimate['F'])
-        elif index == 'alpha':
-            mean_a = row['mean']
-            std_a = row['sd']
-            C2_5_a = row['hpd_2.5']
-            C97_5_a = row['hpd_97.5']
-            MAP_a = np.float(map_estimate['alpha'])
+    mean_te = stats['Te']['mean']
+    std_te = stats['Te']['sd']
+    C2_5_te = stats['Te']['hpd_2.5']
+    C97_5_te = stats['Te']['hpd_97.5']
+    MAP_te = map_estimate['Te'].item()
+
+    mean_F = stats['F']['mean']
+    std_F = stats['F']['sd']
+    C2_5_F = stats['F']['hpd_2.5']
+    C97_5_F = stats['F']['hpd_97.5']
+    MAP_F = map_estimate['F'].item()
+
+    if 'alpha' in stats:
+        mean_a = stats['alpha']['mean']
+        std_a = stats['alpha']['sd']
+        C2_5_a = stats['alpha']['hpd_2.5']
+        C97_5_a = stats['alpha']['hpd_97.5']
+        MAP_a = map_estimate['alpha'].item()
 
-    if mean_a is not None:
         return mean_te, std_te, C2_5_te, C97_5_te, MAP_te, \
             mean_F, std_F, C2_5_F, C97_5_F, MAP_F, \
             mean_a, std_a, C2_5_a, C97_5_a, MAP_a
@@ -224,6 +429,43 @@ def get_bayes_estimates(summary, map_estimate):
             mean_F, std_F, C2_5_F, C97_5_F, MAP_F
 
 
+def get_bayes_estimates_batch(summaries, map_estimates):
+    """
+    Returns digestible estimates from the Posterior distributions of
+    several cells at once.
+
+    :type summaries: list
+    :param summaries: List of :class:`~pandas.core.frame.DataFrame` with 
+        summary statistics from Posterior distributions
+    :type map_estimates: list
+    :param map_estimates: List of dict containers for Maximum a Posteriori 
+        (MAP) estimates
+
+    :return: 
+        (tuple): tuple of :class:`~numpy.ndarray` (shape: ``len(summaries)``), 
+        in the same order as :func:`~plateflex.estimate.get_bayes_estimates`
+
+    """
+
+    varnames = ['Te', 'F']
+    if 'alpha' in summaries[0].index:
+        varnames.append('alpha')
+    columns = ['mean', 'sd', 'hpd_2.5', 'hpd_97.5']
+
+    # Collect statistics as arrays of shape (len(summaries), len(varnames), ...)
+    stats = np.asarray([summary.loc[varnames, columns].values
+                        for summary in summaries])
+    maps = np.asarray([[map_estimate[var].item() for var in varnames]
+                       for map_estimate in map_estimates])
+
+    estimates = []
+    for i in range(len(varnames)):
+        estimates.extend(stats[:, i, j] for j in range(len(columns)))
+        estimates.append(maps[:, i])
+
+    return tuple(estimates)
+
+
 def L2_estimate_cell(k, adm, eadm, coh, ecoh, alph=False, atype='joint'):
     """
     Function to estimate the parameters of the flexural model at a single cell location
@@ -262,7 +504,7 @@ def L2_estimate_cell(k, adm, eadm, coh, ecoh, alph=False, atype='joint'):
     def pred_joint(k, Te, F, alpha):
 
         admittance, coherence = flex.real_xspec_functions(k, Te, F, alpha)
-        return np.array([admittance, coherence]).flatten()
+        return np.concatenate([admittance, coherence])
 
     if atype == 'admit':
         y_obs = adm
@@ -347,8 +589,8 @@ def L2_estimate_cell(k, adm, eadm, coh, ecoh, alph=False, atype='joint'):
                            / y_err**2)/(len(pred)-len(p1fit))
 
     elif atype == 'joint':
-        y_obs = np.array([adm, coh]).flatten()
-        y_err = np.array([eadm, ecoh]).flatten()
+        y_obs = np.concatenate([adm, coh])
+        y_err = np.concatenate([eadm, ecoh])
         if alph:
             theta0 = np.array([20., 0.5, np.pi/2.])
 
@@ -451,50 +693,76 @@ def get_L2_estimates(summary):
 def real_xspec_functions(k, Te, F, alpha=np.pi/2.):
     """
     Calculate analytical expressions for the real component of admittance
-    and coherence functions. 
+    and coherence functions. If any of ``Te``, ``F`` or ``alpha`` is an array,
+    the functions are calculated at once for all (broadcast) parameter values.
+    As in the probabilistic models, the load ratio F/(1-F) is bounded by 1.e4
+    as F approaches 1.
 
     :type k: np.ndarray
     :param k: Wavenumbers (rad/m)
-    :type Te: float
+    :type Te: float or np.ndarray
     :param Te: Effective elastic thickness (km)
-    :type F: float
+    :type F: float or np.ndarray
     :param F: Subsurface-to-surface load ratio [0, 1[
-    :type alpha: float, optional
+    :type alpha: float or np.ndarray, optional
     :param alpha: Phase difference between initial applied loads (rad)
 
     :return:  
         (tuple): tuple containing:
-            * admittance (:class:`~numpy.ndarray`): Real admittance function (shape: ``len(k)``)
-            * coherence (:class:`~numpy.ndarray`): Coherence functions (shape: ``len(k)``)
+            * admittance (:class:`~numpy.ndarray`): Real admittance function 
+              (shape: ``len(k)``, or ``(n, len(k))`` for arrays of parameters)
+            * coherence (:class:`~numpy.ndarray`): Coherence functions 
+              (shape: ``len(k)``, or ``(n, len(k))`` for arrays of parameters)
+
+        where ``n`` is the length of ``Te``, ``F`` and ``alpha`` once
+        broadcast against each other (e.g., ``len(F)`` for a scalar ``Te``
+        and ``alpha``).
 
     """
 
-    admittance, coherence = flex.real_xspec_functions(k, Te, F, alpha)
+    if np.ndim(Te) > 0 or np.ndim(F) > 0 or np.ndim(alpha) > 0:
+        Te, F, alpha = np.broadcast_arrays(
+            np.atleast_1d(Te), np.atleast_1d(F), np.atleast_1d(alpha))
+        admittance, coherence = flex.real_xspec_functions_batch(
+            k, Te, F, alpha)
+
+    else:
+        admittance, coherence = flex.real_xspec_functions(k, Te, F, alpha)
 
     return admittance, coherence
 
 
-@as_op(itypes=[tt.dvector, tt.dscalar, tt.dscalar],
-       otypes=[tt.dvector, tt.dvector])
-def real_xspec_functions_noalpha(k, Te, F):
-    """
-    Calculate analytical expressions for the real component of admittance, 
-    coherency and coherence functions. 
+def tt_real_xspec_functions(k, Te, F, alpha=np.pi/2., params=None,
+                            output='both'):
     """
+    Build analytical expressions for the real component of admittance
+    and coherence functions as ``theano`` tensor expressions, using
+    :func:`~plateflex.flexure.real_xspec_functions` with :mod:`~theano.tensor`.
 
-    adm, coh = real_xspec_functions(k, Te, F)
+    :type k: :class:`~theano.tensor.TensorVariable` or :class:`~numpy.ndarray`
+    :param k: Wavenumbers (rad/m)
+    :type Te: :class:`~theano.tensor.TensorVariable`
+    :param Te: Effective elastic thickness (km)
+    :type F: :class:`~theano.tensor.TensorVariable`
+    :param F: Subsurface-to-surface load ratio [0, 1[
+    :type alpha: :class:`~theano.tensor.TensorVariable` or float, optional
+    :param alpha: Phase difference between initial applied loads (rad)
+    :type params: dict, optional
+    :param params: Flexural model parameters (``A``, ``rhof``, ``rhoc``, ``rhom``, 
+        ``wd``, ``zc``) as floats or ``theano`` variables. Defaults to the values
+        currently set in ``conf_flex``
+    :type output: str, optional
+    :param output: Whether to build the admittance (`'admit'`), coherence (`'coh'`)
+        or both (`'both'`) functions
 
-    return adm, coh
+    :return:  
+        (tuple): tuple containing:
+            * admittance (:class:`~theano.tensor.TensorVariable`): Real admittance function
+            * coherence (:class:`~theano.tensor.TensorVariable`): Coherence function
 
+        Only one of the two is returned if ``output`` is `'admit'` or `'coh'`.
 
-@as_op(itypes=[tt.dvector, tt.dscalar, tt.dscalar, tt.dscalar],
-       otypes=[tt.dvector, tt.dvector])
-def real_xspec_functions_alpha(k, Te, F, alpha):
-    """
-    Calculate analytical expressions for the real component of admittance, 
-    coherency and coherence functions. 
     """
 
-    adm, coh = real_xspec_functions(k, Te, F, alpha)
-
-    return adm, coh
+    return flexure.real_xspec_functions(tt, k, Te, F, alpha, params=params,
+                                        output=output)
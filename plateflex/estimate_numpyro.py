@@ -0,0 +1,256 @@
+# Copyright 2019 Pascal Audet
+#
+# This file is part of PlateFlex.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+This :mod:`~plateflex` module contains an alternative implementation of the
+probabilistic Bayesian inference method using :mod:`~numpyro` and :mod:`~jax`:
+
+- :func:`~plateflex.estimate_numpyro.bayes_estimate_cell`: 
+  Set up :mod:`~numpyro` model and estimate the parameters
+  of the elastic plate model using a probabilistic Bayesian inference method.  
+- :func:`~plateflex.estimate_numpyro.jnp_real_xspec_functions`: 
+  Calculate the analytical admittance and coherence functions with :mod:`~jax.numpy`.
+
+All MCMC chains are run simultaneously (vectorized) on a single device, which can
+be a GPU if one is available to :mod:`~jax`. The model, sampler and MAP objective
+are cached for each type of analysis, such that they are compiled for the first
+cell only and reused when looping over cells. The output of 
+:func:`~plateflex.estimate_numpyro.bayes_estimate_cell` can be digested with
+:func:`~plateflex.estimate.get_bayes_estimates`.
+
+.. note::
+
+    This module requires the optional packages ``jax`` and ``numpyro``
+    and is not imported with :mod:`~plateflex`. 
+
+"""
+
+# -*- coding: utf-8 -*-
+import functools
+import numpy as np
+import jax.numpy as jnp
+from jax import random, jit, value_and_grad
+import numpyro
+import numpyro.distributions as dist
+from numpyro import handlers
+from numpyro.distributions.transforms import biject_to
+from numpyro.infer import MCMC, NUTS
+from numpyro.infer.util import log_density
+from scipy.optimize import minimize
+from plateflex import conf as cf
+from plateflex import flexure
+
+
+def bayes_estimate_cell(k, adm, eadm, coh, ecoh, alph=False, atype='joint'):
+    """
+    Function to estimate the parameters of the flexural model at a single cell location
+    of the input grids using :mod:`~numpyro`. 
+
+    :type k: :class:`~numpy.ndarray`
+    :param k: 1D array of wavenumbers
+    :type adm: :class:`~numpy.ndarray`
+    :param adm: 1D array of wavelet admittance
+    :type eadm: :class:`~numpy.ndarray`
+    :param eadm: 1D array of error on wavelet admittance
+    :type coh: :class:`~numpy.ndarray`
+    :param coh: 1D array of wavelet coherence
+    :type ecoh: :class:`~numpy.ndarray`
+    :param ecoh: 1D array of error on wavelet coherence
+    :type alph: bool, optional
+    :param alph: Whether or not to estimate parameter ``alpha``
+    :type atype: str, optional
+    :param atype: Whether to use the admittance (`'admit'`), coherence (`'coh'`) or both (`'joint'`)
+
+    :return:
+        (tuple): Tuple containing:
+            * ``trace`` : dict
+                Posterior samples from the MCMC chains (all chains concatenated)
+            * ``summary`` : :class:`~pandas.core.frame.DataFrame`
+                Summary statistics from Posterior distributions
+            * ``map_estimate`` : dict
+                Container for Maximum a Posteriori (MAP) estimates
+
+    """
+
+    # Select type of analysis to perform
+    if atype == 'admit':
+        obs = adm
+        sigma = eadm
+    elif atype == 'coh':
+        obs = coh
+        sigma = ecoh
+    elif atype == 'joint':
+        obs = np.concatenate([adm, coh])
+        sigma = np.concatenate([eadm, ecoh])
+
+    # Sample the Posterior distribution with the cached sampler for this 
+    # type of analysis and number of data
+    mcmc = _get_mcmc(alph, atype, len(obs), cf.draws, cf.tunes, cf.cores)
+    mcmc.run(random.PRNGKey(np.random.randint(2**31)), k, obs, sigma,
+             extra_fields=('potential_energy',))
+
+    # Get samples as arrays
+    trace = {key: np.asarray(val) for key, val in mcmc.get_samples().items()}
+
+    # Get Max a posteriori estimate, starting from the sample with the
+    # lowest potential energy
+    energy = np.asarray(mcmc.get_extra_fields()['potential_energy'])
+    start = {key: val[np.argmin(energy)] for key, val in trace.items()}
+    map_estimate = _map_estimate(alph, atype, (k, obs, sigma), start)
+
+    # Get Summary
+    varnames = ['Te', 'F']
+    if alph:
+        varnames.append('alpha')
+    summary = flexure.bayes_summary(trace, varnames)
+
+    return trace, summary, map_estimate
+
+
+def jnp_real_xspec_functions(k, Te, F, alpha=np.pi/2.):
+    """
+    Calculate analytical expressions for the real component of admittance
+    and coherence functions using :mod:`~jax.numpy`, with 
+    :func:`~plateflex.flexure.real_xspec_functions` and the model 
+    parameters currently set in ``conf_flex``.
+
+    :type k: np.ndarray
+    :param k: Wavenumbers (rad/m)
+    :type Te: float
+    :param Te: Effective elastic thickness (km)
+    :type F: float
+    :param F: Subsurface-to-surface load ratio [0, 1[
+    :type alpha: float, optional
+    :param alpha: Phase difference between initial applied loads (rad)
+
+    :return:  
+        (tuple): tuple containing:
+            * admittance (:class:`~jax.numpy.ndarray`): Real admittance function (shape: ``len(k)``)
+            * coherence (:class:`~jax.numpy.ndarray`): Coherence functions (shape: ``len(k)``)
+
+    """
+
+    return flexure.real_xspec_functions(jnp, k, Te, F, alpha)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_model(alph, atype):
+    """
+    Return the ``numpyro`` model for the type of analysis, as a function of
+    the wavenumbers, observations and their uncertainties. The model is 
+    cached such that ``jax`` reuses the functions compiled from it when 
+    looping over cells.
+    """
+
+    def model(k, obs, sigma):
+
+        # Prior distributions - a weakly informative Beta distribution on F
+        # avoids a hard upper bound near F = 1
+        Te = numpyro.sample('Te', dist.Uniform(1., 250.))
+        F = numpyro.sample('F', dist.Beta(1.1, 1.1))
+
+        if alph:
+
+            # Prior distribution of `alpha`
+            alpha = numpyro.sample('alpha', dist.Uniform(0., np.pi))
+
+        else:
+            alpha = np.pi/2.
+
+        admit_exp, coh_exp = jnp_real_xspec_functions(k, Te, F, alpha)
+
+        if atype == 'admit':
+            mu = admit_exp
+        elif atype == 'coh':
+            mu = coh_exp
+        elif atype == 'joint':
+            mu = jnp.concatenate([admit_exp, coh_exp])
+
+        # Likelihood of observations
+        numpyro.sample('obs', dist.Normal(mu, sigma), obs=obs)
+
+    return model
+
+
+@functools.lru_cache(maxsize=None)
+def _get_mcmc(alph, atype, nobs, draws, tunes, cores):
+    """
+    Return the MCMC sampler of the cached model, with all chains vectorized
+    and a dense mass matrix to account for the correlation between Te, F 
+    and alpha. The model arguments are compiled as dynamic arguments, such
+    that the sampler is compiled once and reused for all cells with ``nobs``
+    observations. ``nobs`` is only part of the cache key.
+    """
+
+    return MCMC(NUTS(_get_model(alph, atype), dense_mass=alph),
+                num_warmup=tunes, num_samples=draws, num_chains=cores,
+                chain_method='vectorized', progress_bar=False,
+                jit_model_args=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_map_functions(alph, atype):
+    """
+    Return the names of the variables of the cached model, the transforms 
+    from unconstrained space to their support, and the compiled negative 
+    log-posterior density (without the Jacobian of the transforms) and its 
+    gradient, as a function of the unconstrained variables and the model 
+    arguments.
+    """
+
+    model = _get_model(alph, atype)
+
+    # Transforms from unconstrained space to the support of each variable,
+    # which do not depend on the data
+    model_trace = handlers.trace(handlers.seed(model, 0)).get_trace(
+        np.ones(1), np.ones(1), np.ones(1))
+    transforms = {name: biject_to(site['fn'].support)
+                  for name, site in model_trace.items()
+                  if site['type'] == 'sample' and not site['is_observed']}
+    names = list(transforms)
+
+    def neg_log_density(x, k, obs, sigma):
+        params = {name: transforms[name](x[i]) for i, name in enumerate(names)}
+        return -log_density(model, (k, obs, sigma), {}, params)[0]
+
+    return names, transforms, jit(value_and_grad(neg_log_density))
+
+
+def _map_estimate(alph, atype, model_args, start):
+    """
+    Return the Maximum a Posteriori (MAP) estimates of the latent variables of
+    the cached model, i.e. the maximum of the posterior density in the space 
+    of the parameters, as obtained with :func:`~pymc3.find_MAP`. The density is
+    evaluated without the Jacobian of the transforms to unconstrained space, 
+    which are only used as a reparameterization of the optimization problem.
+    """
+
+    names, transforms, fun = _get_map_functions(alph, atype)
+
+    def fun_np(x):
+        val, grad = fun(jnp.asarray(x), *model_args)
+        return float(val), np.asarray(grad, dtype=float)
+
+    x0 = np.array([float(transforms[name].inv(start[name])) for name in names])
+    res = minimize(fun_np, x0, jac=True, method='L-BFGS-B')
+
+    return {name: np.asarray(transforms[name](res.x[i]))
+            for i, name in enumerate(names)}
@@ -0,0 +1,213 @@
+# Copyright 2019 Pascal Audet
+#
+# This file is part of PlateFlex.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+This :mod:`~plateflex` module contains the elements of the flexural model 
+that are shared by the probabilistic estimation methods in 
+:mod:`~plateflex.estimate` and :mod:`~plateflex.estimate_numpyro`, 
+independently of the ``theano`` or ``jax`` backends:
+
+- :func:`~plateflex.flexure.real_xspec_functions`: 
+  Build the analytical admittance and coherence functions with any 
+  array module (e.g., :mod:`~theano.tensor` or :mod:`~jax.numpy`).
+- :func:`~plateflex.flexure.flex_params`: 
+  Return the flexural model parameters currently set in ``conf_flex``.
+- :func:`~plateflex.flexure.bayes_summary`: 
+  Summarize posterior samples.
+
+.. rubric:: Earth parameters - fixed
+
+These are the values of the ``PARAMETER`` declarations of module ``conf_flex`` 
+in ``src/flex/flex.f90``, which are not accessible from ``python``. They must
+be kept identical to those.
+
+``g`` : float
+    Gravitational acceleration (9.81 m/s^2)
+``Em`` : float
+    Young's modulus (100 GPa)
+``nu`` : float
+    Poisson's ratio (0.25)
+``Gc`` : float
+    Gravitational constant (6.67e-11*1.e5 mGal)
+
+"""
+
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+from plateflex.flex import conf_flex as cf_f
+
+# Hard coded parameters - must match module ``conf_flex`` in
+# ``src/flex/flex.f90``
+g = 9.81
+Em = 1.e11
+nu = 0.25
+Gc = 6.67e-6
+
+
+def real_xspec_functions(xp, k, Te, F, alpha=np.pi/2., params=None,
+                         output='both'):
+    """
+    Build analytical expressions for the real component of admittance
+    and coherence functions with the array module ``xp``. These are the 
+    same expressions as in :func:`~plateflex.estimate.real_xspec_functions`
+    (including the bound of 1.e4 on the load ratio F/(1-F) as F approaches 1),
+    but are differentiable when ``xp`` is :mod:`~theano.tensor` or
+    :mod:`~jax.numpy` and can be incorporated directly in a ``pymc`` or 
+    ``numpyro`` model.
+
+    :type xp: module
+    :param xp: Array module providing ``exp``, ``cos`` and ``clip`` 
+        (e.g., :mod:`~theano.tensor`, :mod:`~jax.numpy` or :mod:`~numpy`)
+    :type k: :class:`~numpy.ndarray` or tensor
+    :param k: Wavenumbers (rad/m)
+    :type Te: float or tensor
+    :param Te: Effective elastic thickness (km)
+    :type F: float or tensor
+    :param F: Subsurface-to-surface load ratio [0, 1[
+    :type alpha: float or tensor, optional
+    :param alpha: Phase difference between initial applied loads (rad)
+    :type params: dict, optional
+    :param params: Flexural model parameters (``A``, ``rhof``, ``rhoc``, ``rhom``, 
+        ``wd``, ``zc``) as floats or tensors. Defaults to the values
+        currently set in ``conf_flex``
+    :type output: str, optional
+    :param output: Whether to build the admittance (`'admit'`), coherence (`'coh'`)
+        or both (`'both'`) functions
+
+    :return:  
+        (tuple): tuple containing:
+            * admittance : Real admittance function
+            * coherence : Coherence function
+
+        Only one of the two is returned if ``output`` is `'admit'` or `'coh'`.
+
+    """
+
+    # Variable parameters
+    if params is None:
+        params = flex_params()
+    A = params['A']
+    rhof = params['rhof']
+    rhoc = params['rhoc']
+    rhom = params['rhom']
+    wd = params['wd']
+    zc = params['zc']
+
+    # Flexural rigidity (Te in meters)
+    D = Em*(Te*1.e3)**3/12./(1.-nu**2)
+
+    # Isostatic function
+    psi = D*k**4
+
+    # Flexural filters for top and bottom loading
+    theta = -((rhoc-rhof)/(rhom-rhoc))/(1. + psi/(rhom-rhoc)/g)
+    phi = -((rhoc-rhof)/(rhom-rhoc))*(1. + psi/(rhoc-rhof)/g)
+
+    # Deconvolution matrix
+    mu_h = 1./(1.-theta)
+    mu_w = 1./(phi-1.)
+    nu_h = 2.*np.pi*Gc*(A*(rhoc-rhof)*xp.exp(-k*wd) +
+                        (rhom-rhoc)*theta*xp.exp(-k*(zc+wd)))/(1.-theta)
+    nu_w = 2.*np.pi*Gc*(A*(rhoc-rhof)*xp.exp(-k*wd) +
+                        (rhom-rhoc)*phi*xp.exp(-k*(zc+wd)))/(phi-1.)
+
+    # Transfer functions - only the real part of the cross-spectrum is needed.
+    # The load ratio F/(1-F) is bounded by 1.e4 such that it stays finite
+    # in single precision as F approaches 1
+    r = (rhoc-rhof)/(rhom-rhoc)
+    ff = F/xp.clip(1. - F, 1.e-4, 1.)
+    cosa = xp.cos(alpha)
+    hg = nu_h*mu_h + nu_w*mu_w*(ff*r)**2 + (nu_h*mu_w + nu_w*mu_h)*ff*r*cosa
+    hh = mu_h**2 + (mu_w*ff*r)**2 + 2.*mu_h*mu_w*ff*r*cosa
+
+    admittance = hg/hh
+    if output == 'admit':
+        return admittance
+
+    gg = nu_h**2 + (nu_w*ff*r)**2 + 2.*nu_h*nu_w*ff*r*cosa
+
+    coherence = hg**2/(hh*gg)
+    if output == 'coh':
+        return coherence
+
+    return admittance, coherence
+
+
+def flex_params():
+    """
+    Return the flexural model parameters currently set in ``conf_flex``.
+
+    :return:
+        (dict): Values of ``A`` (0. for a Bouguer analysis, 1. otherwise),
+        ``rhof``, ``rhoc``, ``rhom``, ``wd`` and ``zc``
+
+    """
+
+    # Is this a Bouguer analysis?
+    if cf_f.boug == 1:
+        A = 0.
+    else:
+        A = 1.
+
+    # Determine fluid density from water depth variable
+    if cf_f.wd > 0.:
+        rhof = float(cf_f.rhow)
+    else:
+        rhof = float(cf_f.rhoa)
+
+    return {'A': A, 'rhof': rhof, 'rhoc': float(cf_f.rhoc),
+            'rhom': float(cf_f.rhom), 'wd': float(cf_f.wd),
+            'zc': float(cf_f.zc)}
+
+
+def bayes_summary(trace, varnames):
+    """
+    Return the mean, standard deviation and 95% highest posterior density
+    interval of the posterior samples of ``varnames``.
+
+    :type trace: dict or :class:`~pymc3.backends.base.MultiTrace`
+    :param trace: Posterior samples, indexed by variable name
+    :type varnames: list
+    :param varnames: Names of the variables to summarize
+
+    :return:
+        (:class:`~pandas.core.frame.DataFrame`): Summary statistics with 
+        columns ``mean``, ``sd``, ``hpd_2.5`` and ``hpd_97.5``
+
+    """
+
+    data = {'mean': [], 'sd': [], 'hpd_2.5': [], 'hpd_97.5': []}
+
+    for var in varnames:
+        x = np.sort(np.asarray(trace[var]).ravel())
+
+        # Narrowest interval containing 95% of the samples
+        n = len(x)
+        m = int(np.floor(0.95*n))
+        i = np.argmin(x[m:] - x[:n-m])
+
+        data['mean'].append(x.mean())
+        data['sd'].append(x.std())
+        data['hpd_2.5'].append(x[i])
+        data['hpd_97.5'].append(x[i+m])
+
+    return pd.DataFrame(data=data, index=varnames)
@@ -37,7 +37,8 @@ setup(
         'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7'],
-    install_requires=['numpy>=1.15', 'pymc3', 'matplotlib', 'seaborn'],
+    install_requires=['numpy>=1.15', 'pymc3>=3.11', 'matplotlib', 'seaborn',
+                      'threadpoolctl'],
     python_requires='>=3.5',
     tests_require=['pytest'],
     ext_modules=[ext_cpwt, ext_flex],
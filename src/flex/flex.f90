@@ -34,7 +34,7 @@
       IMPLICIT NONE
 
 !
-! Hard coded parameters
+! Hard coded parameters - keep identical to plateflex/flexure.py
 !
       DOUBLE PRECISION, PARAMETER :: pi = 3.141592653589793d0
       DOUBLE PRECISION, PARAMETER :: g = 9.81d0
@@ -78,7 +78,7 @@
       INTEGER :: ns
       DOUBLE PRECISION :: psi(ns), filt(ns)
 
-        filt = -((rhoc-rhof)/(rhom-rhoc))*(1. + psi/(rhom-rhoc)/g)**(-1.)
+        filt = -((rhoc-rhof)/(rhom-rhoc))/(1. + psi/(rhom-rhoc)/g)
 
         RETURN
 
@@ -137,7 +137,9 @@
 ! Subroutine tr_func
 !
 ! Subroutine to calculate the transfer functions (admittance and coherence)
-! from the components of the deconvolution matrix
+! from the components of the deconvolution matrix. Only the real part of 
+! the cross-spectrum enters the real admittance and coherence, so the 
+! calculation is carried out in real arithmetic.
 !---------------------------------------------------------------------------
 
       SUBROUTINE tr_func(ns, mu_h, mu_w, nu_h, nu_w, F, alpha, admit, coh)
@@ -146,26 +148,27 @@
 
       IMPLICIT NONE
 
-      INTEGER :: ns
+      INTEGER :: ns, i
       DOUBLE PRECISION :: mu_h(ns), mu_w(ns), nu_h(ns), nu_w(ns)
-      DOUBLE PRECISION :: r, ff, F, alpha
-      DOUBLE COMPLEX :: hg(ns)
-      DOUBLE PRECISION :: hh(ns), gg(ns)
-      DOUBLE COMPLEX :: admit(ns), cohy(ns)
-      DOUBLE PRECISION :: coh(ns)
-      DOUBLE COMPLEX :: j
-
-        j = DCMPLX(0.,1.)
+      DOUBLE PRECISION :: r, ff, F, alpha, ffr, ffr2, cosa
+      DOUBLE PRECISION :: hg, hh, gg
+      DOUBLE PRECISION :: admit(ns), coh(ns)
+
+        ! Load ratio bounded by 1.e4 as F approaches 1 - keep identical
+        ! to plateflex/flexure.py
         r = (rhoc-rhof)/(rhom-rhoc)
-        ff = F/(1. - F)
-        hg = nu_h*mu_h + nu_w*mu_w*(ff**2)*(r**2.) &
-              + (nu_h*mu_w + nu_w*mu_h)*ff*r*COS(alpha) &
-              + j*(nu_h*mu_w - nu_w*mu_h)*ff*r*SIN(alpha)
-        hh = mu_h**2 + (mu_w*ff*r)**2. + 2.*mu_h*mu_w*ff*r*COS(alpha)
-        gg = nu_h**2 + (nu_w*ff*r)**2. + 2.*nu_h*nu_w*ff*r*COS(alpha)
-        admit = hg/hh
-        cohy = hg/SQRT(hh)/SQRT(gg)
-        coh = REAL(cohy)**2.
+        ff = F/MIN(MAX(1.d0 - F, 1.d-4), 1.d0)
+        ffr = ff*r
+        ffr2 = ffr*ffr
+        cosa = COS(alpha)
+        DO i = 1, ns
+          hg = nu_h(i)*mu_h(i) + nu_w(i)*mu_w(i)*ffr2 &
+                + (nu_h(i)*mu_w(i) + nu_w(i)*mu_h(i))*ffr*cosa
+          hh = mu_h(i)**2 + ffr2*mu_w(i)**2 + 2.*mu_h(i)*mu_w(i)*ffr*cosa
+          gg = nu_h(i)**2 + ffr2*nu_w(i)**2 + 2.*nu_h(i)*nu_w(i)*ffr*cosa
+          admit(i) = hg/hh
+          coh(i) = hg**2/(hh*gg)
+        END DO
   
         RETURN
 
@@ -189,7 +192,6 @@
 
       DOUBLE PRECISION :: A, D, psi(ns), theta(ns), phi(ns)
       DOUBLE PRECISION :: mu_h(ns), mu_w(ns), nu_h(ns), nu_w(ns)
-      DOUBLE COMPLEX :: cadmit(ns)
 
       DOUBLE PRECISION :: admit(ns), coh(ns)
 !
@@ -218,25 +220,65 @@
         Te = Te*1.e3
 
         ! Flexural rigidity
-        D = Em*Te**3/12./(1.-nu**2.)
+        D = Em*Te**3/12./(1.-nu**2)
 
         ! Isostatic function
-        psi = D*k**4.
+        psi = D*k**4
 
         ! Flexural filters
         CALL flexfilter_top(ns, psi, theta)
         CALL flexfilter_bot(ns, psi, phi)
         CALL decon(ns, theta, phi, k, A, mu_h, mu_w, nu_h, nu_w)
 
-        ! Get spectral functions
-        CALL tr_func(ns, mu_h, mu_w, nu_h, nu_w, F, alpha, cadmit, coh)
-
-        ! Get real-valued admittance
-        admit = REAL(cadmit)
+        ! Get real-valued spectral functions
+        CALL tr_func(ns, mu_h, mu_w, nu_h, nu_w, F, alpha, admit, coh)
 
         RETURN
 
       END SUBROUTINE real_xspec_functions
 
+!---------------------------------------------------------------------------
+! Subroutine real_xspec_functions_batch
+!
+! Subroutine to calculate the transfer functions (admittance and coherence)
+! for arrays of input values of Te, F and alpha, sharing the same 
+! wavenumbers
+!---------------------------------------------------------------------------
+
+      SUBROUTINE real_xspec_functions_batch(ns, nt, k, Te, F, alpha, &
+                                            admit, coh)
+
+      USE conf_flex
+
+      IMPLICIT NONE
+
+      INTEGER :: ns, nt, i
+      DOUBLE PRECISION :: k(ns), Te(nt), F(nt), alpha(nt)
+      DOUBLE PRECISION :: Te1, admit1(ns), coh1(ns)
+
+      DOUBLE PRECISION :: admit(nt,ns), coh(nt,ns)
+!
+! Python bindings
+!
+!f2py DOUBLE PRECISION, intent(in) :: k, Te, F, alpha
+!f2py INTEGER, intent(hide),depend(k) :: ns=shape(k,0)
+!f2py INTEGER, intent(hide),depend(Te) :: nt=shape(Te,0)
+!f2py DOUBLE PRECISION, intent(out) :: admit, coh
+
+        DO i = 1, nt
+
+          ! Te is rescaled in place
+          Te1 = Te(i)
+          CALL real_xspec_functions(ns, k, Te1, F(i), alpha(i), &
+                                    admit1, coh1)
+          admit(i,:) = admit1
+          coh(i,:) = coh1
+
+        END DO
+
+        RETURN
+
+      END SUBROUTINE real_xspec_functions_batch
+
     END MODULE flex
 